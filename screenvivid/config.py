@@ -1,2 +1,16 @@
 DEFAULT_PIXELS_PER_FRAME = 6
-DEFAULT_FPS = 24
\ No newline at end of file
+DEFAULT_FPS = 24
+DEFAULT_SKIP_STATIC_FRAMES = False
+DEFAULT_CAPTURE_IN_PROCESS = False
+DEFAULT_CAPTURE_RING_SLOTS = 8
+DEFAULT_CAPTURE_BACKEND = "mss"
+DEFAULT_RECORDER_BUFFER_MB = 512
+DEFAULT_SEGMENT_DURATION = 0
+DEFAULT_VFR_SEGMENT_DURATION = 4
+DEFAULT_INTERMEDIATE_RECORDING = False
+DEFAULT_ADAPTIVE_CAPTURE = False
+DEFAULT_REPLAY_SECONDS = 120
+DEFAULT_REPLAY_SEGMENT_DURATION = 2
+DEFAULT_REPLAY_FPS = 15
+DEFAULT_RENDER_TILES = 1
+DEFAULT_CURSOR_SUBPIXEL = False
\ No newline at end of file
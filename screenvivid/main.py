@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 from pathlib import Path
 
 from PySide6.QtGui import QGuiApplication, QIcon
@@ -70,4 +71,6 @@ def main():
     sys.exit(app.exec())
 
 if __name__ == "__main__":
+    # Required for the spawned capture process in frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
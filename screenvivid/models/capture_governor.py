@@ -0,0 +1,87 @@
+import time
+
+from screenvivid.utils.logging import logger
+
+class CaptureGovernor:
+    """
+    Lower the capture rate under sustained load and restore it once headroom
+    returns.
+
+    Each level grabs only every ``frame_step``-th frame and the frames in
+    between repeat (or, at a variable frame rate, hold) the previous one, so
+    the editor's timeline keeps its frame indices. The encoder preset and the
+    capture size are fixed for the lifetime of the FFmpeg process, so the
+    capture rate is the knob that can be turned while recording.
+
+    At a constant frame rate repeats are still encoded, so a lower capture rate
+    only relieves the capture side: late frames and a filling frame queue. A
+    slow encoder is logged, but does not step the rate down.
+    """
+    FRAME_STEPS = (1, 2, 3, 4)
+
+    def __init__(self, fps, pressure_samples=3, headroom_samples=10):
+        self._fps = fps
+        self._pressure_samples = pressure_samples
+        self._headroom_samples = headroom_samples
+        self._level = 0
+        self._pressure = 0
+        self._headroom = 0
+        self._last_late = 0
+        self._last_encoded = None
+        self._slow_encoder_warned = False
+        self.changes = []
+
+    @property
+    def frame_step(self):
+        return self.FRAME_STEPS[self._level]
+
+    def _get_encoder_rate(self, encoded_frames):
+        """FFmpeg's output frame rate since the previous sample, relative to the nominal fps"""
+        now = time.monotonic()
+        last_encoded, self._last_encoded = self._last_encoded, (encoded_frames, now)
+        # FFmpeg reports no progress until it starts encoding
+        if encoded_frames is None or last_encoded is None or not last_encoded[0]:
+            return None
+        return (encoded_frames - last_encoded[0]) / (now - last_encoded[1]) / self._fps
+
+    def update(self, frame_index, late, queue_fill, encoded_frames=None):
+        """
+        Feed one sample, about once a second: the total count of late (missed
+        deadline) frames, the fill ratio of the frame queue and the number of
+        frames FFmpeg has encoded, None if unknown. Return True if the frame
+        step changed.
+        """
+        late_frames = late - self._last_late
+        self._last_late = late
+        encoder_rate = self._get_encoder_rate(encoded_frames)
+        if encoder_rate is not None and encoder_rate < 0.8 and not self._slow_encoder_warned:
+            logger.warning(f"Capture governor: the encoder runs at {encoder_rate:.0%} of the capture rate")
+            self._slow_encoder_warned = True
+
+        if late_frames > 0 or queue_fill > 0.25:
+            self._pressure += 1
+            self._headroom = 0
+        elif queue_fill < 0.05:
+            self._headroom += 1
+            self._pressure = 0
+        else:
+            self._pressure = 0
+
+        if self._pressure >= self._pressure_samples and self._level < len(self.FRAME_STEPS) - 1:
+            self._level += 1
+            reason = f"late {late_frames}, queue {queue_fill:.0%}"
+        elif self._headroom >= self._headroom_samples and self._level > 0:
+            self._level -= 1
+            reason = "headroom"
+        else:
+            return False
+
+        self._pressure = self._headroom = 0
+        change = {
+            "frame": frame_index,
+            "frame_step": self.frame_step,
+            "fps": round(self._fps / self.frame_step, 2),
+        }
+        self.changes.append(change)
+        logger.info(f"Capture governor: {change['fps']} fps from frame {frame_index} ({reason})")
+        return True
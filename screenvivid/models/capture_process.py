@@ -0,0 +1,257 @@
+import multiprocessing
+from multiprocessing import shared_memory
+from threading import Lock
+
+import numpy as np
+
+from screenvivid.models.screen_capture import capture_frames, get_screen_capture_class, MSSScreenCapture
+from screenvivid.utils.logging import logger
+
+# Header fields of the shared frame ring
+WRITE_INDEX = 0
+READ_INDEX = 1
+CAPTURED = 2
+DROPPED = 3
+LATE = 4
+REPEATED = 5
+CLOSED = 6
+HEADER_FIELDS = 8
+
+PIXEL_FORMATS = ("bgra", "yuv420p", "jpeg", "png")
+
+def get_slot_size(width, height, pixel_format):
+    """Bytes a frame can take, compressed formats are bounded by the bgra size"""
+    if pixel_format == "yuv420p":
+        return width * height + 2 * ((width + 1) // 2) * ((height + 1) // 2)
+    return width * height * 4
+
+class SharedFrameRing:
+    """
+    Single producer, single consumer ring of frames in shared memory.
+
+    The producer only advances the write index and the consumer only advances
+    the read index, so neither side takes a lock. Slots are handed over through
+    a pair of semaphores, free and ready slots, whose release and acquire order
+    the slot bytes before the hand-over on weakly ordered CPUs as well. When
+    the ring is full the new frame is dropped and counted instead of blocking
+    the capture loop.
+    """
+    def __init__(self, slot_size: int, n_slots: int = 8, name: str = None, semaphores=None):
+        self.slot_size = slot_size
+        self.n_slots = n_slots
+
+        header_size = HEADER_FIELDS * 8
+        meta_size = n_slots * 3 * 8
+        times_size = n_slots * 8
+        data_offset = (header_size + meta_size + times_size + 63) // 64 * 64
+        total_size = data_offset + slot_size * n_slots
+
+        self._is_owner = name is None
+        if self._is_owner:
+            self._shm = shared_memory.SharedMemory(create=True, size=total_size)
+        else:
+            # Capture processes are spawned children sharing our resource
+            # tracker, so attaching keeps a single registration of the segment
+            self._shm = shared_memory.SharedMemory(name=name)
+
+        buf = self._shm.buf
+        self._header = np.ndarray((HEADER_FIELDS,), dtype=np.int64, buffer=buf)
+        # frame index, frame size (0 for a repeat marker), pixel format id
+        self._slot_meta = np.ndarray((n_slots, 3), dtype=np.int64, buffer=buf, offset=header_size)
+        self._slot_times = np.ndarray((n_slots,), dtype=np.float64, buffer=buf, offset=header_size + meta_size)
+        self._slots = np.ndarray((n_slots, slot_size), dtype=np.uint8, buffer=buf, offset=data_offset)
+        self._data_offset = data_offset
+
+        if self._is_owner:
+            self._header[:] = 0
+            # Spawned capture processes attach with the same semaphores
+            context = multiprocessing.get_context("spawn")
+            semaphores = (context.Semaphore(n_slots), context.Semaphore(0))
+        self._free_slots, self._ready_slots = semaphores
+        # Frames the consumer acquired from the ready semaphore, counted by
+        # the feeder, the governor and telemetry alike
+        self._published = 0
+        self._published_lock = Lock()
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    @property
+    def semaphores(self):
+        return self._free_slots, self._ready_slots
+
+    @property
+    def closed(self):
+        return bool(self._header[CLOSED])
+
+    @property
+    def stats(self):
+        return {
+            "captured": int(self._header[CAPTURED]),
+            "dropped": int(self._header[DROPPED]),
+            "late": int(self._header[LATE]),
+            "repeated": int(self._header[REPEATED]),
+        }
+
+    # Producer side
+    def write(self, frame, pixel_format, frame_index, frame_time):
+        """
+        Copy a frame into the next free slot. ``frame`` None is a repeat marker.
+        Return False if the frame was dropped.
+        """
+        self._header[CAPTURED] += 1
+        size = 0
+        if frame is not None:
+            size = len(frame)
+            if size > self.slot_size:
+                logger.warning(f"Frame of {size} bytes does not fit a {self.slot_size} bytes slot")
+                self._header[DROPPED] += 1
+                return False
+
+        if not self._free_slots.acquire(False):
+            self._header[DROPPED] += 1
+            return False
+
+        write_index = int(self._header[WRITE_INDEX])
+        slot = write_index % self.n_slots
+        if frame is not None:
+            self._slots[slot, :size] = np.frombuffer(frame, dtype=np.uint8)
+        else:
+            self._header[REPEATED] += 1
+
+        self._slot_meta[slot] = (frame_index, size, PIXEL_FORMATS.index(pixel_format))
+        self._slot_times[slot] = frame_time
+
+        # Publish the slot only once it is complete
+        self._header[WRITE_INDEX] = write_index + 1
+        self._ready_slots.release()
+        return True
+
+    def add_deadline_miss(self):
+        self._header[LATE] += 1
+
+    def close_writer(self):
+        self._header[CLOSED] = 1
+
+    # Consumer side
+    def available(self):
+        with self._published_lock:
+            while self._ready_slots.acquire(False):
+                self._published += 1
+            return self._published - int(self._header[READ_INDEX])
+
+    def wait(self, count: int, timeout: float):
+        """Wait up to ``timeout`` seconds until ``count`` frames are available"""
+        if self.available() >= count:
+            return True
+        if self._ready_slots.acquire(timeout=timeout):
+            with self._published_lock:
+                self._published += 1
+        return self.available() >= count
+
+    def peek(self, offset: int = 0):
+        """
+        Return ``(frame, pixel_format, frame_index, frame_time)`` for the slot
+        ``offset`` places after the read index without copying it. ``frame`` is
+        a memoryview valid until the slot is released, or None for a repeat marker.
+        """
+        slot = (int(self._header[READ_INDEX]) + offset) % self.n_slots
+        frame_index, size, pixel_format_id = (int(value) for value in self._slot_meta[slot])
+        frame = None
+        if size:
+            start = self._data_offset + slot * self.slot_size
+            frame = self._shm.buf[start:start + size]
+        return frame, PIXEL_FORMATS[pixel_format_id], frame_index, float(self._slot_times[slot])
+
+    def release(self, count: int = 1):
+        self._header[READ_INDEX] += count
+        for _ in range(count):
+            self._free_slots.release()
+
+    def close(self):
+        # Drop numpy views first, the buffer can't be closed while exported
+        self._header = self._slot_meta = self._slot_times = self._slots = None
+        try:
+            if self._is_owner:
+                self._shm.unlink()
+            self._shm.close()
+        except Exception as e:
+            logger.warning(f"Failed to release shared frame ring: {e}")
+
+def _run_capture_process(
+    ring_name, slot_size, n_slots, semaphores, region, fps, skip_static_frames, is_started, is_stopped, frame_step
+):
+    ring = SharedFrameRing(slot_size, n_slots, name=ring_name, semaphores=semaphores)
+    try:
+        capture_frames(
+            region, fps, is_stopped, ring.write,
+            skip_static_frames=skip_static_frames,
+            on_deadline_miss=ring.add_deadline_miss,
+            frame_step=lambda: frame_step.value,
+            is_started=is_started,
+        )
+    except Exception as e:
+        logger.error(f"Capture process error: {e}")
+    finally:
+        ring.close_writer()
+        ring.close()
+
+class CaptureProcess:
+    """
+    Run the capture loop in a dedicated process so that grabbing frames does not
+    compete with the GUI, mouse tracking and FFmpeg writer threads for the GIL.
+    Frames are handed over through a SharedFrameRing.
+    """
+    def __init__(self, region, fps, skip_static_frames=False, n_slots=8):
+        # capture_frames grabs yuv420p with MSS, JPEG otherwise
+        width, height = int(region[2]), int(region[3])
+        pixel_format = "yuv420p" if get_screen_capture_class() is MSSScreenCapture else "jpeg"
+        self.ring = SharedFrameRing(get_slot_size(width, height, pixel_format), n_slots)
+
+        # Never fork the Qt process
+        context = multiprocessing.get_context("spawn")
+        self._is_started = context.Event()
+        self._is_stopped = context.Event()
+        self._frame_step = context.Value("i", 1, lock=False)
+        self._process = context.Process(
+            target=_run_capture_process,
+            args=(
+                self.ring.name, self.ring.slot_size, self.ring.n_slots, self.ring.semaphores,
+                list(region), fps, skip_static_frames,
+                self._is_started, self._is_stopped, self._frame_step
+            ),
+            name="ScreenVividCapture",
+            daemon=True,
+        )
+
+    def start(self):
+        """Spawn the process and open the capture backend, see start_capture"""
+        self._process.start()
+
+    def start_capture(self):
+        self._is_started.set()
+
+    def stop(self):
+        self._is_stopped.set()
+
+    def set_frame_step(self, step):
+        """Grab only every ``step``-th frame, see capture_frames"""
+        self._frame_step.value = step
+
+    def is_alive(self):
+        return self._process.is_alive()
+
+    def join(self, timeout=None):
+        self._process.join(timeout)
+        if self._process.is_alive():
+            logger.warning("Capture process did not exit in time, terminating it")
+            self._process.terminate()
+            self._process.join()
+
+    @property
+    def stats(self):
+        return self.ring.stats
+
+    def close(self):
+        self.ring.close()
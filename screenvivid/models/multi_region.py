@@ -0,0 +1,125 @@
+import os
+import subprocess
+from collections import deque
+from threading import Thread
+
+import cv2
+import numpy as np
+
+from screenvivid.utils.general import get_os_name
+from screenvivid.utils.logging import logger
+
+def get_bounding_region(regions):
+    """
+    Return the [left, top, width, height] rectangle covering all regions,
+    widened to even dimensions so the screen capture keeps every column.
+    """
+    left = min(region[0] for region in regions)
+    top = min(region[1] for region in regions)
+    width = max(region[0] + region[2] for region in regions) - left
+    height = max(region[1] + region[3] for region in regions) - top
+    if width & 1:
+        left, width = (left - 1, width + 1) if left > 0 else (left, width + 1)
+    if height & 1:
+        top, height = (top - 1, height + 1) if top > 0 else (top, height + 1)
+    return [left, top, width, height]
+
+def frame_from_bytes(image_bytes, bounds):
+    """View bgra bytes grabbed at ``bounds`` as an image, without copying"""
+    return np.frombuffer(image_bytes, dtype=np.uint8).reshape(bounds[3], bounds[2], 4)
+
+def slice_region(frame, bounds, region):
+    """Return ``region`` of a bgra ``frame`` grabbed at ``bounds`` as a view, without copying"""
+    left, top = region[0] - bounds[0], region[1] - bounds[1]
+    return frame[top:top + region[3], left:left + region[2]]
+
+def remap_mouse_events(mouse_events, from_region, to_region):
+    """
+    Convert a mouse timeline relative to ``from_region`` into one relative to
+    ``to_region``. Both hold the same cursor samples, so this is exact.
+    """
+    def remap(x, y):
+        absolute_x = from_region[0] + x * from_region[2]
+        absolute_y = from_region[1] + y * from_region[3]
+        return (absolute_x - to_region[0]) / to_region[2], (absolute_y - to_region[1]) / to_region[3]
+
+    move = {}
+    for frame_index, (x, y, *rest) in dict(mouse_events["move"]).items():
+        move[frame_index] = (*remap(x, y), *rest)
+
+    click = []
+    for event in list(mouse_events["click"]):
+        x, y = remap(event["x"], event["y"])
+        click.append(dict(event, x=x, y=y))
+
+    return {
+        "move": move,
+        "click": click,
+        "cursors_map": mouse_events["cursors_map"],
+        "sprites": mouse_events.get("sprites", {}),
+    }
+
+class RegionEncoder:
+    """
+    An additional region of a multi-region recording: the FFmpeg process
+    encoding it to its own video and, once recorded, its mouse timeline.
+    """
+    def __init__(self, region, output_path):
+        self.region = region
+        self.output_path = output_path
+        self.mouse_events = None
+        self._process = None
+        self._log = deque(maxlen=20)
+        self._log_thread = None
+
+    def start(self, cmd):
+        logger.info(f"FFmpeg command ({self.region}): {cmd}")
+        kwargs = {}
+        if get_os_name() == "windows":
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            kwargs = {"creationflags": subprocess.CREATE_NO_WINDOW, "startupinfo": startupinfo}
+        self._process = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            bufsize=50*1024*1024,
+            **kwargs
+        )
+        self._log_thread = Thread(target=self._read_log, daemon=True)
+        self._log_thread.start()
+
+    def _read_log(self):
+        for line in self._process.stderr:
+            self._log.append(line.decode(errors="ignore").strip())
+
+    def write(self, frame, bounds):
+        """Convert the region of a bgra frame to yuv420p and feed it to FFmpeg, return the bytes written"""
+        if self._process.poll() is not None:
+            return 0
+        yuv = cv2.cvtColor(slice_region(frame, bounds, self.region), cv2.COLOR_BGRA2YUV_I420)
+        self._process.stdin.write(yuv)
+        self._process.stdin.flush()
+        return yuv.nbytes
+
+    def close(self):
+        if self._process is None:
+            return
+        if self._process.poll() is None:
+            try:
+                self._process.stdin.write(b"q")
+                self._process.stdin.close()
+            except OSError:
+                pass
+            self._process.wait()
+        if self._log_thread:
+            self._log_thread.join(timeout=5)
+        if self._process.returncode:
+            logger.error(f"FFmpeg exited with code {self._process.returncode}: {list(self._log)}")
+        self._process = None
+
+    @staticmethod
+    def get_output_path(output_path, index, extension):
+        root, _ = os.path.splitext(output_path)
+        return f"{root}_region{index}.{extension}"
@@ -0,0 +1,272 @@
+import os
+import zlib
+import queue
+import tempfile
+import threading
+from collections import deque
+
+from screenvivid.utils.logging import logger
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+# Returned by FrameBuffer.get in place of a frame that had to be dropped
+REPEAT_FRAME = object()
+
+RAW = 0
+COMPRESSED = 1
+SPILLED = 2
+DROPPED = 3
+REPEATED = 4
+
+def compress(data):
+    if lz4_frame is not None:
+        return lz4_frame.compress(data, compression_level=0)
+    return zlib.compress(data, 1)
+
+def decompress(data):
+    if lz4_frame is not None:
+        return lz4_frame.decompress(data)
+    return zlib.decompress(data)
+
+class SpillFile:
+    def __init__(self):
+        fd, self.path = tempfile.mkstemp(prefix="screenvivid_spill_", suffix=".bin")
+        self._writer = os.fdopen(fd, "wb")
+        self._reader = open(self.path, "rb")
+        self.size = 0
+        # Frames written or being written and not read yet
+        self.pending = 0
+
+    def write(self, data):
+        offset = self.size
+        self._writer.write(data)
+        self._writer.flush()
+        self.size += len(data)
+        return offset
+
+    def read(self, offset, length):
+        self._reader.seek(offset)
+        return self._reader.read(length)
+
+    def close(self):
+        self._writer.close()
+        self._reader.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            logger.warning(f"Failed to remove {self.path}")
+
+class FrameBuffer:
+    """
+    FIFO of captured frames between the capture and FFmpeg writer threads,
+    bounded by a RAM budget instead of a frame count. ``put`` only appends a
+    reference, so it never blocks the capture loop on compression or disk.
+
+    Frames are kept raw while they fit in half of the budget. When the writer
+    falls behind, a background worker compresses the newest raw frames, which
+    the writer needs last. They stay in memory while compressed frames fit in a
+    quarter of the budget and are spilled to a ring of temporary files
+    otherwise. The last quarter absorbs bursts while the worker catches up.
+    Frames that don't fit in the budget are dropped and handed out as
+    REPEAT_FRAME, so the writer can repeat the previous frame and keep the
+    video aligned with the frame indices.
+    """
+    def __init__(self, ram_budget_mb=512, disk_budget_mb=4096, spill_file_mb=256):
+        self._ram_budget = ram_budget_mb * 1024 * 1024
+        self._disk_budget = disk_budget_mb * 1024 * 1024
+        self._spill_file_size = spill_file_mb * 1024 * 1024
+
+        # Entries are [kind, data, frame_time, size] lists the worker updates in place
+        self._entries = deque()
+        self._condition = threading.Condition()
+        self._raw_bytes = 0
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._spill_files = deque()
+        self._compactor = None
+        self._closed = False
+
+        self._stats = {
+            "frames": 0,
+            "compressed": 0,
+            "spilled": 0,
+            "dropped": 0,
+            "repeated": 0,
+            "peak_frames": 0,
+            "peak_memory_bytes": 0,
+            "peak_disk_bytes": 0,
+        }
+
+    @property
+    def stats(self):
+        with self._condition:
+            stats = dict(self._stats)
+            stats.update({
+                "occupancy": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_bytes,
+            })
+        return stats
+
+    def qsize(self):
+        with self._condition:
+            return len(self._entries)
+
+    def _append(self, entry):
+        """Queue an entry and wake the writer, call with the lock held"""
+        self._entries.append(entry)
+        self._stats["peak_frames"] = max(self._stats["peak_frames"], len(self._entries))
+        self._stats["peak_memory_bytes"] = max(self._stats["peak_memory_bytes"], self._memory_bytes)
+        self._condition.notify_all()
+
+    def put(self, frame, frame_time):
+        """Add a frame, or the (None, None) stop signal, without ever blocking"""
+        with self._condition:
+            if frame is None:
+                self._append([RAW, None, frame_time, 0])
+                return
+
+            self._stats["frames"] += 1
+            size = len(frame)
+            if self._memory_bytes + size > self._ram_budget:
+                self._stats["dropped"] += 1
+                self._append([DROPPED, None, frame_time, 0])
+                return
+
+            self._raw_bytes += size
+            self._memory_bytes += size
+            self._append([RAW, frame, frame_time, size])
+            if self._raw_bytes > self._ram_budget // 2 and self._compactor is None:
+                self._compactor = threading.Thread(target=self._compact, name="FrameBufferCompactor", daemon=True)
+                self._compactor.start()
+
+    def repeat(self, frame_time):
+        """Ask the writer to repeat the previous frame, e.g. for a frame that was not grabbed"""
+        with self._condition:
+            self._stats["repeated"] += 1
+            self._append([REPEATED, None, frame_time, 0])
+
+    def _get_newest_raw_entry(self):
+        for entry in reversed(self._entries):
+            if entry[0] == RAW and entry[1] is not None:
+                return entry
+        return None
+
+    def _compact(self):
+        """Worker: compress (and spill) the newest raw frames while they exceed half of the budget"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or (
+                        self._raw_bytes > self._ram_budget // 2 and self._get_newest_raw_entry() is not None
+                    )
+                )
+                if self._closed:
+                    return
+                entry = self._get_newest_raw_entry()
+                frame = entry[1]
+
+            data = compress(frame)
+            with self._condition:
+                compressed_bytes = self._memory_bytes - self._raw_bytes
+                spill = (
+                    compressed_bytes + len(data) > self._ram_budget // 4
+                    and self._disk_bytes + len(data) <= self._disk_budget
+                )
+            location = None
+            if spill:
+                try:
+                    location = self._spill(data)
+                except OSError as e:
+                    logger.warning(f"Failed to spill frame to disk: {e}")
+
+            with self._condition:
+                if entry[0] != RAW:
+                    # The writer took the frame meanwhile
+                    if location is not None:
+                        self._release_spilled(location[0])
+                    continue
+
+                self._raw_bytes -= entry[3]
+                self._memory_bytes -= entry[3]
+                if location is not None:
+                    entry[:] = [SPILLED, location, entry[2], len(data)]
+                    self._disk_bytes += len(data)
+                    self._stats["spilled"] += 1
+                    self._stats["peak_disk_bytes"] = max(self._stats["peak_disk_bytes"], self._disk_bytes)
+                else:
+                    entry[:] = [COMPRESSED, data, entry[2], len(data)]
+                    self._memory_bytes += len(data)
+                    self._stats["compressed"] += 1
+
+    def _spill(self, data):
+        """Write compressed frame data to the current spill file, the write itself without the lock"""
+        with self._condition:
+            spill_file = self._spill_files[-1] if self._spill_files else None
+            if spill_file is None or spill_file.size + len(data) > self._spill_file_size:
+                spill_file = SpillFile()
+                self._spill_files.append(spill_file)
+            # Keep the file open until the frame is read
+            spill_file.pending += 1
+        try:
+            offset = spill_file.write(data)
+        except OSError:
+            with self._condition:
+                self._release_spilled(spill_file)
+            raise
+        return spill_file, offset
+
+    def _release_spilled(self, spill_file):
+        """Forget a spilled frame, call with the lock held"""
+        spill_file.pending -= 1
+        # Every file but the one being written is done once fully read
+        while len(self._spill_files) > 1 and self._spill_files[0].pending == 0:
+            self._spill_files.popleft().close()
+
+    def get(self, timeout=None):
+        """
+        Return the oldest ``(frame, frame_time)``. ``frame`` is REPEAT_FRAME for
+        a dropped or repeated frame. Raise queue.Empty if nothing arrives within ``timeout``.
+        """
+        with self._condition:
+            if not self._entries and not self._condition.wait_for(lambda: self._entries, timeout):
+                raise queue.Empty
+            entry = self._entries.popleft()
+            kind, data, frame_time, size = entry
+            # Tell the worker in case it is compressing this frame
+            entry[0] = None
+
+            if kind == RAW:
+                self._raw_bytes -= size
+                self._memory_bytes -= size
+                return data, frame_time
+            if kind == COMPRESSED:
+                self._memory_bytes -= size
+            elif kind == SPILLED:
+                self._disk_bytes -= size
+            else:
+                return REPEAT_FRAME, frame_time
+
+        if kind == SPILLED:
+            spill_file, offset = data
+            data = spill_file.read(offset, size)
+            with self._condition:
+                self._release_spilled(spill_file)
+        return decompress(data), frame_time
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._compactor is not None:
+            self._compactor.join()
+            self._compactor = None
+
+        with self._condition:
+            self._entries.clear()
+            self._raw_bytes = self._memory_bytes = self._disk_bytes = 0
+            while self._spill_files:
+                self._spill_files.popleft().close()
@@ -0,0 +1,169 @@
+import os
+import re
+import glob
+import shutil
+from threading import Lock
+
+import cv2
+
+from screenvivid.models.utils.segments import (
+    SEGMENT_MANIFEST_NAME, get_segments_dir, read_segment_manifest
+)
+from screenvivid.utils.general import safe_delete
+from screenvivid.utils.logging import logger
+
+SEGMENT_NUMBER_PATTERN = re.compile(r"segment_(\d+)\.")
+
+def get_segment_number(segment_path):
+    match = SEGMENT_NUMBER_PATTERN.search(os.path.basename(segment_path))
+    return int(match.group(1)) if match else None
+
+class SegmentFrames:
+    """
+    The frames each segment of a rolling recording holds. The muxer only cuts
+    at a keyframe, so segments are about, not exactly, ``segment_duration``
+    long: the frames of every complete segment are counted, in order, as soon
+    as it appears in the manifest.
+    """
+    def __init__(self, manifest_path, segment_duration, fps):
+        self._manifest_path = manifest_path
+        self._segment_duration = segment_duration
+        self._fps = fps
+        self._segments = {}  # segment number -> (first frame, frame count)
+        self._next_number = 0
+        self._next_frame = 0
+        self._lock = Lock()
+
+    def update(self):
+        """
+        Count the frames of the segments completed since the last update.
+        Return ``(path, first frame, frame count)`` of the listed segments.
+        """
+        segments = read_segment_manifest(self._manifest_path)
+        if not segments:
+            return []
+
+        last_number = get_segment_number(segments[-1])
+        segments_dir = os.path.dirname(self._manifest_path)
+        with self._lock:
+            # Segments are counted before they are pruned, even if they left the manifest meanwhile
+            while self._next_number <= last_number:
+                paths = glob.glob(os.path.join(segments_dir, f"segment_{self._next_number:05d}.*"))
+                frame_count = self._count_frames(paths[0]) if paths else None
+                if frame_count is None:
+                    frame_count = round(self._segment_duration * self._fps)
+                    logger.warning(f"Assuming segment {self._next_number} holds {frame_count} frames")
+                self._segments[self._next_number] = (self._next_frame, frame_count)
+                self._next_number += 1
+                self._next_frame += frame_count
+
+            first_number = get_segment_number(segments[0])
+            for number in [number for number in self._segments if number < first_number]:
+                del self._segments[number]
+            return [(path, *self._segments[get_segment_number(path)]) for path in segments]
+
+    @staticmethod
+    def _count_frames(segment_path):
+        capture = cv2.VideoCapture(segment_path)
+        if not capture.isOpened():
+            return None
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        capture.release()
+        return frame_count
+
+def shift_mouse_events(mouse_events, first_frame, last_frame=None):
+    """
+    Return the mouse events between two frames, re-indexed from ``first_frame``.
+    Hold the lock of the mouse events while the mouse thread is recording.
+    """
+    move = {}
+    for frame_index, event in mouse_events["move"].items():
+        if frame_index >= first_frame and (last_frame is None or frame_index < last_frame):
+            x, y, _, *rest = event
+            move[frame_index - first_frame] = (x, y, frame_index - first_frame, *rest)
+
+    click = []
+    for event in mouse_events["click"]:
+        if event["frame"] >= first_frame and (last_frame is None or event["frame"] < last_frame):
+            click.append(dict(event, frame=event["frame"] - first_frame))
+
+    return {
+        "move": move,
+        "click": click,
+        "cursors_map": dict(mouse_events["cursors_map"]),
+        "sprites": dict(mouse_events.get("sprites", {})),
+    }
+
+def prune_replay_buffer(manifest_path, segment_frames, mouse_events, mouse_events_lock):
+    """
+    Delete the segments FFmpeg dropped from the manifest of a rolling
+    recording, along with their mouse events.
+    """
+    segments = segment_frames.update()
+    if not segments:
+        return
+
+    first_number = get_segment_number(segments[0][0])
+    for segment_path in glob.glob(os.path.join(os.path.dirname(manifest_path), "segment_*")):
+        number = get_segment_number(segment_path)
+        if number is not None and number < first_number:
+            safe_delete(segment_path)
+
+    _, first_frame, _ = segments[0]
+    with mouse_events_lock:
+        mouse_events["move"] = {
+            frame_index: event for frame_index, event in mouse_events["move"].items() if frame_index >= first_frame
+        }
+        mouse_events["click"] = [event for event in mouse_events["click"] if event["frame"] >= first_frame]
+
+def save_replay(manifest_path, output_path, seconds, fps, segment_frames, mouse_events, mouse_events_lock):
+    """
+    Save the last ``seconds`` of a rolling recording as a segmented recording
+    for ``output_path``, i.e. the complete segments covering them. Segments are
+    hard linked when possible. Return the new manifest path and mouse events.
+    """
+    segments = segment_frames.update()
+    if not segments:
+        raise ValueError("The replay buffer holds no complete segment yet")
+
+    # Newest segments first, until they cover the requested frames
+    frames, n_segments = 0, 0
+    for _, _, frame_count in reversed(segments):
+        if n_segments and frames >= seconds * fps:
+            break
+        frames += frame_count
+        n_segments += 1
+    segments = segments[-n_segments:]
+
+    segments_dir = get_segments_dir(output_path)
+    os.makedirs(segments_dir, exist_ok=True)
+    saved = []
+    for segment_path, _, _ in segments:
+        name = f"segment_{len(saved):05d}{os.path.splitext(segment_path)[1]}"
+        try:
+            try:
+                os.link(segment_path, os.path.join(segments_dir, name))
+            except OSError:
+                shutil.copyfile(segment_path, os.path.join(segments_dir, name))
+        except FileNotFoundError:
+            # Pruned meanwhile, it was the oldest
+            if saved:
+                raise
+            segments = segments[1:]
+            continue
+        saved.append(name)
+
+    if not saved:
+        raise ValueError("The replay buffer holds no complete segment yet")
+
+    new_manifest_path = os.path.join(segments_dir, SEGMENT_MANIFEST_NAME)
+    with open(new_manifest_path, "w") as f:
+        f.write("ffconcat version 1.0\n")
+        for name in saved:
+            f.write(f"file {name}\n")
+
+    _, first_frame, _ = segments[0]
+    _, last_first_frame, last_frame_count = segments[-1]
+    logger.info(f"Saved {len(saved)} replay segments from frame {first_frame} to {new_manifest_path}")
+    with mouse_events_lock:
+        return new_manifest_path, shift_mouse_events(mouse_events, first_frame, last_first_frame + last_frame_count)
@@ -1,6 +1,26 @@
+import os
+import time
+
+import cv2
+import numpy as np
+
 from screenvivid.utils.general import get_os_name
+from screenvivid.utils.logging import logger
+
+CAPTURE_BACKENDS = ("mss", "x11grab")
+
+def align_region(region):
+    """
+    Round the region size down to even dimensions, as required by yuv420p, so
+    that frames can be encoded without a scaling pass.
+    """
+    left, top, width, height = map(int, region)
+    return [left, top, width & ~1, height & ~1]
 
 class BaseScreenCapture:
+    # Backends grabbing frames in Python, see X11GrabScreenCapture for the other kind
+    is_ffmpeg_native = False
+
     def __init__(self, region=None):
         self._region = region
 
@@ -31,32 +51,38 @@ class BaseScreenCapture:
         pass
 
 class MSSScreenCapture(BaseScreenCapture):
-    def __init__(self, region=None):
+    def __init__(self, region=None, pixel_format="yuv420p"):
         super().__init__(region)
         import mss
         self._sct = mss.mss()
+        self._pixel_format = pixel_format
         self._region = self._get_mss_region(region)
 
     def _get_mss_region(self, region):
         """
         Get the monitor (screen) details based on the region.
-        If region is None, capture the entire screen. Otherwise, capture the specified region.
+        If region is None, capture the primary monitor. Otherwise, capture the specified region.
         """
         if region:
-            region = list(map(int, region))
-            return {"top": region[1], "left": region[0], "width": region[2], "height": region[3]}
+            region = align_region(region)
         else:
-            return self._sct.monitors[0]
+            # monitors[0] is the whole virtual desktop, i.e. every monitor at once
+            monitor = self._sct.monitors[1] if len(self._sct.monitors) > 1 else self._sct.monitors[0]
+            region = align_region([monitor["left"], monitor["top"], monitor["width"], monitor["height"]])
+        return {"top": region[1], "left": region[0], "width": region[2], "height": region[3]}
 
     def capture(self):
         """
         Capture the screen or a specified region using mss.
-        :return: Raw image bytes in RGB format.
+        :return: Raw image bytes, planar yuv420p (1.5 bytes per pixel) by default
+          so that FFmpeg receives encoder ready frames, otherwise bgra.
         """
         screenshot = self._sct.grab(self._region)
-        bgra = screenshot.bgra
+        if self._pixel_format == "yuv420p":
+            bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
+            return cv2.cvtColor(bgra, cv2.COLOR_BGRA2YUV_I420).tobytes(), "yuv420p"
 
-        return bgra, "bgra"
+        return screenshot.bgra, "bgra"
 
     def cleanup(self):
         """
@@ -97,11 +123,219 @@ class QuartzScreenCapture(BaseScreenCapture):
             return bytes(data), "jpeg"
 
 
-def get_screen_capture_class(region=None):
+class X11GrabScreenCapture:
+    """
+    Let FFmpeg grab the screen itself with x11grab, so pixels never pass
+    through Python. It has no ``capture`` method and is not a BaseScreenCapture:
+    the recorder only builds the FFmpeg input arguments from it.
+    """
+    is_ffmpeg_native = True
+
+    def __init__(self, region):
+        self._region = align_region(region)
+
+    def ffmpeg_input_args(self, fps):
+        """
+        Return the FFmpeg input arguments grabbing the region without the cursor,
+        which the editor draws from the recorded mouse timeline.
+        """
+        display = os.environ.get("DISPLAY", ":0")
+        left, top, width, height = self._region
+        return [
+            "-f", "x11grab",
+            "-framerate", str(fps),
+            "-video_size", f"{width}x{height}",
+            "-draw_mouse", "0",
+            "-i", f"{display}+{left},{top}",
+        ]
+
+class XDamageTracker:
+    """
+    Track X11 damage (changed screen areas) for a region using the XDamage extension.
+    """
+    def __init__(self, region):
+        from Xlib import display
+        from Xlib.ext import damage
+
+        self._region = region
+        self._display = display.Display()
+        if not self._display.has_extension("DAMAGE"):
+            self._display.close()
+            raise RuntimeError("DAMAGE extension not supported.")
+
+        self._display.damage_query_version()
+        root = self._display.screen().root
+        self._damage = root.damage_create(damage.DamageReportBoundingBox)
+        self._notify_code = self._display.extension_event.DamageNotify
+        self._display.flush()
+
+    def _intersects(self, area):
+        left, top = self._region["left"], self._region["top"]
+        right, bottom = left + self._region["width"], top + self._region["height"]
+        return (
+            area.x < right and area.x + area.width > left
+            and area.y < bottom and area.y + area.height > top
+        )
+
+    def has_damage(self):
+        """
+        Drain pending damage notifications and report whether the region changed
+        since the previous call.
+        """
+        damaged = False
+        notified = False
+        while self._display.pending_events():
+            event = self._display.next_event()
+            if event.type != self._notify_code:
+                continue
+            notified = True
+            if self._intersects(event.area):
+                damaged = True
+
+        if notified:
+            # Reset the damage so the next change produces a new notification
+            self._display.damage_subtract(self._damage)
+            self._display.flush()
+        return damaged
+
+    def close(self):
+        try:
+            self._display.damage_destroy(self._damage)
+            self._display.close()
+        except Exception:
+            pass
+
+class DamageAwareScreenCapture(BaseScreenCapture):
     """
-    Factory method to return the appropriate ScreenCapture class based on OS.
+    Wrap a screen capture and report frames identical to the previous grab as
+    repeat markers, i.e. ``capture`` returns ``(None, pixel_format)``.
+
+    On X11 the XDamage extension is used to skip the grab entirely while the
+    region is untouched. Otherwise (and to confirm damage) the new grab is
+    compared byte for byte against the previous one, which is a plain memcmp.
+    """
+    def __init__(self, screen_capture):
+        super().__init__(screen_capture._region)
+        self._screen_capture = screen_capture
+        self._last_frame = None
+        self._pixel_format = None
+        self._damage_tracker = None
+        self.repeated_frames = 0
+
+        if get_os_name() == "linux" and isinstance(screen_capture, MSSScreenCapture):
+            try:
+                self._damage_tracker = XDamageTracker(screen_capture._region)
+            except Exception as e:
+                logger.warning(f"XDamage unavailable, comparing frames instead: {e}")
+
+    def capture(self):
+        if (
+            self._last_frame is not None
+            and self._damage_tracker is not None
+            and not self._damage_tracker.has_damage()
+        ):
+            self.repeated_frames += 1
+            return None, self._pixel_format
+
+        frame, pixel_format = self._screen_capture.capture()
+        if frame == self._last_frame:
+            self.repeated_frames += 1
+            return None, pixel_format
+
+        self._last_frame = frame
+        self._pixel_format = pixel_format
+        return frame, pixel_format
+
+    def cleanup(self):
+        if self._damage_tracker is not None:
+            self._damage_tracker.close()
+        self._screen_capture.cleanup()
+
+
+def get_screen_capture_class(region=None, backend=None):
     """
+    Factory method to return the appropriate ScreenCapture class based on OS
+    and the requested backend.
+    """
+    if backend == "x11grab":
+        if get_os_name() == "linux":
+            return X11GrabScreenCapture
+        logger.warning("x11grab is only available on Linux, using the default backend")
+
     if get_os_name() == "macos":  # macOS
         return QuartzScreenCapture
     else:  # Linux, Windows
-        return MSSScreenCapture
\ No newline at end of file
+        return MSSScreenCapture
+
+def capture_frames(
+    region, fps, is_stopped, on_frame,
+    skip_static_frames=False, on_deadline_miss=None, frame_step=None, is_started=None,
+    pixel_format=None
+):
+    """
+    Grab the region at a fixed rate until ``is_stopped`` is set.
+
+    ``on_frame(frame, pixel_format, frame_index, frame_time)`` is called for
+    every tick. ``frame`` is None for a static frame when ``skip_static_frames``
+    is enabled; frame indices then follow the clock and the caller repeats or
+    holds the previous frame in its place, as well as for any index that was
+    skipped.
+    ``on_deadline_miss()`` is called whenever the loop falls more than one
+    interval behind and has to skip ahead. ``frame_step()``, if given, returns
+    how many intervals to advance after each grab, so that only every n-th
+    frame is grabbed; frame indices skip the frames in between. If
+    ``is_started`` is given, the capture backend is opened right away but the
+    first frame is only grabbed once it is set. ``pixel_format`` overrides the
+    pixel format of the MSS backend.
+    """
+    target_interval = 1.0 / fps
+
+    screen_capture_class = get_screen_capture_class()
+    if pixel_format and screen_capture_class is MSSScreenCapture:
+        screen_capture = screen_capture_class(region, pixel_format=pixel_format)
+    else:
+        screen_capture = screen_capture_class(region)
+    if skip_static_frames:
+        screen_capture = DamageAwareScreenCapture(screen_capture)
+
+    capture_start_time = None
+    frame_index = 0
+    with screen_capture as sct:
+        if is_started is not None:
+            while not is_started.wait(0.01):
+                if is_stopped.is_set():
+                    return
+
+        next_frame_time = time.time()
+        while not is_stopped.is_set():
+            current_time = time.time()
+
+            # Wait for the exact time to capture the next frame
+            if current_time < next_frame_time:
+                time.sleep(max(0, next_frame_time - current_time))
+                continue
+
+            frame, pixel_format = sct.capture()
+            frame_time = time.time()
+            if capture_start_time is None:
+                capture_start_time = frame_time
+
+            if skip_static_frames:
+                # Never reuse an index, each one is a frame of the video
+                frame_index = max(frame_index, int(round((frame_time - capture_start_time) * fps)))
+
+            on_frame(frame, pixel_format, frame_index, frame_time)
+            step = frame_step() if frame_step is not None else 1
+            frame_index += step
+
+            # Compute the time to capture the next frame
+            next_frame_time += target_interval * step
+
+            # Reset if lagging too much
+            if time.time() > next_frame_time + target_interval:
+                next_frame_time = time.time() + target_interval
+                if on_deadline_miss is not None:
+                    on_deadline_miss()
+
+        if skip_static_frames:
+            logger.debug(f"Skipped {sct.repeated_frames} static frames")
@@ -1,42 +1,112 @@
 import os
 import io
+import re
+import math
 import time
+import shutil
+import tempfile
 import queue
 import subprocess
-from threading import Thread, Event
+from collections import deque
+from threading import Thread, Event, Lock
 
+import cv2
 from PIL import Image
 import pyautogui
-from PySide6.QtCore import QObject, Property, Slot, Signal
+from PySide6.QtCore import QObject, Property, Slot, Signal, QTimer
 
 from screenvivid import config
-from screenvivid.models.utils.cursor import get_cursor_state, CursorLoaderThread
-from screenvivid.models.screen_capture import get_screen_capture_class
+from screenvivid.models.utils.cursor import get_cursor_state, CursorLoaderThread, CursorSpriteTracker
+from screenvivid.models.screen_capture import capture_frames, get_screen_capture_class, align_region
+from screenvivid.models.capture_process import CaptureProcess
+from screenvivid.models.capture_governor import CaptureGovernor
+from screenvivid.models.recorder_buffer import FrameBuffer, REPEAT_FRAME
+from screenvivid.models.transcoder import (
+    TranscodeThread, INTERMEDIATE_CODEC_ARGS, INTERMEDIATE_EXTENSION, INTERMEDIATE_SEGMENT_FORMAT
+)
+from screenvivid.models.multi_region import (
+    RegionEncoder, get_bounding_region, frame_from_bytes, slice_region, remap_mouse_events
+)
+from screenvivid.models.replay_buffer import SegmentFrames, prune_replay_buffer, save_replay
+from screenvivid.models.utils.matroska import MatroskaFrameStream
+from screenvivid.models.utils.monitors import (
+    get_screens, find_screen, map_to_physical, map_region_to_physical, get_physical_geometry
+)
+from screenvivid.models.utils.segments import (
+    SEGMENT_PATTERN, get_segments_dir, get_segment_manifest_path, delete_recording,
+    is_segment_manifest, read_segment_manifest
+)
 from screenvivid.utils.general import (
     generate_video_path, get_os_name, get_ffmpeg_path,
     generate_temp_file, safe_delete
 )
 from screenvivid.utils.logging import logger
 
+FFMPEG_START_PATTERN = re.compile(r"start: (-?\d+\.\d+)")
+FFMPEG_PROGRESS_PATTERN = re.compile(r"frame=\s*(\d+)\s+fps=\s*([\d.]+).*?speed=\s*([\d.]+|N/A)")
+FFMPEG_SIZE_PATTERN = re.compile(r"size=\s*(\d+)\s*(?:kB|KiB)")
+
+# Interval of the throttled telemetryChanged signal
+TELEMETRY_INTERVAL_MS = 1000
+
+# Interval at which a finalizing recording is checked for its first complete segment
+OPENABLE_POLL_INTERVAL_MS = 200
+
+# Cursor samples kept to place frames captured before they reach the mouse thread
+MOUSE_HISTORY_SECONDS = 2
+
 class ScreenRecorderModel(QObject):
     outputPathChanged = Signal()
     regionChanged = Signal()
     iccProfileChanged = Signal()
     devicePixelRatio = Signal()
+    skipStaticFramesChanged = Signal()
+    captureInProcessChanged = Signal()
+    captureBackendChanged = Signal()
+    bufferBudgetChanged = Signal()
+    segmentDurationChanged = Signal()
+    intermediateRecordingChanged = Signal()
+    adaptiveCaptureChanged = Signal()
+    telemetryChanged = Signal()
+    isTranscodingChanged = Signal()
+    transcodeFinished = Signal(str, str)
+    recordingOpenable = Signal(str)
+    recordingFinished = Signal(str)
+    isFinalizingChanged = Signal()
+    isReplayingChanged = Signal()
+    transcodeFailed = Signal(str)
 
     def __init__(self, output_path: str = None):
         super().__init__()
         self._output_path = output_path if output_path and os.path.exists(output_path) else generate_video_path()
         self._region = None
+        self._regions = []
         self._screen_recording_thread = ScreenRecordingThread(self._output_path)
+        self._transcode_thread = None
+        self._finalize_thread = None
+        self._is_finalizing = False
+        self._is_openable = False
+        self.recordingFinished.connect(self._on_recording_finished)
+        self._replay_thread = None
+        self._replay_finalize_thread = None
+
+        self._openable_timer = QTimer(self)
+        self._openable_timer.setInterval(OPENABLE_POLL_INTERVAL_MS)
+        self._openable_timer.timeout.connect(self._check_openable)
+
+        self._telemetry_timer = QTimer(self)
+        self._telemetry_timer.setInterval(TELEMETRY_INTERVAL_MS)
+        self._telemetry_timer.timeout.connect(self.telemetryChanged)
 
     @Property(str)
     def output_path(self):
-        return self._output_path
+        # The segment manifest when recording into segments
+        return self._screen_recording_thread.output_path
 
     @output_path.setter
     def output_path(self, value):
         self._output_path = value
+        self._screen_recording_thread.output_path = value
         self.outputPathChanged.emit()
 
     @Property(dict)
@@ -52,6 +122,21 @@ class ScreenRecorderModel(QObject):
         self._region = region
         self.regionChanged.emit()
 
+    @Property(list)
+    def regions(self):
+        return self._regions
+
+    @regions.setter
+    def regions(self, regions):
+        """Several regions to record at once, each to its own video. Overrides region"""
+        self._regions = regions
+        self.regionChanged.emit()
+
+    @Property(list)
+    def region_recordings(self):
+        """The additional videos of a multi-region recording with their region and mouse events"""
+        return self._screen_recording_thread.region_recordings
+
     @Property(str)
     def icc_profile(self):
         return self._screen_recording_thread.icc_profile
@@ -70,42 +155,334 @@ class ScreenRecorderModel(QObject):
         self._screen_recording_thread.device_pixel_ratio = value
         self.devicePixelRatio.emit()
 
+    @Property(bool, notify=skipStaticFramesChanged)
+    def skip_static_frames(self):
+        return self._screen_recording_thread.skip_static_frames
+
+    @skip_static_frames.setter
+    def skip_static_frames(self, value):
+        if self._screen_recording_thread.skip_static_frames != value:
+            self._screen_recording_thread.skip_static_frames = value
+            self.skipStaticFramesChanged.emit()
+
+    @Property(bool, notify=captureInProcessChanged)
+    def capture_in_process(self):
+        return self._screen_recording_thread.capture_in_process
+
+    @capture_in_process.setter
+    def capture_in_process(self, value):
+        if self._screen_recording_thread.capture_in_process != value:
+            self._screen_recording_thread.capture_in_process = value
+            self.captureInProcessChanged.emit()
+
+    @Property(str, notify=captureBackendChanged)
+    def capture_backend(self):
+        return self._screen_recording_thread.capture_backend
+
+    @capture_backend.setter
+    def capture_backend(self, value):
+        if self._screen_recording_thread.capture_backend != value:
+            self._screen_recording_thread.capture_backend = value
+            self.captureBackendChanged.emit()
+
+    @Property(int, notify=bufferBudgetChanged)
+    def buffer_budget_mb(self):
+        return self._screen_recording_thread.buffer_budget_mb
+
+    @buffer_budget_mb.setter
+    def buffer_budget_mb(self, value):
+        if self._screen_recording_thread.buffer_budget_mb != value:
+            self._screen_recording_thread.buffer_budget_mb = value
+            self.bufferBudgetChanged.emit()
+
+    @Property(int, notify=segmentDurationChanged)
+    def segment_duration(self):
+        return self._screen_recording_thread.segment_duration
+
+    @segment_duration.setter
+    def segment_duration(self, value):
+        if self._screen_recording_thread.segment_duration != value:
+            self._screen_recording_thread.segment_duration = value
+            self.segmentDurationChanged.emit()
+            self.outputPathChanged.emit()
+
+    @Property(bool, notify=intermediateRecordingChanged)
+    def intermediate_recording(self):
+        return self._screen_recording_thread.intermediate_recording
+
+    @intermediate_recording.setter
+    def intermediate_recording(self, value):
+        if self._screen_recording_thread.intermediate_recording != value:
+            self._screen_recording_thread.intermediate_recording = value
+            self.intermediateRecordingChanged.emit()
+            self.outputPathChanged.emit()
+
+    @Property(bool, notify=adaptiveCaptureChanged)
+    def adaptive_capture(self):
+        return self._screen_recording_thread.adaptive_capture
+
+    @adaptive_capture.setter
+    def adaptive_capture(self, value):
+        if self._screen_recording_thread.adaptive_capture != value:
+            self._screen_recording_thread.adaptive_capture = value
+            self.adaptiveCaptureChanged.emit()
+
+    @Property(list)
+    def capture_changes(self):
+        return self._screen_recording_thread.capture_changes
+
+    @Property(dict, notify=telemetryChanged)
+    def telemetry(self):
+        return self._screen_recording_thread.telemetry
+
+    @Property(bool, notify=isFinalizingChanged)
+    def is_finalizing(self):
+        return self._is_finalizing
+
+    @Property(bool, notify=isReplayingChanged)
+    def is_replaying(self):
+        return self._replay_thread is not None
+
+    @Property(bool, notify=isTranscodingChanged)
+    def is_transcoding(self):
+        return self._transcode_thread is not None and self._transcode_thread.isRunning()
+
+    @Slot(list, result=list)
+    def map_region_to_physical(self, region):
+        """Map a region in Qt logical coordinates to physical pixels, see utils.monitors"""
+        return map_region_to_physical(get_screens(), region, self.device_pixel_ratio)
+
+    def _set_regions(self):
+        if len(self._regions) > 1:
+            self._screen_recording_thread.set_regions(self._regions)
+        else:
+            self._screen_recording_thread.set_region(self._regions[0] if self._regions else self._region)
+
+    def _join_finalize_thread(self):
+        # The recording thread is reused, it must be done with the previous recording
+        if self._finalize_thread is not None:
+            self._finalize_thread.join()
+            self._finalize_thread = None
+
+    @Slot()
+    def prepare_recording(self):
+        self._join_finalize_thread()
+        self._set_regions()
+        self._screen_recording_thread.prepare_recording()
+
     @Slot()
     def start_recording(self):
-        self._screen_recording_thread.set_region(self._region)
+        if not self._screen_recording_thread.is_prepared:
+            self._join_finalize_thread()
+            self._set_regions()
         self._screen_recording_thread.start_recording()
+        self._telemetry_timer.start()
 
     @Slot()
     def stop_recording(self):
-        self._screen_recording_thread.stop_recording()
+        """
+        Stop capturing and return right away. The recording is finalized in the
+        background: recordingOpenable is emitted as soon as the editor can open
+        output_path, and recordingFinished once all of its frames are written.
+        A segmented recording is openable from its first complete segment, the
+        editor picks up later segments with VideoControllerModel.refresh_source.
+        """
+        self._screen_recording_thread.stop_capture()
+        self._telemetry_timer.stop()
+
+        self._is_finalizing = True
+        self._is_openable = False
+        self._finalize_thread = Thread(target=self._finalize_recording, daemon=True)
+        self._finalize_thread.start()
+        self.isFinalizingChanged.emit()
+
+        if is_segment_manifest(self._screen_recording_thread.output_path):
+            self._openable_timer.start()
+            self._check_openable()
+
+    @Slot()
+    def _check_openable(self):
+        if self._is_openable or not self._is_finalizing:
+            self._openable_timer.stop()
+            return
+        if read_segment_manifest(self._screen_recording_thread.output_path):
+            self._set_openable()
+
+    def _set_openable(self):
+        self._openable_timer.stop()
+        if not self._is_openable:
+            self._is_openable = True
+            self.recordingOpenable.emit(self._screen_recording_thread.output_path)
+
+    def _finalize_recording(self):
+        try:
+            self._screen_recording_thread.finalize_recording()
+        except Exception as e:
+            logger.error(f"Failed to finalize recording: {e}")
+        # Queued to the GUI thread
+        self.recordingFinished.emit(self._screen_recording_thread.output_path)
+
+    @Slot(str)
+    def _on_recording_finished(self, path):
+        # Files other than segments can only be read once FFmpeg has closed them
+        self._set_openable()
+        self._is_finalizing = False
+        self.isFinalizingChanged.emit()
+        self.telemetryChanged.emit()
+
+        # The editor opens the intermediate while the editing format is produced
+        transcode_path = self._screen_recording_thread.transcode_path
+        if transcode_path:
+            self._start_transcode(path, transcode_path)
+
+    @Slot()
+    def start_replay_buffer(self):
+        """
+        Keep recording the region (the whole screen by default) in the
+        background, holding only the last DEFAULT_REPLAY_SECONDS on disk
+        """
+        if self._replay_thread is not None:
+            return
+        # A stopped buffer may still be deleting the same segments
+        if self._replay_finalize_thread is not None:
+            self._replay_finalize_thread.join()
+            self._replay_finalize_thread = None
+
+        output_path = os.path.join(tempfile.gettempdir(), "screenvivid_replay.mp4")
+        shutil.rmtree(get_segments_dir(output_path), ignore_errors=True)
+
+        # Static frames are held instead of piped and encoded, only the first
+        # and last frame of each segment are written, so an idle screen costs
+        # about a frame per second. The capture loop still runs at full rate
+        replay_thread = ScreenRecordingThread(output_path)
+        replay_thread.fps = config.DEFAULT_REPLAY_FPS
+        replay_thread.skip_static_frames = True
+        replay_thread.segment_duration = config.DEFAULT_REPLAY_SEGMENT_DURATION
+        replay_thread.replay_window = config.DEFAULT_REPLAY_SECONDS
+        replay_thread.set_region(self._region)
+        replay_thread.start_recording()
+        self._replay_thread = replay_thread
+        self.isReplayingChanged.emit()
+
+    @Slot()
+    def stop_replay_buffer(self):
+        """Stop capturing and return right away, FFmpeg is closed and the buffer deleted in the background"""
+        if self._replay_thread is None:
+            return
+        replay_thread, self._replay_thread = self._replay_thread, None
+        replay_thread.stop_capture()
+        self._replay_finalize_thread = Thread(target=self._discard_replay_buffer, args=(replay_thread,), daemon=True)
+        self._replay_finalize_thread.start()
+        self.isReplayingChanged.emit()
+
+    @staticmethod
+    def _discard_replay_buffer(replay_thread):
+        try:
+            replay_thread.finalize_recording()
+        except Exception as e:
+            logger.error(f"Failed to finalize replay buffer: {e}")
+        replay_thread.clean()
+
+    @Slot(int, result=dict)
+    def save_replay(self, seconds):
+        """
+        Save the last ``seconds`` of the replay buffer as a recording. Return
+        its path and the metadata for VideoControllerModel.load_video, or an
+        empty dict if there is nothing to save yet.
+        """
+        if self._replay_thread is None:
+            return {}
+        try:
+            path, mouse_events = self._replay_thread.save_replay(seconds, generate_video_path())
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to save replay: {e}")
+            return {}
+        return {
+            "path": path,
+            "metadata": {
+                "mouse_events": mouse_events,
+                "region": self._replay_thread.region,
+                "recording": True,
+            },
+        }
 
     @Slot()
     def cancel_recording(self):
-        self.stop_recording()
+        self._openable_timer.stop()
+        if self._finalize_thread is not None:
+            self._join_finalize_thread()
+        else:
+            self._screen_recording_thread.stop_recording()
+        self._telemetry_timer.stop()
         self.clean()
 
     @Slot()
     def clean(self):
+        self._stop_transcode()
         self._screen_recording_thread.clean()
 
+    def _start_transcode(self, input_path, output_path):
+        self._stop_transcode()
+        self._transcode_thread = TranscodeThread(input_path, output_path, fps=self._screen_recording_thread.fps)
+        self._transcode_thread.transcoded.connect(self.transcodeFinished)
+        self._transcode_thread.failed.connect(self.transcodeFailed)
+        self._transcode_thread.finished.connect(self.isTranscodingChanged)
+        self._transcode_thread.start()
+        self.isTranscodingChanged.emit()
+
+    def _stop_transcode(self):
+        if self._transcode_thread is not None and self._transcode_thread.isRunning():
+            self._transcode_thread.stop()
+            self._transcode_thread.wait()
+
 class ScreenRecordingThread:
     def __init__(self, output_path: str = None, start_delay: float = 0.5):
         self._output_path = output_path
         self._start_delay = start_delay
         self._region = None
-        self._mouse_events = {"move": {}, "click": [], "cursors_map": {}}
+        self._mouse_events = {"move": {}, "click": [], "cursors_map": {}, "sprites": {}}
+        # Held by the mouse thread while recording events and by replay pruning
+        self._mouse_events_lock = Lock()
+        self._cursor_sprites = None
         self._frame_index = 0
         self._frame_width = None
         self._frame_height = None
         self._is_stopped = Event()
         self._is_stopped.set()
+        self._is_started = Event()
+        self._is_prepared = False
+        self._recording_start_time = None
+        self._recording_stop_time = None
         self._fps = config.DEFAULT_FPS or 24
         self._icc_profile = None
         self._device_pixel_ratio = 1.0
-
-        # Queues for communication between threads
-        self._image_queue = queue.Queue(maxsize=90)  # Buffer 3 seconds for FPS=30
-        self._frame_index_queue = queue.Queue(maxsize=90)
+        self._screens = []
+        self._extra_regions = []
+        self._region_encoders = []
+        self._capture_region = None
+        self._skip_static_frames = config.DEFAULT_SKIP_STATIC_FRAMES
+        self._capture_in_process = config.DEFAULT_CAPTURE_IN_PROCESS
+        self._capture_backend = config.DEFAULT_CAPTURE_BACKEND
+        self._segment_duration = config.DEFAULT_SEGMENT_DURATION
+        self._intermediate_recording = config.DEFAULT_INTERMEDIATE_RECORDING
+        self._adaptive_capture = config.DEFAULT_ADAPTIVE_CAPTURE
+        self._replay_window = 0
+        self._replay_thread = None
+        self._segment_frames = None
+        self._frame_stream = None
+        self._governor = None
+        self._last_frame_index = -1
+        self._capture_stats = {"captured": 0, "dropped": 0, "late": 0, "repeated": 0}
+        self._icc_profile_check_tries = 0
+        self._bytes_written = 0
+        self._write_latency = 0.0
+        self._fps_stats = {}
+
+        # Queues for communication between threads. The frame buffer is bounded
+        # by memory instead of frame count and never blocks the capture thread
+        self._buffer_budget_mb = config.DEFAULT_RECORDER_BUFFER_MB
+        self._frame_buffer = FrameBuffer(self._buffer_budget_mb)
+        self._frame_index_queue = queue.Queue()
 
         self._os_name = get_os_name()
         nonscale_screen_size = pyautogui.size()
@@ -115,22 +492,86 @@ class ScreenRecordingThread:
         ]
 
         self._ffmpeg_process = None
+        self._ffmpeg_log_thread = None
+        self._ffmpeg_log = deque(maxlen=20)
+        self._ffmpeg_progress = {"frame": 0, "fps": 0.0, "speed": None, "size": 0}
+        self._ffmpeg_start_time = None
+        self._ffmpeg_started = Event()
+        self._native_capture = None
+        self._capture_process = None
         self._capture_thread = None
         self._mouse_thread = None
         self._writer_thread = None
+        self._governor_thread = None
+        self._replay_thread = None
 
         self._cursor_loader = CursorLoaderThread()
         self._cursor_loader.start()
         self._prev_cursor_anim_state = {}
+        self._mouse_sample_index = 0
 
         # For time tracking
         self._start_time = None
         self._frame_timestamps = queue.Queue(maxsize=90)
 
+    @property
+    def output_path(self):
+        """
+        The video file the recording is written to, or the segment manifest when
+        recording into segments. In intermediate recording mode this is the
+        intermediate, which the editor can open while it is transcoded.
+        """
+        if self.get_segment_duration():
+            return get_segment_manifest_path(self._output_path)
+        if self.uses_intermediate:
+            return f"{os.path.splitext(self._output_path)[0]}.{INTERMEDIATE_EXTENSION}"
+        return self._output_path
+
+    @property
+    def transcode_path(self):
+        """Destination of the background transcode, None without an intermediate"""
+        return self._output_path if self.uses_intermediate else None
+
+    @output_path.setter
+    def output_path(self, value):
+        self._output_path = value
+
     @property
     def mouse_events(self):
         return self._mouse_events
 
+    @property
+    def region(self):
+        return self._region
+
+    @property
+    def region_recordings(self):
+        return [
+            {"path": encoder.output_path, "region": encoder.region, "mouse_events": encoder.mouse_events}
+            for encoder in self._region_encoders
+        ]
+
+    @property
+    def screen_size(self):
+        return self._screen_size
+
+    @property
+    def fps(self):
+        return self._fps
+
+    @fps.setter
+    def fps(self, value):
+        self._fps = value
+
+    @property
+    def replay_window(self):
+        """Seconds kept by a rolling (instant replay) recording, 0 keeps everything"""
+        return self._replay_window
+
+    @replay_window.setter
+    def replay_window(self, value):
+        self._replay_window = value
+
     @property
     def icc_profile(self):
         return self._icc_profile
@@ -147,13 +588,269 @@ class ScreenRecordingThread:
     def device_pixel_ratio(self, value):
         self._device_pixel_ratio = value
 
-    def start_recording(self):
+    @property
+    def skip_static_frames(self):
+        return self._skip_static_frames
+
+    @skip_static_frames.setter
+    def skip_static_frames(self, value):
+        self._skip_static_frames = value
+
+    @property
+    def capture_in_process(self):
+        return self._capture_in_process
+
+    @capture_in_process.setter
+    def capture_in_process(self, value):
+        self._capture_in_process = value
+
+    @property
+    def capture_backend(self):
+        return self._capture_backend
+
+    @capture_backend.setter
+    def capture_backend(self, value):
+        self._capture_backend = value
+
+    @property
+    def buffer_budget_mb(self):
+        return self._buffer_budget_mb
+
+    @buffer_budget_mb.setter
+    def buffer_budget_mb(self, value):
+        self._buffer_budget_mb = value
+
+    @property
+    def segment_duration(self):
+        return self._segment_duration
+
+    @segment_duration.setter
+    def segment_duration(self, value):
+        self._segment_duration = value
+
+    def get_segment_duration(self):
+        """Segment length in seconds, 0 to record a single file"""
+        # Variable frame rate recordings are read back by SegmentedVideoCapture
+        if not self._segment_duration and self.variable_frame_rate:
+            return config.DEFAULT_VFR_SEGMENT_DURATION
+        return self._segment_duration
+
+    @property
+    def variable_frame_rate(self):
+        """
+        With static frame skipping only changed frames are piped and encoded,
+        stamped with their time, instead of repeating the previous one.
+        Multi-region and FFmpeg native capture keep a constant frame rate.
+        """
+        return (
+            self._skip_static_frames
+            and not self._extra_regions
+            and not get_screen_capture_class(backend=self._capture_backend).is_ffmpeg_native
+        )
+
+    @property
+    def intermediate_recording(self):
+        return self._intermediate_recording
+
+    @intermediate_recording.setter
+    def intermediate_recording(self, value):
+        self._intermediate_recording = value
+
+    @property
+    def uses_intermediate(self):
+        # macOS already encodes in hardware, the intermediate only helps libx264
+        return self._intermediate_recording and self._os_name != "macos"
+
+    @property
+    def adaptive_capture(self):
+        return self._adaptive_capture
+
+    @adaptive_capture.setter
+    def adaptive_capture(self, value):
+        self._adaptive_capture = value
+
+    @property
+    def capture_changes(self):
+        """Capture rate changes made by the governor, with the frame they start at"""
+        return list(self._governor.changes) if self._governor else []
+
+    @property
+    def buffer_stats(self):
+        """Occupancy, compressed, spilled and dropped frame counts of the frame buffer"""
+        return self._frame_buffer.stats
+
+    @property
+    def capture_stats(self):
+        """Captured, dropped, late (missed deadline) and repeated frame counts"""
+        if self._capture_process is not None:
+            return self._capture_process.stats
+        return dict(self._capture_stats)
+
+    @property
+    def telemetry(self):
+        """
+        Live recording health: per thread fps, queue depths, dropped and late
+        frames, capture to encode latency and FFmpeg progress. Also saved in the
+        recording metadata.
+        """
+        if not self._fps_stats:
+            return {}
+
+        capture_stats = self.capture_stats
+        dropped = capture_stats["dropped"]
+        if self._capture_process is not None:
+            queue_depth = self._capture_process.ring.available()
+        else:
+            queue_depth = self._frame_buffer.qsize()
+            if not self._is_stopped.is_set():
+                # Added to the capture stats when recording stops
+                dropped += self._frame_buffer.stats["dropped"]
+
+        return {
+            "capture_fps": round(self._fps_stats["capture"]["current_fps"], 2),
+            "mouse_fps": round(self._fps_stats["mouse"]["current_fps"], 2),
+            "writer_fps": round(self._fps_stats["writer"]["current_fps"], 2),
+            "queue_depth": queue_depth,
+            "mouse_queue_depth": self._frame_index_queue.qsize(),
+            "captured": capture_stats["captured"],
+            "dropped": dropped,
+            "late": capture_stats["late"],
+            "repeated": capture_stats["repeated"],
+            "latency_ms": round(self._write_latency * 1000, 1),
+            "ffmpeg_fps": self._ffmpeg_progress["fps"],
+            "ffmpeg_speed": self._ffmpeg_progress["speed"],
+            "bytes_written": self._bytes_written,
+            "output_bytes": self._ffmpeg_progress["size"],
+        }
+
+    @property
+    def is_prepared(self):
+        return self._is_prepared
+
+    def prepare_recording(self):
+        """
+        Spawn FFmpeg, open the capture backend, allocate the buffers and start
+        the worker threads ahead of time, e.g. during the countdown, so that
+        start_recording only has to open the gate. Frames are grabbed from then on.
+        """
+        if self._is_prepared:
+            return
         if not self._output_path:
             raise ValueError("Output path is not specified")
 
         self._is_stopped.clear()
+        self._is_started.clear()
+        self._capture_stats = {"captured": 0, "dropped": 0, "late": 0, "repeated": 0}
+        self._icc_profile_check_tries = 0
+        self._frame_buffer = FrameBuffer(self._buffer_budget_mb)
+        self._ffmpeg_log.clear()
+        self._ffmpeg_progress = {"frame": 0, "fps": 0.0, "speed": None, "size": 0}
+        self._ffmpeg_start_time = None
+        self._ffmpeg_started.clear()
+        self._bytes_written = 0
+        self._write_latency = 0.0
+        self._frame_index = 0
+        self._last_frame_index = -1
+        self._recording_start_time = None
+
+        # Several regions are grabbed at once as their bounding rectangle in bgra
+        # and each one is sliced out for its own encoder. This needs the MSS
+        # backend in this process
+        self._region_encoders = []
+        self._capture_region = self._region
+        if self._extra_regions:
+            if self._os_name == "macos":
+                logger.warning("Multi-region recording is not supported on macOS, recording the first region")
+            else:
+                self._capture_region = get_bounding_region([self._region, *self._extra_regions])
+                extension = INTERMEDIATE_EXTENSION if self.uses_intermediate else "mp4"
+                self._region_encoders = [
+                    RegionEncoder(region, RegionEncoder.get_output_path(self._output_path, i + 1, extension))
+                    for i, region in enumerate(self._extra_regions)
+                ]
+
+        # FFmpeg native backends grab the screen inside FFmpeg
+        capture_class = get_screen_capture_class(backend=self._capture_backend)
+        self._native_capture = None
+        if capture_class.is_ffmpeg_native and not self._region_encoders:
+            self._native_capture = capture_class(self._region)
+
+        # Static frames are held rather than repeated, the frames are piped in a
+        # Matroska stream carrying their timestamps
+        self._frame_stream = None
+        if self.variable_frame_rate:
+            pixel_format = "jpeg" if self._os_name == "macos" else "yuv420p"
+            self._frame_stream = MatroskaFrameStream(
+                int(self._region[2]), int(self._region[3]), self._fps, pixel_format
+            )
+
+        # The governor steps the capture rate, which FFmpeg native capture fixes
+        self._governor = None
+        if self._adaptive_capture and self._native_capture is None:
+            self._governor = CaptureGovernor(self._fps)
 
-        # Start FFmpeg process
+        # Piped FFmpeg waits for the first frame, but native capture starts
+        # grabbing right away, so it is only spawned by start_recording
+        if self._native_capture is None:
+            self._start_ffmpeg()
+
+        self._fps_stats = {
+            "capture": {"frames": 0, "start_time": None, "current_fps": 0},
+            "mouse": {"frames": 0, "start_time": None, "current_fps": 0},
+            "writer": {"frames": 0, "start_time": None, "current_fps": 0}
+        }
+        self._fps_update_interval = 1.0
+
+        # Start the threads, they wait for start_recording. In capture process
+        # mode the capture loop runs in a separate process and the writer feeds
+        # FFmpeg from the shared frame ring. FFmpeg native capture only needs the
+        # frame clock for the mouse timeline, started with FFmpeg
+        self._capture_thread = None
+        self._writer_thread = None
+        if self._native_capture is None and self._capture_in_process and not self._region_encoders:
+            self._capture_process = CaptureProcess(
+                self._region, self._fps, self._skip_static_frames,
+                n_slots=config.DEFAULT_CAPTURE_RING_SLOTS
+            )
+            self._capture_process.start()
+            self._writer_thread = Thread(target=self._feed_frames_from_ring)
+        elif self._native_capture is None:
+            self._capture_thread = Thread(target=self._capture_screen)
+            self._writer_thread = Thread(target=self._write_frames)
+        self._mouse_thread = Thread(target=self._process_mouse_events)
+        self._governor_thread = Thread(target=self._govern_capture) if self._governor else None
+
+        if self._capture_thread:
+            self._capture_thread.start()
+        self._mouse_thread.start()
+        if self._writer_thread:
+            self._writer_thread.start()
+        self._is_prepared = True
+
+    def start_recording(self):
+        self.prepare_recording()
+
+        if self._native_capture is not None:
+            self._start_ffmpeg()
+        self._recording_start_time = time.time()
+
+        self._is_started.set()
+        if self._capture_process:
+            self._capture_process.start_capture()
+        if self._native_capture is not None:
+            self._capture_thread = Thread(target=self._track_ffmpeg_clock)
+            self._capture_thread.start()
+        if self._replay_window and self.get_segment_duration():
+            self._segment_frames = SegmentFrames(
+                get_segment_manifest_path(self._output_path), self.get_segment_duration(), self._fps
+            )
+            self._replay_thread = Thread(target=self._prune_replay_buffer)
+            self._replay_thread.start()
+        if self._governor_thread:
+            self._governor_thread.start()
+        self._is_prepared = False
+
+    def _start_ffmpeg(self):
         cmd = self._get_ffmpeg_command()
         logger.info(f"FFmpeg command: {cmd}")
         if self._os_name == "windows":
@@ -176,22 +873,13 @@ class ScreenRecordingThread:
                 stderr=subprocess.PIPE,
                 bufsize=50*1024*1024,
             )
+        self._ffmpeg_log_thread = Thread(target=self._read_ffmpeg_output, daemon=True)
+        self._ffmpeg_log_thread.start()
+        if self._frame_stream is not None:
+            self._ffmpeg_process.stdin.write(self._frame_stream.header())
 
-        # Start all threads
-        self._capture_thread = Thread(target=self._capture_screen)
-        self._mouse_thread = Thread(target=self._process_mouse_events)
-        self._writer_thread = Thread(target=self._write_frames)
-
-        self._capture_thread.start()
-        self._mouse_thread.start()
-        self._writer_thread.start()
-
-        self._fps_stats = {
-            "capture": {"frames": 0, "start_time": None, "current_fps": 0},
-            "mouse": {"frames": 0, "start_time": None, "current_fps": 0},
-            "writer": {"frames": 0, "start_time": None, "current_fps": 0}
-        }
-        self._fps_update_interval = 1.0
+        for encoder in self._region_encoders:
+            encoder.start(self._get_ffmpeg_command(encoder.region, ["-y", encoder.output_path]))
 
     def _update_fps(self, thread_name: str):
         stats = self._fps_stats[thread_name]
@@ -208,106 +896,275 @@ class ScreenRecordingThread:
             stats["start_time"] = time.time()
 
     def stop_recording(self):
+        self.stop_capture()
+        self.finalize_recording()
+
+    def stop_capture(self):
+        """Stop grabbing frames and tracking the mouse, which only takes a frame interval"""
         self._is_stopped.set()
+        self._is_prepared = False
+        self._recording_stop_time = time.time()
+        if self._capture_process:
+            self._capture_process.stop()
+        # Wake the mouse thread up
+        self._frame_index_queue.put(None)
 
-        # Wait for threads to finish
         if self._capture_thread:
             self._capture_thread.join()
         if self._mouse_thread:
             self._mouse_thread.join()
+        if self._governor_thread:
+            self._governor_thread.join()
+        if self._replay_thread:
+            self._replay_thread.join()
+            self._replay_thread = None
+
+    def finalize_recording(self):
+        """
+        Let the writer drain the frame buffer and FFmpeg flush its encoder, which
+        can take a while when they fell behind. Call after stop_capture.
+        """
         if self._writer_thread:
             self._writer_thread.join()
+        buffer_stats = self._frame_buffer.stats
+        self._capture_stats["dropped"] += buffer_stats["dropped"]
+        logger.info(f"Frame buffer stats: {buffer_stats}")
+        self._frame_buffer.close()
+        if self._capture_process:
+            self._capture_process.join(timeout=5)
+            self._capture_stats = self._capture_process.stats
+            self._capture_process.close()
+            self._capture_process = None
 
         # Close FFmpeg process
         if self._ffmpeg_process and self._ffmpeg_process.poll() is None:
-            self._ffmpeg_process.communicate(b"q")
+            try:
+                self._ffmpeg_process.stdin.write(b"q")
+                self._ffmpeg_process.stdin.close()
+            except OSError:
+                pass
             self._ffmpeg_process.wait()
+        if self._ffmpeg_log_thread:
+            self._ffmpeg_log_thread.join(timeout=5)
+        if self._ffmpeg_process and self._ffmpeg_process.returncode:
+            logger.error(f"FFmpeg exited with code {self._ffmpeg_process.returncode}: {list(self._ffmpeg_log)}")
+
+        # The cursor was sampled once per frame, each region gets the timeline in its own coordinates
+        for encoder in self._region_encoders:
+            encoder.close()
+            encoder.mouse_events = remap_mouse_events(self._mouse_events, self._region, encoder.region)
+
+        # Achieved capture frame rate, comparable between backends
+        if self._native_capture is not None:
+            self._capture_stats["captured"] = self._ffmpeg_progress["frame"]
+        duration = self._recording_stop_time - self._recording_start_time if self._recording_start_time else 0
+        self._capture_stats["fps"] = round(self._capture_stats["captured"] / duration, 2) if duration > 0 else 0
+        logger.info(f"Capture stats ({self._capture_backend}): {self._capture_stats}")
+        if self._governor and self._governor.changes:
+            logger.info(f"Capture rate changes: {self._governor.changes}")
 
         logger.info(f"Stopped recording")
 
     def clean(self):
-        safe_delete(self._output_path)
+        delete_recording(self.output_path)
+        for encoder in self._region_encoders:
+            safe_delete(encoder.output_path)
+        if self.transcode_path:
+            safe_delete(self.transcode_path)
         safe_delete(self._icc_profile)
 
     def _capture_screen(self):
         """Thread 1: Capture screen and put data into queues"""
         logger.info("Started capturing")
-        target_interval = 1.0 / self._fps
-        next_frame_time = time.time() + target_interval
-
-        # ScreenCapture
-        icc_profile_check_tries = 0
-        icc_profile_check_max_tries = 3
-        screen_capture = get_screen_capture_class()
         try:
-            with screen_capture(self._region) as sct:
-                while not self._is_stopped.is_set():
-                    current_time = time.time()
-
-                    # Đợi đến thời điểm chính xác để capture frame tiếp theo
-                    if current_time < next_frame_time:
-                        time.sleep(max(0, next_frame_time - current_time))
-                        continue
-
-                    screenshot_bytes, pixel_format = sct.capture()
-                    if (
-                        pixel_format in ("jpeg", "png")
-                        and not self._icc_profile
-                        and icc_profile_check_tries < icc_profile_check_max_tries
-                    ):
-                        # Extract icc profile
-                        image = Image.open(io.BytesIO(screenshot_bytes))
-                        icc_profile_data = image.info.get("icc_profile")
-                        if icc_profile_data:
-                            self._icc_profile = generate_temp_file(extension=".icc")
-                            with open(self._icc_profile, "wb") as f:
-                                f.write(icc_profile_data)
-                            logger.debug(f"ICC profile file: {self._icc_profile}")
-                        icc_profile_check_tries += 1
-
-                    # Lưu timestamp của frame
-                    frame_time = time.time()
-                    self._image_queue.put((screenshot_bytes, frame_time))
-                    self._frame_index_queue.put(self._frame_index)
-
-                    self._frame_index += 1
-                    self._update_fps("capture")
-
-                    # Tính thời điểm cần capture frame tiếp theo
-                    next_frame_time += target_interval
-
-                    # Reset nếu bị lag quá nhiều
-                    if time.time() > next_frame_time + target_interval:
-                        next_frame_time = time.time() + target_interval
-
+            capture_frames(
+                self._capture_region, self._fps, self._is_stopped, self._on_frame_captured,
+                skip_static_frames=self._skip_static_frames,
+                on_deadline_miss=self._on_deadline_miss,
+                frame_step=self._get_frame_step,
+                is_started=self._is_started,
+                pixel_format="bgra" if self._region_encoders else None,
+            )
         except Exception as e:
             logger.error(f"Screen capture error: {e}")
         finally:
             # Signal write thread to stop
-            self._image_queue.put((None, None))
+            self._frame_buffer.put(None, None)
+
+    def _on_frame_captured(self, screenshot_bytes, pixel_format, frame_index, frame_time):
+        self._capture_stats["captured"] += 1
+        self._check_icc_profile(screenshot_bytes, pixel_format)
+
+        # Frames that were not grabbed (governor steps, missed deadlines) repeat
+        # the previous one, so the video keeps one frame per frame index
+        for _ in range(frame_index - self._last_frame_index - 1):
+            self._frame_buffer.repeat(frame_time)
+
+        # Unchanged frames are not buffered, the writer repeats or holds the previous one
+        if screenshot_bytes is not None:
+            self._frame_buffer.put(screenshot_bytes, frame_time)
+        else:
+            self._capture_stats["repeated"] += 1
+            self._frame_buffer.repeat(frame_time)
+
+        self._put_frame_indices(frame_index, frame_time)
+        self._update_fps("capture")
+
+    def _put_frame_indices(self, frame_index, frame_time):
+        """
+        Hand frame indices to the mouse thread with the time each frame was
+        captured, including frames that were not grabbed
+        """
+        for index in range(self._last_frame_index + 1, frame_index + 1):
+            self._frame_index_queue.put((index, frame_time - (frame_index - index) / self._fps))
+        self._last_frame_index = max(self._last_frame_index, frame_index)
+        self._frame_index = frame_index
+
+    def _get_frame_step(self):
+        return self._governor.frame_step if self._governor else 1
+
+    def _on_deadline_miss(self):
+        self._capture_stats["late"] += 1
+
+    def _check_icc_profile(self, screenshot_bytes, pixel_format):
+        if (
+            screenshot_bytes is None
+            or pixel_format not in ("jpeg", "png")
+            or self._icc_profile
+            or self._icc_profile_check_tries >= 3
+        ):
+            return
+
+        # Extract icc profile
+        image = Image.open(io.BytesIO(screenshot_bytes))
+        icc_profile_data = image.info.get("icc_profile")
+        if icc_profile_data:
+            self._icc_profile = generate_temp_file(extension=".icc")
+            with open(self._icc_profile, "wb") as f:
+                f.write(icc_profile_data)
+            logger.debug(f"ICC profile file: {self._icc_profile}")
+        self._icc_profile_check_tries += 1
+
+    def _read_ffmpeg_output(self):
+        """Drain FFmpeg stderr so it never blocks, parsing the input start time and progress"""
+        stream = self._ffmpeg_process.stderr
+        buffer = b""
+        try:
+            while True:
+                chunk = stream.read1(4096)
+                if not chunk:
+                    break
+
+                # Progress lines end with a carriage return
+                *lines, buffer = re.split(rb"[\r\n]", buffer + chunk)
+                for line in lines:
+                    if line:
+                        self._parse_ffmpeg_line(line.decode(errors="ignore"))
+        except Exception as e:
+            logger.warning(f"FFmpeg output reader error: {e}")
+
+    def _parse_ffmpeg_line(self, line):
+        self._ffmpeg_log.append(line)
+
+        progress = FFMPEG_PROGRESS_PATTERN.search(line)
+        if progress:
+            frame, fps, speed = progress.groups()
+            size = FFMPEG_SIZE_PATTERN.search(line)
+            self._ffmpeg_progress = {
+                "frame": int(frame),
+                "fps": float(fps),
+                "speed": float(speed) if speed != "N/A" else None,
+                "size": int(size.group(1)) * 1024 if size else self._ffmpeg_progress["size"],
+            }
+            if self._native_capture is not None:
+                self._fps_stats["capture"]["current_fps"] = float(fps)
+            return
+
+        if not self._ffmpeg_started.is_set():
+            start = FFMPEG_START_PATTERN.search(line)
+            if start:
+                self._ffmpeg_start_time = float(start.group(1))
+                self._ffmpeg_started.set()
+
+    def _track_ffmpeg_clock(self):
+        """Thread 1 (FFmpeg native capture): Emit frame indices following FFmpeg's timestamps"""
+        logger.info("Started FFmpeg clock tracking")
+
+        # x11grab timestamps frames with the wall clock, so the input start time
+        # reported by FFmpeg is the capture time of the first frame
+        while not self._ffmpeg_started.wait(timeout=0.1):
+            if self._is_stopped.is_set():
+                return
+            if time.time() - self._recording_start_time > 3:
+                break
+
+        start_time = self._ffmpeg_start_time
+        if start_time is None or abs(start_time - self._recording_start_time) > 60:
+            logger.warning(f"Unusable FFmpeg start time {start_time}, using the process start time")
+            start_time = self._recording_start_time
+
+        target_interval = 1.0 / self._fps
+        last_frame_index = -1
+        while not self._is_stopped.is_set():
+            frame_index = int((time.time() - start_time) * self._fps)
+            if frame_index > last_frame_index:
+                self._put_frame_indices(frame_index, start_time + frame_index * target_interval)
+                last_frame_index = frame_index
+
+            next_frame_time = start_time + (frame_index + 1) * target_interval
+            time.sleep(max(0, next_frame_time - time.time()))
+
+        logger.debug("FFmpeg clock tracking stopped")
 
     def _write_frames(self):
         """Thread 3: Write image bytes to FFmpeg stdin with precise timing"""
         logger.info("Started ffmpeg writer")
         target_interval = 1.0 / self._fps
 
-        # Initialize timing variables
-        self._start_time = time.time()
+        # Initialize timing variables, the writer may be started ahead of the
+        # recording so the clock starts with the first frame
+        self._start_time = None
         frame_count = 0
+        # The buffer holds one entry per frame index
+        frame_index = -1
+        written_index = -1
+        last_image_bytes = None
+        last_frame_time = None
 
         try:
-            while not self._is_stopped.is_set():
+            # Drain the buffer until the stop signal, frames may still be
+            # compressed or spilled to disk when recording stops
+            while True:
                 try:
                     # Get frame data with timestamp
-                    image_bytes, frame_time = self._image_queue.get(timeout=0.5)
+                    image_bytes, frame_time = self._frame_buffer.get(timeout=0.5)
 
                     if image_bytes is None:  # Stop signal
+                        # The held frame closes the timeline of a variable frame rate recording
+                        if (
+                            self._frame_stream is not None and last_image_bytes is not None
+                            and written_index < frame_index and self._ffmpeg_process.poll() is None
+                        ):
+                            self._on_frame_written(self._write_frame(last_image_bytes, frame_index), last_frame_time)
+                            frame_count += 1
                         break
+                    frame_index += 1
+                    last_frame_time = frame_time
+
+                    if image_bytes is REPEAT_FRAME:
+                        # The frame was static or dropped, repeat the previous one.
+                        # Repeats before the first frame are written along with it
+                        if last_image_bytes is None or not self._is_repeat_written(frame_index):
+                            continue
+                        image_bytes = last_image_bytes
+                    last_image_bytes = image_bytes
 
                     current_time = time.time()
+                    if self._start_time is None:
+                        self._start_time = current_time
 
                     # Calculate ideal time for this frame
-                    ideal_time = self._start_time + (frame_count * target_interval)
+                    ideal_time = self._start_time + (frame_index * target_interval)
 
                     # If we"re running behind, skip the delay
                     if current_time <= ideal_time:
@@ -315,18 +1172,17 @@ class ScreenRecordingThread:
                         if sleep_time > 0:
                             time.sleep(sleep_time)
 
-                    # Write frame
+                    # Write frame, along with the repeats queued before the first one
                     if self._ffmpeg_process.poll() is None:
-                        self._ffmpeg_process.stdin.write(image_bytes)
-                        self._ffmpeg_process.stdin.flush()
-                        self._update_fps("writer")
-                        frame_count += 1
+                        first_index = written_index + 1 if written_index < 0 else frame_index
+                        for index in range(first_index, frame_index + 1):
+                            self._on_frame_written(self._write_frame(image_bytes, index), frame_time)
+                            frame_count += 1
+                        written_index = frame_index
                     else:
                         logger.error("FFmpeg process is not running")
                         break
 
-                    self._image_queue.task_done()
-
                 except queue.Empty:
                     continue
                 except Exception as e:
@@ -334,89 +1190,302 @@ class ScreenRecordingThread:
                     break
 
         finally:
-            logger.debug(f"FFmpeg writer stopped. Wrote {frame_count} frames")
-            actual_duration = time.time() - self._start_time
+            logger.debug(f"FFmpeg writer stopped. Wrote {frame_count} frames for {frame_index + 1} frame indices")
+            actual_duration = time.time() - self._start_time if self._start_time else 0
             actual_fps = frame_count / actual_duration if actual_duration > 0 else 0
             logger.debug(f"Average output FPS: {actual_fps:.2f}")
 
+    def _is_repeat_written(self, frame_index):
+        """
+        Whether a static or dropped frame is written as a repeat of the previous
+        one. A variable frame rate recording holds the previous frame instead,
+        and only writes it as the first and the last frame of a segment: the
+        segments are then cut on time and each spans its part of the timeline.
+        """
+        if self._frame_stream is None:
+            return True
+        return self._frame_stream.is_segment_edge(frame_index, self.get_segment_duration())
+
+    def _write_frame(self, image_bytes, frame_index):
+        """Feed a frame to FFmpeg, or each region of a multi-region grab to its encoder"""
+        if not self._region_encoders:
+            if self._frame_stream is not None:
+                self._ffmpeg_process.stdin.write(self._frame_stream.frame_header(frame_index, len(image_bytes)))
+            self._ffmpeg_process.stdin.write(image_bytes)
+            self._ffmpeg_process.stdin.flush()
+            return len(image_bytes)
+
+        frame = frame_from_bytes(image_bytes, self._capture_region)
+        yuv = cv2.cvtColor(slice_region(frame, self._capture_region, self._region), cv2.COLOR_BGRA2YUV_I420)
+        self._ffmpeg_process.stdin.write(yuv)
+        self._ffmpeg_process.stdin.flush()
+        size = yuv.nbytes
+        for encoder in self._region_encoders:
+            size += encoder.write(frame, self._capture_region)
+        return size
+
+    def _on_frame_written(self, size, frame_time):
+        self._bytes_written += size
+        # Smoothed time from grabbing a frame to handing it to FFmpeg
+        latency = time.time() - frame_time
+        self._write_latency += 0.1 * (latency - self._write_latency)
+        self._update_fps("writer")
+
+    def _feed_frames_from_ring(self):
+        """Thread 3 (capture process mode): Write frames from the shared frame ring to FFmpeg stdin"""
+        logger.info("Started ffmpeg feeder")
+        ring = self._capture_process.ring
+        self._start_time = time.time()
+        frame_count = 0
+
+        # The last written frame stays in the ring, so frames dropped on a full
+        # ring and static frames can be filled by repeating it and the video
+        # stays aligned with the frame indices. A run of static frames works
+        # from a copy, their repeat markers come after it in the ring
+        held = 0
+        last_frame = None
+        last_frame_index = -1
+        written_index = -1
+        try:
+            while True:
+                if not ring.wait(held + 1, timeout=0.05):
+                    # Frames published before the ring closed are still fed
+                    if (ring.closed or not self._capture_process.is_alive()) and ring.available() <= held:
+                        break
+                    continue
+
+                # The capture time is stamped in the slot by the capture process
+                frame, pixel_format, frame_index, frame_time = ring.peek(held)
+                self._put_frame_indices(frame_index, frame_time)
+                self._update_fps("capture")
+                if self._ffmpeg_process.poll() is not None:
+                    logger.error("FFmpeg process is not running")
+                    break
+
+                if frame is None:
+                    if held:
+                        last_frame = bytes(ring.peek(0)[0])
+                        ring.release()
+                        held = 0
+                    ring.release()
+                    # Repeats before the first frame are written along with it
+                    if last_frame is not None:
+                        for index in range(last_frame_index + 1, frame_index + 1):
+                            if self._is_repeat_written(index):
+                                self._on_frame_written(self._write_frame(last_frame, index), frame_time)
+                                written_index = index
+                                frame_count += 1
+                else:
+                    self._check_icc_profile(frame, pixel_format)
+                    previous_frame = ring.peek(0)[0] if held else last_frame
+                    first_index = frame_index
+                    if previous_frame is not None:
+                        for index in range(last_frame_index + 1, frame_index):
+                            if self._is_repeat_written(index):
+                                self._on_frame_written(self._write_frame(previous_frame, index), frame_time)
+                                frame_count += 1
+                    else:
+                        first_index = written_index + 1
+                    del previous_frame
+
+                    for index in range(first_index, frame_index + 1):
+                        self._on_frame_written(self._write_frame(frame, index), frame_time)
+                        frame_count += 1
+                    written_index = frame_index
+                    if held:
+                        ring.release()
+                    held = 1
+                    last_frame = None
+                del frame
+                last_frame_index = frame_index
+
+            # The held frame closes the timeline of a variable frame rate recording
+            if self._frame_stream is not None and written_index < last_frame_index:
+                final_frame = ring.peek(0)[0] if held else last_frame
+                if final_frame is not None and self._ffmpeg_process.poll() is None:
+                    self._on_frame_written(self._write_frame(final_frame, last_frame_index), frame_time)
+                    frame_count += 1
+                del final_frame
+
+        except Exception as e:
+            logger.error(f"Frame feeding error: {e}")
+        finally:
+            if held:
+                ring.release()
+            logger.debug(f"FFmpeg feeder stopped. Wrote {frame_count} frames for {last_frame_index + 1} frame indices")
+
+    def _govern_capture(self):
+        """Thread 4: Step the capture rate down under load and back up with headroom"""
+        logger.info("Started capture governor")
+        while not self._is_stopped.wait(1.0):
+            if self._capture_process is not None:
+                # The feeder holds the last written slot
+                ring = self._capture_process.ring
+                queue_fill = max(0, ring.available() - 1) / ring.n_slots
+            else:
+                buffer_stats = self._frame_buffer.stats
+                buffered_bytes = buffer_stats["memory_bytes"] + buffer_stats["disk_bytes"]
+                queue_fill = min(1.0, buffered_bytes / (self._buffer_budget_mb * 1024 * 1024))
+
+            # A variable frame rate encoder only sees changed frames, its rate tells nothing
+            encoded_frames = self._ffmpeg_progress["frame"] if self._frame_stream is None else None
+            changed = self._governor.update(self._frame_index, self.capture_stats["late"], queue_fill, encoded_frames)
+            if changed and self._capture_process is not None:
+                self._capture_process.set_frame_step(self._governor.frame_step)
+        logger.debug("Capture governor stopped")
+
+    def _prune_replay_buffer(self):
+        """Thread 5 (rolling recording): Drop segments and mouse events older than the replay window"""
+        manifest_path = get_segment_manifest_path(self._output_path)
+        while not self._is_stopped.wait(self.get_segment_duration()):
+            try:
+                prune_replay_buffer(manifest_path, self._segment_frames, self._mouse_events, self._mouse_events_lock)
+            except OSError as e:
+                logger.warning(f"Failed to prune replay buffer: {e}")
+
+    def save_replay(self, seconds, output_path):
+        """Save the last ``seconds`` of a rolling recording, see replay_buffer.save_replay"""
+        return save_replay(
+            get_segment_manifest_path(self._output_path), output_path, seconds, self._fps,
+            self._segment_frames, self._mouse_events, self._mouse_events_lock
+        )
+
     def _process_mouse_events(self):
-        """Thread 2: Process mouse events using frame_index"""
+        """
+        Thread 2: Sample the mouse every frame interval and record it for each
+        frame index at the time the frame was captured
+        """
         logger.info("Started mouse tracking thread")
         try:
+            # Make sure the cursor theme is loaded before the first frame
+            self._cursor_loader.wait()
+            if self._os_name == "linux":
+                try:
+                    self._cursor_sprites = CursorSpriteTracker()
+                except Exception as e:
+                    logger.warning(f"Cursor sprites unavailable, matching the cursor theme instead: {e}")
+
+            # Frames can reach this thread well after they were captured, e.g.
+            # from the capture process ring, so the cursor is sampled on its
+            # own clock and interpolated at each frame's capture time
+            sample_interval = 1.0 / self._fps
+            samples = deque(maxlen=max(2, int(MOUSE_HISTORY_SECONDS * self._fps)))
+            pending = deque()
+            next_sample_time = time.time()
             last_frame = -1
-            last_cursor_state = None
-            last_position = None
-            
+
             # For click detection
             click_detection_buffer = []
-            click_threshold_frames = 5  # Number of frames to analyze for click detection
-            cursor_changed_to_hand = False
-            
+
             while not self._is_stopped.is_set():
                 try:
-                    frame_index = self._frame_index_queue.get(timeout=0.5)
-
-                    if frame_index is None:
-                        continue
-
-                    if frame_index > last_frame:
-                        x, y = pyautogui.position()
-
-                        # Scale by device pixel ratio
-                        x *= self._device_pixel_ratio
-                        y *= self._device_pixel_ratio
-
-                        relative_x = (x - self._region[0]) / self._region[2]
-                        relative_y = (y - self._region[1]) / self._region[3]
-
-                        cursor_state, anim_step = self._get_cursor()
-                        
-                        # Store current position and cursor state
-                        current_position = (relative_x, relative_y)
-                        
-                        # Add to click detection buffer
-                        click_detection_buffer.append({
-                            'frame': frame_index,
-                            'position': current_position,
-                            'cursor_state': cursor_state
-                        })
-                        
-                        # Keep buffer at fixed size
-                        if len(click_detection_buffer) > click_threshold_frames:
-                            click_detection_buffer.pop(0)
-                        
-                        # Detect clicks by analyzing cursor state transitions and movement
-                        self._detect_clicks(click_detection_buffer, frame_index)
-                        
-                        # Store cursor movement
-                        self._mouse_events["move"][frame_index] = (
-                            relative_x,
-                            relative_y,
-                            frame_index,
-                            cursor_state,
-                            anim_step,
-                        )
-                        
-                        # Update state tracking
-                        last_cursor_state = cursor_state
-                        last_position = current_position
-                        self._update_fps("mouse")
-
-                    last_frame = frame_index
+                    item = self._frame_index_queue.get(timeout=max(0, next_sample_time - time.time()))
+                    if item is not None:
+                        pending.append(item)
                     self._frame_index_queue.task_done()
-
-                    # Slight sleep to avoid hogging CPU
-                    time.sleep(0.001)
-
                 except queue.Empty:
-                    continue
+                    pass
+
+                try:
+                    current_time = time.time()
+                    if current_time >= next_sample_time:
+                        samples.append(self._sample_mouse())
+                        next_sample_time += sample_interval
+                        # Reset if lagging too much
+                        if current_time > next_sample_time + sample_interval:
+                            next_sample_time = current_time + sample_interval
+
+                    last_frame = self._record_mouse_events(pending, samples, last_frame, click_detection_buffer)
                 except Exception as e:
                     logger.error(f"Mouse tracking error: {e}")
                     break
 
+            # Frames captured right before the stop
+            while True:
+                try:
+                    item = self._frame_index_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    pending.append(item)
+            if pending:
+                samples.append(self._sample_mouse())
+                self._record_mouse_events(pending, samples, last_frame, click_detection_buffer)
+
         finally:
+            if self._cursor_sprites is not None:
+                self._cursor_sprites.close()
+                self._cursor_sprites = None
             logger.debug("Mouse tracking thread stopped")
-            
+
+    def _sample_mouse(self):
+        """Return ``(time, x, y, cursor_state, anim_step, sprite_id)`` with x, y in physical pixels"""
+        sample_time = time.time()
+        # Scale by the device pixel ratio of the screen under the cursor
+        x, y = map_to_physical(self._screens, *pyautogui.position(), self._device_pixel_ratio)
+        return (sample_time, x, y, *self._get_cursor())
+
+    @staticmethod
+    def _interpolate_mouse(samples, frame_time):
+        """
+        Return ``(x, y, cursor_state, anim_step, sprite_id)`` at ``frame_time``.
+        The position is interpolated between the samples around it, the cursor
+        is the one of the sample before it.
+        """
+        after = len(samples)
+        while after > 0 and samples[after - 1][0] > frame_time:
+            after -= 1
+        if after == 0:
+            return samples[0][1:]
+        if after == len(samples):
+            return samples[-1][1:]
+
+        time_0, x_0, y_0, *cursor = samples[after - 1]
+        time_1, x_1, y_1, *_ = samples[after]
+        weight = (frame_time - time_0) / (time_1 - time_0)
+        return (x_0 + (x_1 - x_0) * weight, y_0 + (y_1 - y_0) * weight, *cursor)
+
+    def _record_mouse_events(self, pending, samples, last_frame, click_detection_buffer, click_threshold_frames=5):
+        """
+        Record the mouse events of the pending ``(frame_index, frame_time)``
+        the samples cover, return the last recorded frame index
+        """
+        while pending and samples and pending[0][1] <= samples[-1][0]:
+            frame_index, frame_time = pending.popleft()
+            if frame_index <= last_frame:
+                continue
+
+            x, y, cursor_state, anim_step, sprite_id = self._interpolate_mouse(samples, frame_time)
+            relative_x = (x - self._region[0]) / self._region[2]
+            relative_y = (y - self._region[1]) / self._region[3]
+
+            # Add to click detection buffer, kept at a fixed size
+            click_detection_buffer.append({
+                'frame': frame_index,
+                'position': (relative_x, relative_y),
+                'cursor_state': cursor_state
+            })
+            if len(click_detection_buffer) > click_threshold_frames:
+                click_detection_buffer.pop(0)
+
+            # The replay buffer prunes the events concurrently
+            with self._mouse_events_lock:
+                # Detect clicks by analyzing cursor state transitions and movement
+                self._detect_clicks(click_detection_buffer, frame_index)
+
+                # Store cursor movement
+                self._mouse_events["move"][frame_index] = (
+                    relative_x,
+                    relative_y,
+                    frame_index,
+                    cursor_state,
+                    anim_step,
+                    sprite_id,
+                )
+            self._update_fps("mouse")
+            last_frame = frame_index
+        return last_frame
+
     def _detect_clicks(self, buffer, current_frame):
         """
         Detect clicks based on cursor state changes and position stability.
@@ -478,78 +1547,148 @@ class ScreenRecordingThread:
         x2, y2 = pos2
         return abs(x1 - x2) < threshold and abs(y1 - y2) < threshold
 
-    def _get_ffmpeg_command(self):
+    def _get_ffmpeg_command(self, region=None, output_args=None):
         ffmpeg_path = get_ffmpeg_path()
-        width, height = int(self._region[2]), int(self._region[3])
+        # The region is aligned to even dimensions, so only the macOS JPEG path
+        # still needs a scale filter
+        region = region or self._region
+        width, height = int(region[2]), int(region[3])
         adjusted_width = (width + 1) & ~1
         adjusted_height = (height + 1) & ~1
 
-        if self._os_name == "macos":  # macOS
+        output_args = output_args or self._get_output_args()
+
+        # Cheap lossless intermediate in place of the real time libx264 encode
+        intermediate_args = INTERMEDIATE_CODEC_ARGS if self.uses_intermediate else None
+
+        # Timestamped frames, written only when they change, are encoded as
+        # they come. B-frames would delay the start of each segment and pad
+        # its duration, which gives the frame count on the timeline
+        stream_input_args, stream_output_args = None, None
+        if self._frame_stream is not None and region is None:
+            stream_input_args = ["-f", "matroska", "-i", "-"]
+            stream_output_args = ["-vsync", "passthrough", "-bf", "0"]
+
+        if self._native_capture is not None:  # FFmpeg grabs the screen
+            cmd = [
+                ffmpeg_path,
+                *self._native_capture.ffmpeg_input_args(self._fps),
+                *(intermediate_args or [
+                    "-c:v", "libx264",
+                    "-pix_fmt", "yuv420p",
+                    "-preset", "ultrafast",
+                    "-crf", "23",
+                ]),
+                "-vsync", "1",
+                *output_args
+            ]
+        elif self._os_name == "macos":  # macOS
             cmd = [
                 ffmpeg_path,
-                "-f", "image2pipe",
-                "-framerate", str(self._fps),
-                "-vcodec", "mjpeg",  # MJPEG for macOS
-                "-i", "-",
+                *(stream_input_args or [
+                    "-f", "image2pipe",
+                    "-framerate", str(self._fps),
+                    "-vcodec", "mjpeg",  # MJPEG for macOS
+                    "-i", "-",
+                ]),
                 "-vf", f"scale={adjusted_width}:{adjusted_height}",
                 "-c:v", "h264_videotoolbox",  # Hardware acceleration for macOS
                 "-allow_sw", "1",
                 "-pix_fmt", "yuv420p",
                 "-preset", "fast",
-                "-y",
-                self._output_path
+                *(stream_output_args or []),
+                *output_args
             ]
         elif self._os_name == "linux":  # Linux
             cmd = [
                 ffmpeg_path,
-                "-f", "rawvideo",
-                "-framerate", str(self._fps),
-                "-video_size", f"{width}x{height}",  # Explicitly specify video size
-                "-pixel_format", "bgra",  # Use bgra for python-mss
-                "-i", "-",
-                "-vf", f"scale={adjusted_width}:{adjusted_height}",
-                "-c:v", "libx264",
-                "-preset", "ultrafast",
-                "-crf", "23",
-                "-vsync", "1",  # Help maintain sync
-                "-y",  # Overwrite output file if exists
-                self._output_path
+                *(stream_input_args or [
+                    "-f", "rawvideo",
+                    "-framerate", str(self._fps),
+                    "-video_size", f"{width}x{height}",  # Explicitly specify video size
+                    "-pixel_format", "yuv420p",  # Converted on the capture side
+                    "-i", "-",
+                ]),
+                *(intermediate_args or ["-c:v", "libx264", "-preset", "ultrafast", "-crf", "23"]),
+                *(stream_output_args or ["-vsync", "1"]),  # Help maintain sync
+                *output_args
             ]
         else:  # Windows
             cmd = [
                 ffmpeg_path,
-                "-f", "rawvideo",
-                "-framerate", str(self._fps),
-                "-video_size", f"{width}x{height}",
-                "-pixel_format", "bgra",
-                "-i", "-",
-                "-vf", f"scale={adjusted_width}:{adjusted_height}",
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-qp", "23",
-                "-vsync", "1",  # Help maintain sync
-                "-y",
-                self._output_path
+                *(stream_input_args or [
+                    "-f", "rawvideo",
+                    "-framerate", str(self._fps),
+                    "-video_size", f"{width}x{height}",
+                    "-pixel_format", "yuv420p",
+                    "-i", "-",
+                ]),
+                *(intermediate_args or ["-c:v", "libx264", "-preset", "fast", "-qp", "23"]),
+                *(stream_output_args or ["-vsync", "1"]),  # Help maintain sync
+                *output_args
             ]
         return cmd
 
+    def _get_output_args(self):
+        segment_duration = self.get_segment_duration()
+        if not segment_duration:
+            return ["-y", self.output_path]  # Overwrite output file if exists
+
+        # Roll into fixed length segments, each finalized (the MP4 moov atom
+        # written) when the next one starts. FFmpeg adds a segment to the
+        # manifest only once it is complete, so a crash loses at most the
+        # segment in progress
+        segments_dir = get_segments_dir(self._output_path)
+        os.makedirs(segments_dir, exist_ok=True)
+        # Matroska stores the duration of a variable frame rate segment, which
+        # counts its frames on the timeline, where MP4 counts the encoded ones
+        if self.uses_intermediate or self._frame_stream is not None:
+            extension, segment_format = INTERMEDIATE_EXTENSION, INTERMEDIATE_SEGMENT_FORMAT
+        else:
+            extension, segment_format = "mp4", "mp4"
+        return [
+            "-force_key_frames", f"expr:gte(t,n_forced*{segment_duration})",
+            "-f", "segment",
+            "-segment_time", str(segment_duration),
+            "-segment_format", segment_format,
+            "-reset_timestamps", "1",
+            "-segment_list", get_segment_manifest_path(self._output_path),
+            "-segment_list_type", "ffconcat",
+            # A rolling recording lists only the segments of the replay window
+            *(["-segment_list_size", str(math.ceil(self._replay_window / segment_duration) + 1)]
+              if self._replay_window else []),
+            "-y",
+            os.path.join(segments_dir, f"{SEGMENT_PATTERN}.{extension}")
+        ]
+
     def _get_cursor(self):
         cursor_theme = None
         if self._os_name in ["linux", "macos"]:
             cursor_theme = self._cursor_loader.cursor_theme
 
-        cursor_state, anim_info = get_cursor_state(cursor_theme)
+        # On Linux the exact cursor image is recorded as a sprite, only new
+        # sprites are matched against the theme
+        sprite_id = None
+        if self._cursor_sprites is not None:
+            sprite_id = self._cursor_sprites.get_sprite(cursor_theme)
+            sprite = self._cursor_sprites.sprites[sprite_id]
+            cursor_state, anim_info = sprite["state"], sprite["anim_info"]
+            if sprite_id not in self._mouse_events["sprites"]:
+                self._mouse_events["sprites"][sprite_id] = {"image": sprite["image"], "offset": sprite["offset"]}
+        else:
+            cursor_state, anim_info = get_cursor_state(cursor_theme)
         if self._os_name == "linux" and cursor_state not in self._mouse_events["cursors_map"]:
             self._mouse_events["cursors_map"][cursor_state] = self._cursor_loader.get_cursor(cursor_state)
 
-        # Calculate anim step
+        # Calculate anim step, advanced once per sample
+        self._mouse_sample_index += 1
         anim_step = 0
         if anim_info.get("is_anim", False):
             n_steps = anim_info.get("n_steps", 1)
             if cursor_state not in self._prev_cursor_anim_state:
                 self._prev_cursor_anim_state[cursor_state] = {"frame": -1, "anim_step": 0}
 
-            if self._prev_cursor_anim_state[cursor_state]["frame"] == self._frame_index - 1:
+            if self._prev_cursor_anim_state[cursor_state]["frame"] == self._mouse_sample_index - 1:
                 # The previous frame was the same cursor state
                 prev_anim_step = self._prev_cursor_anim_state[cursor_state]["anim_step"]
                 self._prev_cursor_anim_state[cursor_state]["anim_step"] = (prev_anim_step + 1) % n_steps
@@ -557,9 +1696,35 @@ class ScreenRecordingThread:
                 # The previous frame was not the same cursor state. So reset the anim step
                 self._prev_cursor_anim_state[cursor_state]["anim_step"] = 0
 
-            self._prev_cursor_anim_state[cursor_state]["frame"] = self._frame_index
+            self._prev_cursor_anim_state[cursor_state]["frame"] = self._mouse_sample_index
             anim_step = self._prev_cursor_anim_state[cursor_state]["anim_step"]
-        return cursor_state, anim_step
+        return cursor_state, anim_step, sprite_id
 
     def set_region(self, region):
-        self._region = region
\ No newline at end of file
+        """
+        Set the region to record in physical pixels. Without a region, record
+        the screen under the cursor rather than the whole virtual desktop.
+        Must be called from the GUI thread.
+        """
+        self._screens = get_screens()
+        if not region:
+            region = self._get_cursor_screen_region()
+        self._region = align_region(region)
+        self._extra_regions = []
+
+    def set_regions(self, regions):
+        """
+        Record several regions from a single grab of their bounding rectangle,
+        each to its own video. The first one is the main recording, the others
+        are listed by region_recordings once recorded.
+        """
+        self.set_region(regions[0])
+        self._extra_regions = [align_region(region) for region in regions[1:]]
+
+    def _get_cursor_screen_region(self):
+        screen = find_screen(self._screens, *pyautogui.position())
+        if screen is None and self._screens:
+            screen = self._screens[0]
+        if screen is None:
+            return [0, 0, *self._screen_size]
+        return get_physical_geometry(screen)
\ No newline at end of file
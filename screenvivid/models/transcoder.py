@@ -0,0 +1,85 @@
+import os
+import subprocess
+
+from PySide6.QtCore import Signal, QThread
+
+from screenvivid.models.export import get_codec_config
+from screenvivid.models.utils.segments import is_segment_manifest
+from screenvivid.utils.general import get_os_name, get_ffmpeg_path
+from screenvivid.utils.logging import logger
+
+# Lossless, intra only and multi-threaded by slices: cheap to encode while
+# recording and it keeps text sharp for zooming. FFmpeg stores it in Matroska
+INTERMEDIATE_CODEC_ARGS = ["-c:v", "ffv1", "-level", "3", "-g", "1", "-slices", "16", "-slicecrc", "0"]
+INTERMEDIATE_EXTENSION = "mkv"
+INTERMEDIATE_SEGMENT_FORMAT = "matroska"
+
+class TranscodeThread(QThread):
+    """
+    Transcode a recorded intermediate (a file or a segment manifest) to the
+    editing format with a low priority FFmpeg process. transcoded carries the
+    input and the output path, so receivers can check what was transcoded.
+    With ``fps`` a variable frame rate recording is brought to a constant
+    rate, repeating held frames, so the output has one frame per frame index.
+    """
+    transcoded = Signal(str, str)
+    failed = Signal(str)
+
+    def __init__(self, input_path, output_path, fps=None):
+        super().__init__()
+        self.input_path = input_path
+        self.output_path = output_path
+        self.fps = fps
+        self._process = None
+        self._is_stopped = False
+
+    def _get_ffmpeg_command(self):
+        codec_config = get_codec_config(get_os_name(), "h264")
+        input_args = ["-f", "concat", "-safe", "0"] if is_segment_manifest(self.input_path) else []
+
+        cmd = [get_ffmpeg_path(), "-nostats", "-loglevel", "error", *input_args, "-i", self.input_path]
+        if self.fps:
+            # Unlike -vsync cfr, the filter ends with the duration of the input
+            cmd += ["-vf", f"fps={self.fps}"]
+        cmd += ["-c:v", codec_config["codec"]]
+        for key, value in codec_config["params"].items():
+            cmd += [f"-{key}", value]
+        return cmd + ["-y", self.output_path]
+
+    def run(self):
+        cmd = self._get_ffmpeg_command()
+        logger.info(f"FFmpeg transcode command: {cmd}")
+
+        if get_os_name() == "windows":
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            self._process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                creationflags=subprocess.CREATE_NO_WINDOW | subprocess.BELOW_NORMAL_PRIORITY_CLASS,
+                startupinfo=startupinfo
+            )
+        else:
+            self._process = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stderr=subprocess.PIPE)
+            try:
+                # Leave the CPU to the editor
+                os.setpriority(os.PRIO_PROCESS, self._process.pid, 10)
+            except OSError as e:
+                logger.warning(f"Failed to lower transcode priority: {e}")
+
+        _, stderr = self._process.communicate()
+        if self._is_stopped:
+            logger.info("Transcode cancelled")
+        elif self._process.returncode == 0:
+            logger.info(f"Transcoded {self.input_path} to {self.output_path}")
+            self.transcoded.emit(self.input_path, self.output_path)
+        else:
+            error = stderr.decode(errors="ignore").strip()
+            logger.error(f"Transcode failed with code {self._process.returncode}: {error}")
+            self.failed.emit(error)
+
+    def stop(self):
+        self._is_stopped = True
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
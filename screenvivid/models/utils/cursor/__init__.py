@@ -1,2 +1,3 @@
 from .cursor import CursorLoaderThread
-from .cursor import get_cursor_state
\ No newline at end of file
+from .cursor import get_cursor_state
+from .cursor import CursorSpriteTracker
\ No newline at end of file
@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+
+import numpy as np
+
+from screenvivid.utils.logging import logger
+
+# Bump when the layout of the cache files changes
+CURSOR_CACHE_VERSION = 1
+
+def get_cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "screenvivid", "cursors")
+
+def get_theme_fingerprint(theme_dir, cursor_paths):
+    """Identify a cursor theme by its directory and the size and mtime of its cursor files"""
+    fingerprint = hashlib.sha1(f"{CURSOR_CACHE_VERSION}:{os.path.realpath(theme_dir)}".encode())
+    for cursor_path in sorted(cursor_paths):
+        stat = os.stat(cursor_path)
+        fingerprint.update(f":{os.path.basename(cursor_path)}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return fingerprint.hexdigest()
+
+def _get_cache_paths(theme_dir):
+    name = hashlib.sha1(os.path.realpath(theme_dir).encode()).hexdigest()[:16]
+    cache_path = os.path.join(get_cache_dir(), name)
+    return f"{cache_path}.bin", f"{cache_path}.json"
+
+def load_theme_cache(theme_dir, fingerprint):
+    """
+    Return the cached cursor theme, with the images as read-only views of one
+    memory-mapped file, or None if the theme changed since it was cached.
+    """
+    data_path, index_path = _get_cache_paths(theme_dir)
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+        if index["fingerprint"] != fingerprint:
+            return None
+        data = np.memmap(data_path, dtype=np.uint8, mode="r").view(np.ndarray) if index["cursors"] else None
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug(f"No usable cursor theme cache for {theme_dir}: {e}")
+        return None
+
+    cursor_theme = {}
+    for cursor in index["cursors"]:
+        height, width = cursor["shape"]
+        image = data[cursor["offset"]:cursor["offset"] + height * width * 4].reshape((height, width, 4))
+        cursor_theme.setdefault(cursor["size"], {}).setdefault(cursor["state"], []).append({
+            "image": image,
+            "offset": tuple(cursor["hotspot"])
+        })
+    return cursor_theme
+
+def save_theme_cache(theme_dir, fingerprint, cursor_theme):
+    """Store the cursor images in one flat file and their layout in a JSON index"""
+    data_path, index_path = _get_cache_paths(theme_dir)
+    cursors = []
+    offset = 0
+    try:
+        os.makedirs(os.path.dirname(data_path), exist_ok=True)
+        with open(f"{data_path}.tmp", "wb") as f:
+            for size, states in cursor_theme.items():
+                for state, images in states.items():
+                    for cursor in images:
+                        image = np.ascontiguousarray(cursor["image"], dtype=np.uint8)
+                        f.write(image.tobytes())
+                        cursors.append({
+                            "size": size,
+                            "state": state,
+                            "offset": offset,
+                            "shape": image.shape[:2],
+                            "hotspot": list(cursor["offset"]),
+                        })
+                        offset += image.nbytes
+        with open(f"{index_path}.tmp", "w") as f:
+            json.dump({"fingerprint": fingerprint, "cursors": cursors}, f)
+
+        # Drop the old index first and write the new one last, so an index
+        # never describes a data file it was not written with
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        os.replace(f"{data_path}.tmp", data_path)
+        os.replace(f"{index_path}.tmp", index_path)
+    except OSError as e:
+        logger.warning(f"Failed to cache cursor theme {theme_dir}: {e}")
@@ -1,6 +1,10 @@
+import struct
+import hashlib
 import platform
 import time
 
+import numpy as np
+
 from PySide6.QtCore import Property, QThread
 
 from .loader import CursorLoader
@@ -64,6 +68,96 @@ def get_cursor_state_windows():
     logger.debug(f"{state} cursor found.")
     return state, anim_info
 
+class CursorSpriteTracker:
+    """
+    Track the exact cursor image on Linux. Each distinct image is stored once
+    in ``sprites``, keyed by a sprite id, with its hotspot and the theme state
+    it matches. The image is only fetched from the X server when XFixes
+    reports a cursor it has not seen yet, so an unchanged cursor costs no
+    more than draining the event queue. Use from a single thread.
+    """
+    AVAILABLE_ANIM_CURSORS = ["wait", "progress", "watch"]
+
+    def __init__(self):
+        from Xlib import display
+        from Xlib.ext import xfixes
+
+        self.sprites = {}
+        self._sprite_ids = {}  # Image hash to sprite id
+        self._serials = {}  # XFixes cursor serial to sprite id
+        self._sprite_id = None
+
+        self._display = display.Display()
+        if not self._display.has_extension("XFIXES"):
+            self._display.close()
+            raise RuntimeError("XFIXES extension not supported.")
+        self._display.xfixes_query_version()
+        self._root = self._display.screen().root
+        self._display.xfixes_select_cursor_input(self._root, xfixes.XFixesDisplayCursorNotifyMask)
+        self._display.flush()
+
+    def get_sprite(self, cursor_theme):
+        """Return the sprite id of the current cursor"""
+        changed = self._sprite_id is None
+        while self._display.pending_events():
+            event = self._display.next_event()
+            serial = getattr(event, "cursor_serial", None)
+            if serial is None:
+                continue
+            changed = True
+            if serial in self._serials:
+                self._sprite_id = self._serials[serial]
+                changed = False
+
+        if changed:
+            self._sprite_id = self._add_sprite(self._display.xfixes_get_cursor_image(self._root), cursor_theme)
+        return self._sprite_id
+
+    def _add_sprite(self, image, cursor_theme):
+        width, height = image.width, image.height
+        # Little endian ARGB words are BGRA bytes
+        bgra = np.array(image.cursor_image, dtype="<u4").reshape(height, width).view(np.uint8).reshape(height, width, 4)
+
+        key = hashlib.blake2b(bgra.tobytes(), digest_size=16, person=struct.pack("<HH", width, height)).digest()
+        sprite_id = self._sprite_ids.get(key)
+        if sprite_id is None:
+            sprite_id = len(self.sprites)
+            cursor_state, anim_info = match_cursor_state(bgra, cursor_theme, self.AVAILABLE_ANIM_CURSORS)
+            self.sprites[sprite_id] = {
+                "image": bgra,
+                "offset": (image.xhot, image.yhot),
+                "state": cursor_state,
+                "anim_info": anim_info,
+            }
+            self._sprite_ids[key] = sprite_id
+            logger.debug(f"New cursor sprite {sprite_id}: {cursor_state}, {width}x{height}")
+
+        self._serials[image.cursor_serial] = sprite_id
+        return sprite_id
+
+    def close(self):
+        try:
+            self._display.close()
+        except Exception:
+            pass
+
+def match_cursor_state(bgra, cursor_theme, anim_cursors):
+    """Match a cursor image against the cursor theme, falling back to arrow"""
+    anim_info = {
+        "is_anim": False,
+        "n_steps": 1,
+    }
+    height, width = bgra.shape[:2]
+    if cursor_theme and width in cursor_theme:
+        for cursor_state, cursors in cursor_theme[width].items():
+            for cursor_info in cursors:
+                if np.array_equal(bgra, cursor_info["image"]):
+                    if cursor_state in anim_cursors:
+                        anim_info["is_anim"] = True
+                        anim_info["n_steps"] = len(cursors)
+                    return cursor_state, anim_info
+    return "arrow", anim_info
+
 def get_cursor_state_linux(cursor_theme):
     from Xlib import display
     import numpy as np
@@ -90,27 +184,10 @@ def get_cursor_state_linux(cursor_theme):
     bgra[..., 2] = (cursor_data >> 16) & 0xFF  # Red
     bgra[..., 3] = (cursor_data >> 24) & 0xFF  # Alpha
 
-    anim_info = {
-        "is_anim": False,
-        "n_steps": 1,
-    }
-
     # Match the rgba image with the 24x24 image in the cursor theme
-    AVAILABLE_ANIM_CURSORS = ["wait", "progress", "watch"]
-    if width in cursor_theme:
-        for cursor_state, cursors  in cursor_theme[width].items():
-            total_cursors = len(cursors)
-            for cursor_info in cursors:
-                if np.array_equal(bgra, cursor_info["image"]):
-                    logger.debug(f"{cursor_state} cursor found.")
-                    if cursor_state in AVAILABLE_ANIM_CURSORS:
-                        logger.debug(f"{cursor_state} cursor is an animation cursor.")
-                        anim_info["is_anim"] = True
-                        anim_info["n_steps"] = total_cursors
-                    return cursor_state, anim_info
-
-    logger.debug(f"No cursor found fallback to arrow.")
-    return "arrow", anim_info
+    cursor_state, anim_info = match_cursor_state(bgra, cursor_theme, ["wait", "progress", "watch"])
+    logger.debug(f"{cursor_state} cursor found.")
+    return cursor_state, anim_info
 
 def get_cursor_state_macos(cursor_theme):
     import AppKit
@@ -7,6 +7,7 @@ from typing import Tuple, Any, List
 import cv2
 import numpy as np
 
+from .cache import get_theme_fingerprint, load_theme_cache, save_theme_cache
 from screenvivid.utils.general import get_os_name
 from screenvivid.utils.logging import logger
 
@@ -161,12 +162,21 @@ class LinuxCursorLoader:
         logger.debug(f"Cursor theme: {cursor_theme}, directory: {cursor_theme_dir}")
 
         if cursor_theme_dir:
+            cursor_paths = {}
             for state in self.states:
                 cursor_path = os.path.join(cursor_theme_dir, "cursors", state)
-
-                if not os.path.exists(cursor_path):
-                    continue
-
+                if os.path.exists(cursor_path):
+                    cursor_paths[state] = cursor_path
+
+            # Parsing the Xcursor files is slow, reuse the images parsed last time
+            fingerprint = get_theme_fingerprint(cursor_theme_dir, cursor_paths.values())
+            cursor_theme_cache = load_theme_cache(cursor_theme_dir, fingerprint)
+            if cursor_theme_cache is not None:
+                logger.debug("Cursor theme loaded from cache")
+                self.cursor_theme = cursor_theme_cache
+                return self.cursor_theme
+
+            for state, cursor_path in cursor_paths.items():
                 cursors = load_xcursor(cursor_path)
                 if not cursors:
                     continue
@@ -183,6 +193,8 @@ class LinuxCursorLoader:
                         "offset": cursor_offset
                     })
 
+            save_theme_cache(cursor_theme_dir, fingerprint, self.cursor_theme)
+
         return self.cursor_theme
 
     def get_cursor(self, state):
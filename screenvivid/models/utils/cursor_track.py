@@ -0,0 +1,138 @@
+import numpy as np
+
+CURSOR_SMOOTHING_MODES = (None, "exponential", "spline")
+
+class CursorTrack:
+    """
+    Cursor position, state, animation step and sprite for every frame of a
+    recording, baked once from the sparse move events so rendering a frame is
+    only array indexing. Frames missing between two samples are interpolated,
+    gaps longer than ``max_gap`` frames (the cursor left the recorded region)
+    stay empty.
+    """
+    def __init__(self, move_data, total_frames=None, smoothing=None, smoothing_factor=0.5, max_gap=30):
+        if smoothing not in CURSOR_SMOOTHING_MODES:
+            raise ValueError(f"Unknown cursor smoothing: {smoothing}")
+
+        self.smoothing = smoothing
+        self.max_gap = max_gap
+        self.states = []
+
+        frames = np.array(sorted(int(frame) for frame in move_data), dtype=np.int64)
+        if total_frames is None:
+            total_frames = int(frames[-1]) + 1 if len(frames) else 0
+        frames = frames[frames < total_frames]
+
+        self.x = np.zeros(total_frames, dtype=np.float32)
+        self.y = np.zeros(total_frames, dtype=np.float32)
+        self.state = np.zeros(total_frames, dtype=np.int16)
+        self.anim_step = np.zeros(total_frames, dtype=np.int16)
+        self.sprite = np.full(total_frames, -1, dtype=np.int32)
+        self.valid = np.zeros(total_frames, dtype=bool)
+        if not len(frames):
+            return
+
+        sample_x, sample_y, sample_state, sample_anim, sample_sprite = self._unpack(move_data, frames)
+
+        # Frames between two samples are covered unless the gap is too long
+        span = np.arange(frames[0], frames[-1] + 1)
+        segment = np.searchsorted(frames, span, side="right") - 1
+        gap = frames[np.minimum(segment + 1, len(frames) - 1)] - frames[segment]
+        covered = span[(span == frames[segment]) | (gap <= max_gap + 1)]
+        self.valid[covered] = True
+
+        # Discrete fields hold the last sample
+        sample_index = segment[covered - frames[0]]
+        self.state[covered] = sample_state[sample_index]
+        self.anim_step[covered] = sample_anim[sample_index]
+        self.sprite[covered] = sample_sprite[sample_index]
+
+        if smoothing == "spline":
+            self.x[covered] = self._catmull_rom(frames, sample_x, covered)
+            self.y[covered] = self._catmull_rom(frames, sample_y, covered)
+        else:
+            self.x[covered] = np.interp(covered, frames, sample_x)
+            self.y[covered] = np.interp(covered, frames, sample_y)
+            if smoothing == "exponential":
+                for start, end in self._runs():
+                    self.x[start:end] = self._exponential(self.x[start:end], smoothing_factor)
+                    self.y[start:end] = self._exponential(self.y[start:end], smoothing_factor)
+
+    def _unpack(self, move_data, frames):
+        """Return the sample arrays of ``move_data`` at ``frames``"""
+        state_ids = {}
+        sample_x = np.empty(len(frames), dtype=np.float64)
+        sample_y = np.empty(len(frames), dtype=np.float64)
+        sample_state = np.empty(len(frames), dtype=np.int16)
+        sample_anim = np.empty(len(frames), dtype=np.int16)
+        sample_sprite = np.empty(len(frames), dtype=np.int32)
+        for i, frame in enumerate(frames):
+            # Metadata loaded from json has string keys
+            event = move_data[frame] if frame in move_data else move_data[str(frame)]
+            x, y, _, cursor_state, anim_step, *rest = event
+            if cursor_state not in state_ids:
+                state_ids[cursor_state] = len(self.states)
+                self.states.append(cursor_state)
+            sample_x[i] = x
+            sample_y[i] = y
+            sample_state[i] = state_ids[cursor_state]
+            sample_anim[i] = anim_step
+            sample_sprite[i] = rest[0] if rest and rest[0] is not None else -1
+        return sample_x, sample_y, sample_state, sample_anim, sample_sprite
+
+    def _runs(self):
+        """Return the (start, end) frame ranges where the cursor is shown"""
+        edges = np.diff(np.concatenate(([0], self.valid.astype(np.int8), [0])))
+        return zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1))
+
+    @staticmethod
+    def _exponential(values, factor):
+        """
+        Exponential moving average of ``values``, as a convolution with the
+        truncated decaying kernel so it runs without a Python loop per frame
+        """
+        if factor >= 1:
+            return values
+        # Weights below 1e-3 are dropped
+        length = min(len(values), int(np.ceil(np.log(1e-3) / np.log(1 - factor))))
+        kernel = factor * (1 - factor) ** np.arange(length)
+        kernel /= kernel.sum()
+        padded = np.concatenate((np.full(length - 1, values[0]), values))
+        return np.convolve(padded, kernel, mode="valid").astype(values.dtype)
+
+    @staticmethod
+    def _catmull_rom(frames, values, at):
+        """Uniform Catmull-Rom spline through the samples, evaluated at ``at``"""
+        segment = np.clip(np.searchsorted(frames, at, side="right") - 1, 0, len(frames) - 1)
+        following = np.minimum(segment + 1, len(frames) - 1)
+        span = np.maximum(frames[following] - frames[segment], 1)
+        t = (at - frames[segment]) / span
+
+        # Tangents from the neighbouring samples, clamped at the ends
+        p0 = values[np.maximum(segment - 1, 0)]
+        p1 = values[segment]
+        p2 = values[following]
+        p3 = values[np.minimum(segment + 2, len(frames) - 1)]
+        t2 = t * t
+        t3 = t2 * t
+        return 0.5 * (
+            2 * p1 + (p2 - p0) * t
+            + (2 * p0 - 5 * p1 + 4 * p2 - p3) * t2
+            + (3 * p1 - p0 - 3 * p2 + p3) * t3
+        )
+
+    def __len__(self):
+        return len(self.valid)
+
+    def get(self, frame):
+        """Return ``(x, y, cursor_state, anim_step, sprite_id)`` at ``frame``, or None without a cursor"""
+        if not 0 <= frame < len(self.valid) or not self.valid[frame]:
+            return None
+        sprite_id = int(self.sprite[frame])
+        return (
+            float(self.x[frame]),
+            float(self.y[frame]),
+            self.states[self.state[frame]],
+            int(self.anim_step[frame]),
+            sprite_id if sprite_id >= 0 else None,
+        )
@@ -0,0 +1,121 @@
+import struct
+
+# Element IDs, see the Matroska specification
+EBML = b"\x1a\x45\xdf\xa3"
+EBML_VERSION = b"\x42\x86"
+EBML_READ_VERSION = b"\x42\xf7"
+EBML_MAX_ID_LENGTH = b"\x42\xf2"
+EBML_MAX_SIZE_LENGTH = b"\x42\xf3"
+DOC_TYPE = b"\x42\x82"
+DOC_TYPE_VERSION = b"\x42\x87"
+DOC_TYPE_READ_VERSION = b"\x42\x85"
+SEGMENT = b"\x18\x53\x80\x67"
+INFO = b"\x15\x49\xa9\x66"
+TIMESTAMP_SCALE = b"\x2a\xd7\xb1"
+MUXING_APP = b"\x4d\x80"
+WRITING_APP = b"\x57\x41"
+TRACKS = b"\x16\x54\xae\x6b"
+TRACK_ENTRY = b"\xae"
+TRACK_NUMBER = b"\xd7"
+TRACK_UID = b"\x73\xc5"
+TRACK_TYPE = b"\x83"
+CODEC_ID = b"\x86"
+DEFAULT_DURATION = b"\x23\xe3\x83"
+VIDEO = b"\xe0"
+PIXEL_WIDTH = b"\xb0"
+PIXEL_HEIGHT = b"\xba"
+COLOUR_SPACE = b"\x2e\xb5\x24"
+CLUSTER = b"\x1f\x43\xb6\x75"
+TIMESTAMP = b"\xe7"
+SIMPLE_BLOCK = b"\xa3"
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+# Timestamps in milliseconds
+TIMESTAMP_SCALE_NS = 1000000
+
+# Codec ID and FourCC of each piped pixel format
+CODECS = {
+    "yuv420p": (b"V_UNCOMPRESSED", b"I420"),
+    "jpeg": (b"V_MJPEG", None),
+}
+
+def encode_size(size):
+    """EBML variable length integer, the all ones value of each length is reserved"""
+    for length in range(1, 9):
+        if size < (1 << (7 * length)) - 1:
+            return (size | (1 << (7 * length))).to_bytes(length, "big")
+    raise ValueError(f"Element size {size} is too large")
+
+def encode_element(element_id, payload):
+    return element_id + encode_size(len(payload)) + payload
+
+def encode_uint(element_id, value):
+    return encode_element(element_id, value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big"))
+
+class MatroskaFrameStream:
+    """
+    Live Matroska stream of a single video track, the way the recorder pipes
+    timestamped frames to FFmpeg. The segment has an unknown size and each
+    frame is a cluster of its own, so the stream needs no seeking and a frame
+    can be written as soon as it is captured. Only the small headers are built
+    here, the frame bytes are written after them as they are.
+    """
+    def __init__(self, width, height, fps, pixel_format):
+        if pixel_format not in CODECS:
+            raise ValueError(f"Unsupported pixel format: {pixel_format}")
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.pixel_format = pixel_format
+
+    def get_timestamp(self, frame_index):
+        """Time of a frame index in milliseconds"""
+        return round(frame_index * 1000 / self.fps)
+
+    def is_segment_edge(self, frame_index, segment_duration):
+        """
+        Whether a frame index is the first or the last one of a segment when
+        FFmpeg cuts ``segment_duration`` seconds segments at forced keyframes
+        """
+        duration = segment_duration * 1000
+        previous, current, following = (
+            self.get_timestamp(index) // duration for index in (frame_index - 1, frame_index, frame_index + 1)
+        )
+        return previous < current or current < following
+
+    def header(self):
+        codec_id, colour_space = CODECS[self.pixel_format]
+        ebml = encode_element(EBML, b"".join([
+            encode_uint(EBML_VERSION, 1),
+            encode_uint(EBML_READ_VERSION, 1),
+            encode_uint(EBML_MAX_ID_LENGTH, 4),
+            encode_uint(EBML_MAX_SIZE_LENGTH, 8),
+            encode_element(DOC_TYPE, b"matroska"),
+            encode_uint(DOC_TYPE_VERSION, 4),
+            encode_uint(DOC_TYPE_READ_VERSION, 2),
+        ]))
+        info = encode_element(INFO, b"".join([
+            encode_uint(TIMESTAMP_SCALE, TIMESTAMP_SCALE_NS),
+            encode_element(MUXING_APP, b"ScreenVivid"),
+            encode_element(WRITING_APP, b"ScreenVivid"),
+        ]))
+        video = encode_uint(PIXEL_WIDTH, self.width) + encode_uint(PIXEL_HEIGHT, self.height)
+        if colour_space:
+            video += encode_element(COLOUR_SPACE, colour_space)
+        track = encode_element(TRACK_ENTRY, b"".join([
+            encode_uint(TRACK_NUMBER, 1),
+            encode_uint(TRACK_UID, 1),
+            encode_uint(TRACK_TYPE, 1),  # Video
+            encode_element(CODEC_ID, codec_id),
+            encode_uint(DEFAULT_DURATION, round(1e9 / self.fps)),
+            encode_element(VIDEO, video),
+        ]))
+        return ebml + SEGMENT + UNKNOWN_SIZE + info + encode_element(TRACKS, track)
+
+    def frame_header(self, frame_index, size):
+        """Cluster and block headers of a ``size`` bytes frame, the frame follows them"""
+        # Track 1, no offset from the cluster timestamp, keyframe
+        block_header = encode_size(1) + struct.pack(">hB", 0, 0x80)
+        block = SIMPLE_BLOCK + encode_size(len(block_header) + size) + block_header
+        timestamp = encode_uint(TIMESTAMP, self.get_timestamp(frame_index))
+        return CLUSTER + encode_size(len(timestamp) + len(block) + size) + timestamp + block
@@ -0,0 +1,60 @@
+from PySide6.QtGui import QGuiApplication
+
+def get_screens():
+    """
+    Return the logical geometry and the device pixel ratio of every screen
+    known to Qt, primary screen first. Must be called from the GUI thread.
+    """
+    app = QGuiApplication.instance()
+    if app is None:
+        return []
+
+    screens = []
+    for screen in [app.primaryScreen()] + [s for s in app.screens() if s != app.primaryScreen()]:
+        if screen is None:
+            continue
+        geometry = screen.geometry()
+        screens.append({
+            "name": screen.name(),
+            "geometry": [geometry.x(), geometry.y(), geometry.width(), geometry.height()],
+            "device_pixel_ratio": screen.devicePixelRatio(),
+        })
+    return screens
+
+def find_screen(screens, x, y):
+    """Return the screen containing a logical point, None if it is off screen"""
+    for screen in screens:
+        left, top, width, height = screen["geometry"]
+        if left <= x < left + width and top <= y < top + height:
+            return screen
+    return None
+
+def map_to_physical(screens, x, y, device_pixel_ratio=1.0):
+    """
+    Map a logical point to physical pixels. Qt keeps the top left corner of
+    each screen at its native position and scales offsets within the screen
+    by its own device pixel ratio, so screens with different ratios map
+    differently. Points off every screen use ``device_pixel_ratio``.
+    """
+    screen = find_screen(screens, x, y)
+    if screen is None:
+        return x * device_pixel_ratio, y * device_pixel_ratio
+
+    left, top = screen["geometry"][:2]
+    ratio = screen["device_pixel_ratio"]
+    return left + (x - left) * ratio, top + (y - top) * ratio
+
+def map_region_to_physical(screens, region, device_pixel_ratio=1.0):
+    """Map a logical [left, top, width, height] region, sized by the screen of its top left corner"""
+    left, top, width, height = region
+    screen = find_screen(screens, left, top)
+    ratio = screen["device_pixel_ratio"] if screen else device_pixel_ratio
+    physical_left, physical_top = map_to_physical(screens, left, top, device_pixel_ratio)
+    return [
+        int(round(physical_left)), int(round(physical_top)),
+        int(round(width * ratio)), int(round(height * ratio))
+    ]
+
+def get_physical_geometry(screen):
+    """The [left, top, width, height] rectangle of a screen in physical pixels"""
+    return map_region_to_physical([screen], screen["geometry"])
@@ -0,0 +1,204 @@
+import os
+import shutil
+
+import cv2
+
+from screenvivid.utils.general import safe_delete
+from screenvivid.utils.logging import logger
+
+SEGMENT_MANIFEST_NAME = "manifest.ffconcat"
+SEGMENT_PATTERN = "segment_%05d"
+
+def get_segments_dir(output_path):
+    """Directory holding the segments of a recording written to ``output_path``"""
+    root, _ = os.path.splitext(output_path)
+    return f"{root}_segments"
+
+def get_segment_manifest_path(output_path):
+    return os.path.join(get_segments_dir(output_path), SEGMENT_MANIFEST_NAME)
+
+def is_segment_manifest(path):
+    return bool(path) and path.endswith(".ffconcat")
+
+def delete_recording(path):
+    """Delete a recorded video file, or a manifest along with its segments"""
+    if not is_segment_manifest(path):
+        safe_delete(path)
+        return
+
+    segments_dir = os.path.dirname(path)
+    if os.path.isdir(segments_dir):
+        try:
+            shutil.rmtree(segments_dir)
+        except OSError:
+            logger.warning(f"Failed to remove {segments_dir}")
+
+def read_segment_manifest(manifest_path):
+    """
+    Return the segment paths listed in an ffconcat manifest. FFmpeg only lists
+    a segment once it is complete, so every listed segment is playable.
+    """
+    segments_dir = os.path.dirname(manifest_path)
+    segments = []
+    if not os.path.exists(manifest_path):
+        return segments
+
+    with open(manifest_path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith("file "):
+                continue
+            name = line[len("file "):].strip().strip("'")
+            segments.append(os.path.join(segments_dir, name))
+    return segments
+
+class SegmentedVideoCapture:
+    """
+    Read the segments of a recording as one continuous video, without muxing
+    them first. Implements the subset of the cv2.VideoCapture interface the
+    editor and the exporter use.
+
+    Frames are placed on the timeline by their timestamps and held until the
+    next one, so variable frame rate segments, which only hold the frames that
+    changed, read back one frame per frame index. Their frame count comes from
+    the Matroska duration, which spans the whole segment.
+    """
+    def __init__(self, manifest_path):
+        self._manifest_path = manifest_path
+        self._segments = []  # (path, first frame, frame count)
+        self._properties = {}
+        self._total_frames = 0
+        self._position = 0
+        self._capture = None
+        self._capture_index = -1
+        self._seek = False
+        # (frame index in the segment, frame) of the frame shown and the next decoded one
+        self._held = None
+        self._next = None
+        self._ended = False
+        self.refresh()
+
+    def refresh(self):
+        """Pick up segments completed since the manifest was last read"""
+        known = {path for path, _, _ in self._segments}
+        for path in read_segment_manifest(self._manifest_path):
+            if path in known:
+                continue
+
+            capture = cv2.VideoCapture(path)
+            if not capture.isOpened():
+                logger.warning(f"Skipping unreadable segment {path}")
+                continue
+
+            frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            if not self._properties:
+                for prop in (cv2.CAP_PROP_FPS, cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+                    self._properties[prop] = capture.get(prop)
+            capture.release()
+
+            self._segments.append((path, self._total_frames, frame_count))
+            self._total_frames += frame_count
+        return self._total_frames
+
+    def isOpened(self):
+        return bool(self._segments)
+
+    def get(self, prop):
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self._total_frames)
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._position)
+        return self._properties.get(prop, 0.0)
+
+    def set(self, prop, value):
+        if prop != cv2.CAP_PROP_POS_FRAMES:
+            return False
+        self._position = max(0, min(int(value), self._total_frames))
+        self._seek = True
+        return True
+
+    def _find_segment(self, position):
+        for index, (_, first_frame, frame_count) in enumerate(self._segments):
+            if first_frame <= position < first_frame + frame_count:
+                return index
+        return None
+
+    def _open_segment(self, index, frame_index):
+        """Open a segment to read from ``frame_index``, counted from its start"""
+        if self._capture is not None:
+            self._capture.release()
+        path, _, _ = self._segments[index]
+        self._capture = cv2.VideoCapture(path)
+        self._capture_index = index
+        self._held = self._next = None
+        self._ended = False
+        if frame_index <= 0:
+            return
+
+        # The seek lands on the frame in a constant frame rate segment. It
+        # counts frames, so in a variable frame rate one it can land past the
+        # frame, which is then decoded from the start of the segment
+        self._capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        self._read_next()
+        if self._next is None or self._next[0] > frame_index:
+            self._capture.release()
+            self._capture = cv2.VideoCapture(path)
+            self._next = None
+            self._ended = False
+
+    def _read_next(self):
+        ret, frame = self._capture.read()
+        if not ret:
+            self._next = None
+            self._ended = True
+            return
+        timestamp = self._capture.get(cv2.CAP_PROP_POS_MSEC)
+        self._next = (round(timestamp * self._properties[cv2.CAP_PROP_FPS] / 1000), frame)
+
+    def _decode(self, frame_index):
+        """Return the frame shown at ``frame_index`` of the open segment, None if it has none"""
+        while True:
+            if self._next is None and not self._ended:
+                self._read_next()
+            if self._next is None or (self._next[0] > frame_index and self._held is not None):
+                break
+            self._held, self._next = self._next, None
+
+        if self._held is None:
+            return None
+        # A held frame is shown again, the caller gets a copy it can draw on
+        if self._next is not None and self._next[0] <= frame_index + 1:
+            return self._held[1]
+        return self._held[1].copy()
+
+    def read(self):
+        while self._position < self._total_frames:
+            index = self._find_segment(self._position)
+            if index is None:
+                break
+
+            _, first_frame, frame_count = self._segments[index]
+            if index != self._capture_index or self._seek:
+                self._open_segment(index, self._position - first_frame)
+                self._seek = False
+
+            frame = self._decode(self._position - first_frame)
+            if frame is not None:
+                self._position += 1
+                return True, frame
+
+            # The segment holds no readable frame
+            self._position = first_frame + frame_count
+        return False, None
+
+    def release(self):
+        if self._capture is not None:
+            self._capture.release()
+            self._capture = None
+            self._capture_index = -1
+
+def open_video_capture(path):
+    """Open a video file or a segment manifest"""
+    if is_segment_manifest(path):
+        return SegmentedVideoCapture(path)
+    return cv2.VideoCapture(path)
@@ -2,33 +2,222 @@ import json
 import glob
 import os
 import sys
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
+from threading import Lock, local
 
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFilter
 
+from screenvivid.models.utils.cursor_track import CursorTrack
 from screenvivid.utils.general import hex_to_rgb, create_gradient_image, get_os_name
 from screenvivid.utils.logging import logger
 
+def divide_by_255(values, scratch=None):
+    """
+    Divide uint16 ``values`` of at most 255 * 255 by 255 in place, rounded to
+    the nearest integer with shifts instead of a float division
+    """
+    values += 128
+    if scratch is None:
+        values += values >> 8
+    else:
+        np.right_shift(values, 8, out=scratch)
+        values += scratch
+    values >>= 8
+    return values
+
+def blend_alpha(foreground, background, alpha, inverse_alpha):
+    """Blend uint8 images with uint16 ``alpha`` and ``255 - alpha`` masks in integers"""
+    blended = foreground * alpha
+    blended += background * inverse_alpha
+    return divide_by_255(blended)
+
+class BufferPool:
+    """
+    Preallocated arrays for the render pipeline, keyed by name, shape and
+    dtype, so a steady stream of same-sized frames allocates nothing. Each
+    thread gets its own buffers, and a buffer is only valid until the same
+    thread asks for it again.
+    """
+    def __init__(self):
+        self._local = local()
+        self._generation = 0
+
+    def get(self, name, shape, dtype=np.uint8):
+        """Return the buffer for ``name``, allocating it the first time or when the shape changed"""
+        if getattr(self._local, "generation", None) != self._generation:
+            self._local.buffers = {}
+            self._local.generation = self._generation
+
+        key = (name, tuple(shape), np.dtype(dtype))
+        buffer = self._local.buffers.get(key)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=dtype)
+            self._local.buffers[key] = buffer
+        return buffer
+
+    def clear(self):
+        """Drop every buffer, in all threads, on their next use"""
+        self._generation += 1
+
+# Tiled frames are sampled in blocks of this many canvas rows, and stripes
+# are made of whole blocks, so the output does not depend on the stripe count
+TILE_BLOCK_HEIGHT = 64
+
+_tile_executor = None
+_tile_executor_lock = Lock()
+
+def get_tile_executor():
+    """Return the persistent thread pool that renders stripes of a frame"""
+    global _tile_executor
+    with _tile_executor_lock:
+        if _tile_executor is None:
+            _tile_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="render-tile")
+        return _tile_executor
+
+def split_rows(height, tiles):
+    """Split ``height`` rows into at most ``tiles`` horizontal stripes of whole blocks"""
+    blocks = -(-height // TILE_BLOCK_HEIGHT)
+    tiles = max(1, min(tiles, blocks))
+    bounds = np.minimum(np.linspace(0, blocks, tiles + 1).astype(int) * TILE_BLOCK_HEIGHT, height)
+    return tuple(slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:]))
+
+def get_camera_matrix(camera, canvas_size):
+    """
+    Return the affine map from output to canvas pixels for ``camera``, an
+    ``(x, y, scale)`` zoom centered on normalized canvas coordinates. The view
+    is kept inside the canvas and keeps its sub-pixel position.
+    """
+    x, y, scale = camera
+    width, height = canvas_size
+    view_width, view_height = width / scale, height / scale
+    left = min(max(x * width - view_width / 2, 0), width - view_width)
+    top = min(max(y * height - view_height / 2, 0), height - view_height)
+
+    # Output pixel centers sample the canvas with the convention of cv2.resize
+    return np.float64([
+        [1 / scale, 0, left + 0.5 / scale - 0.5],
+        [0, 1 / scale, top + 0.5 / scale - 0.5],
+    ])
+
+def get_output_span(start, stop, matrix_scale, matrix_offset, size):
+    """Return the output pixels whose centers fall on canvas pixels ``start`` to ``stop``"""
+    first = int(np.ceil((start - 0.5 - matrix_offset) / matrix_scale))
+    last = int(np.ceil((stop - 0.5 - matrix_offset) / matrix_scale))
+    return min(max(first, 0), size), min(max(last, 0), size)
+
 class BaseTransform:
+    # Layout-only transforms are folded into the render plan and skipped per frame
+    per_frame = True
+
     def __init__(self):
         pass
 
+    def compile(self, **kwargs):
+        """Add the layout this transform derives from the settings and input size"""
+        return kwargs
+
     def __call__(self, **kwargs):
         raise NotImplementedError('Transform __call__ method must be implemented.')
 
+class RenderPlan(namedtuple("RenderPlan", [
+    "input_size", "canvas_size", "foreground_rect", "aspect_ratio_float",
+    "border_shadow", "foreground_alpha", "shadow_alpha", "background",
+    "static_layer", "corner_masks", "tiles",
+])):
+    """
+    Layout of the output for one set of settings and input size: the canvas
+    size, the foreground rectangle ``(x, y, width, height)`` and references to
+    the masks and background image, computed once by ``Compose.compile``.
+    ``static_layer`` is the background with the drop shadow already applied,
+    ``tiles`` the row stripes the canvas is rendered in.
+    """
+    __slots__ = ()
+
+    def to_kwargs(self):
+        """Keyword arguments the per-frame transforms read"""
+        x_offset, y_offset, foreground_width, foreground_height = self.foreground_rect
+        kwargs = {
+            "render_plan": self,
+            "background_width": self.canvas_size[0],
+            "background_height": self.canvas_size[1],
+            "foreground_width": foreground_width,
+            "foreground_height": foreground_height,
+            "x_offset": x_offset,
+            "y_offset": y_offset,
+            "aspect_ratio_float": self.aspect_ratio_float,
+        }
+        if self.border_shadow is not None:
+            kwargs["border_radius"] = self.border_shadow.border_radius
+            kwargs["border_shadow"] = self.border_shadow
+        return kwargs
+
 class Compose(BaseTransform):
-    def __init__(self, transforms):
+    def __init__(self, transforms, tiles=1):
         super().__init__()
 
         self.transforms = transforms
+        self.buffers = BufferPool()
+        self._tiles = tiles
+        self._plan = None
+
+    @property
+    def tiles(self):
+        return self._tiles
+
+    @tiles.setter
+    def tiles(self, value):
+        self._tiles = value
+        self._plan = None
+
+    def compile(self, input_width, input_height):
+        """Run the layout stage of every transform and return the resulting plan"""
+        kwargs = {"input_width": input_width, "input_height": input_height}
+        for _, t in self.transforms.items():
+            kwargs = t.compile(**kwargs)
+
+        return RenderPlan(
+            input_size=(input_width, input_height),
+            canvas_size=(kwargs["background_width"], kwargs["background_height"]),
+            foreground_rect=(
+                kwargs.get("x_offset", 0), kwargs.get("y_offset", 0),
+                kwargs["foreground_width"], kwargs["foreground_height"]
+            ),
+            aspect_ratio_float=kwargs["aspect_ratio_float"],
+            border_shadow=kwargs.get("border_shadow"),
+            foreground_alpha=kwargs.get("foreground_alpha"),
+            shadow_alpha=kwargs.get("shadow_alpha"),
+            background=kwargs.get("background_image"),
+            static_layer=kwargs.get("static_layer"),
+            corner_masks=kwargs.get("corner_masks", ()),
+            tiles=split_rows(kwargs["background_height"], self._tiles),
+        )
+
+    def get_plan(self, input_width, input_height):
+        """Return the render plan for the input size, compiling it when settings or size changed"""
+        if self._plan is None or self._plan.input_size != (input_width, input_height):
+            self._plan = self.compile(input_width, input_height)
+            # Buffers sized for the previous layout are not needed anymore
+            self.buffers.clear()
+        return self._plan
 
     def __call__(self, **kwargs):
-        input = kwargs
+        """
+        Render a frame. The returned array is a pooled buffer that the next
+        call on the same thread overwrites, so callers copy or convert it first.
+        """
+        input_height, input_width = kwargs["input"].shape[:2]
+        plan = self.get_plan(input_width, input_height)
+        input = {**kwargs, **plan.to_kwargs(), "buffers": self.buffers}
+        if len(plan.tiles) > 1:
+            input["executor"] = get_tile_executor()
         for _, t in self.transforms.items():
-            input = t(**input)
+            if t.per_frame:
+                input = t(**input)
         return input
 
     def __getitem__(self, key):
@@ -36,11 +225,16 @@ class Compose(BaseTransform):
 
     def __setitem__(self, key, value):
         self.transforms[key] = value
+        # Layout settings changed, recompile on the next frame
+        if type(value).compile is not BaseTransform.compile:
+            self._plan = None
 
     def get(self, key, default=None):
         return self.transforms.get(key, default)
 
 class AspectRatio(BaseTransform):
+    per_frame = False
+
     def __init__(self, aspect_ratio: str, screen_size: tuple):
         super().__init__()
         self.aspect_ratio = aspect_ratio
@@ -122,9 +316,9 @@ class AspectRatio(BaseTransform):
 
         return output_width, output_height, input_width, input_height, input_width / input_height
 
-    def __call__(self, **kwargs):
-        input = kwargs['input']
-        input_height, input_width = input.shape[:2]
+    def compile(self, **kwargs):
+        input_width = kwargs['input_width']
+        input_height = kwargs['input_height']
 
         width, height, input_width, input_height, self.aspect_ratio_float = self.calculate_output_resolution(
             self.aspect_ratio, input_width, input_height)
@@ -138,13 +332,19 @@ class AspectRatio(BaseTransform):
         })
         return kwargs
 
+    def __call__(self, **kwargs):
+        input_height, input_width = kwargs['input'].shape[:2]
+        return self.compile(input_width=input_width, input_height=input_height, **kwargs)
+
 class Padding(BaseTransform):
+    per_frame = False
+
     def __init__(self, padding: float):
         super().__init__()
 
         self.padding = padding
 
-    def __call__(self, **kwargs):
+    def compile(self, **kwargs):
         foreground_width = kwargs['foreground_width']
         foreground_height = kwargs['foreground_height']
         background_width = kwargs['background_width']
@@ -164,6 +364,9 @@ class Padding(BaseTransform):
 
         return kwargs
 
+    def __call__(self, **kwargs):
+        return self.compile(**kwargs)
+
 class Inset(BaseTransform):
     def __init__(self, inset, color=(0, 0, 0)):
         super().__init__()
@@ -191,14 +394,95 @@ class Inset(BaseTransform):
             kwargs['input'] = self.inset_frame
         return kwargs
 
+class CursorAssetCache:
+    """
+    Cursor images shared by every Cursor transform in the process. The bundled
+    cursor images are loaded once, and the variants scaled for a cursor scale
+    and their premultiplied forms are kept in bounded LRUs, so changing the
+    scale does not touch the disk.
+    """
+    def __init__(self, max_scaled=256):
+        self._lock = Lock()
+        self._assets = {}
+        self._scaled = OrderedDict()
+        self._premultiplied = OrderedDict()
+        self._max_scaled = max_scaled
+
+    def get_assets(self, key, load):
+        """Return the assets stored under ``key``, calling ``load()`` the first time"""
+        with self._lock:
+            if key not in self._assets:
+                self._assets[key] = load()
+            return self._assets[key]
+
+    def get_scaled(self, image, offset, factor):
+        """Return ``image`` and its hotspot ``offset`` scaled by ``factor``"""
+        if factor == 1.0:
+            return image, offset
+
+        # Keyed by identity, the entry keeps the source alive so the id is not reused
+        key = (id(image), round(factor, 4))
+        with self._lock:
+            entry = self._scaled.get(key)
+            if entry is not None and entry[0] is image:
+                self._scaled.move_to_end(key)
+                return entry[1], entry[2]
+
+        height, width = image.shape[:2]
+        size = (max(1, round(width * factor)), max(1, round(height * factor)))
+        interpolation = cv2.INTER_AREA if factor < 1.0 else cv2.INTER_LINEAR
+        scaled_image = cv2.resize(image, size, interpolation=interpolation)
+        scaled_offset = (round(offset[0] * factor), round(offset[1] * factor))
+
+        with self._lock:
+            self._scaled[key] = (image, scaled_image, scaled_offset)
+            self._scaled.move_to_end(key)
+            while len(self._scaled) > self._max_scaled:
+                self._scaled.popitem(last=False)
+        return scaled_image, scaled_offset
+
+    def get_premultiplied(self, image):
+        """
+        Return the premultiplied color of ``image`` and its inverse alpha, both
+        as three channel uint16, so blending needs no per-frame conversion
+        """
+        key = id(image)
+        with self._lock:
+            entry = self._premultiplied.get(key)
+            if entry is not None and entry[0] is image:
+                self._premultiplied.move_to_end(key)
+                return entry[1], entry[2]
+
+        alpha = np.repeat(image[:, :, 3:4], 3, axis=2).astype(np.uint16)
+        color = divide_by_255(image[:, :, :3] * alpha)
+        inverse_alpha = 255 - alpha
+
+        with self._lock:
+            self._premultiplied[key] = (image, color, inverse_alpha)
+            self._premultiplied.move_to_end(key)
+            while len(self._premultiplied) > self._max_scaled:
+                self._premultiplied.popitem(last=False)
+        return color, inverse_alpha
+
+CURSOR_ASSETS = CursorAssetCache()
+
 class Cursor(BaseTransform):
-    def __init__(self, move_data, cursors_map, offsets, size=32, scale=1.0):
+    def __init__(self, move_data, cursors_map, offsets, size=32, scale=1.0, sprites=None, subpixel=False, track=None):
         super().__init__()
 
         self.size = size
         self.scale = scale
+        # Place the cursor at fractional pixel positions instead of rounding
+        self.subpixel = subpixel
+        # Reused uint16 buffers for the fixed-point blend, per thread since the
+        # preview and the export render with the same transforms
+        self._scratch = local()
         self.offsets = offsets
         self.move_data = move_data
+        # Dense per-frame cursor, baked from move_data unless shared by the caller
+        self.track = track if track is not None else CursorTrack(move_data)
+        # Exact cursor images recorded on Linux, see CursorSpriteTracker
+        self.sprites = sprites or {}
         self.cursor_states = {
             "windows": [
                 "arrow", "ibeam", "wait", "cross", "uparrow", "sizenwse", "sizenesw",
@@ -220,11 +504,11 @@ class Cursor(BaseTransform):
         }
         self.available_scales = ["1x", "1.5x", "2x", "3x"]
         self.os_name = get_os_name()
-        self.default_cursor = self._load_default_cursor()
+        self.default_cursor = CURSOR_ASSETS.get_assets(("default", self.os_name), self._load_default_cursor)
         if self.os_name in "linux":
             self.cursors_map = cursors_map
         else:
-            self.cursors_map = self._load()
+            self.cursors_map = CURSOR_ASSETS.get_assets(("theme", self.os_name), self._load)
 
     def _load(self):
         # Load offsets data from json file
@@ -279,38 +563,94 @@ class Cursor(BaseTransform):
 
         return default_cursor
 
-    def blend(self, image, x, y, cursor_state, anim_step):
-        # Get cursor image and scale string
-        scale_str = f"{int(self.scale)}x" if self.scale.is_integer() else f"{self.scale:.1f}x"
-
-        # Get cursor image and offset based on state and scale
-        cursor_image = None
-        cursor_offset = None
-
-        # Try to get cursor for current state and scale
-        if (self.cursors_map.get(cursor_state) and
-            self.cursors_map[cursor_state].get(scale_str)):
-            cursor_info = self.cursors_map[cursor_state][scale_str][anim_step]
-            cursor_image = cursor_info["image"]
-            cursor_offset = cursor_info["offset"]
-        else:
+    def _get_scaled_cursor(self, cursors, anim_step):
+        """
+        Scale a cursor from ``cursors``, which maps scale strings ("1x", "1.5x",
+        ...) to animation frames, to the cursor scale. The smallest variant at
+        least as large is used, so any scale works and exact ones are not resized.
+        """
+        scales = sorted((float(key[:-1]), key) for key, frames in cursors.items() if frames)
+        source_scale, key = next(((value, key) for value, key in scales if value >= self.scale), scales[-1])
+        frames = cursors[key]
+        cursor_info = frames[anim_step % len(frames)]
+        return CURSOR_ASSETS.get_scaled(cursor_info["image"], cursor_info["offset"], self.scale / source_scale)
+
+    def _get_scratch(self, height, width):
+        """Return this thread's uint16 scratch views of the given size, growing the buffers if needed"""
+        scratch = getattr(self._scratch, "values", None)
+        if scratch is None or scratch.shape[0] < height or scratch.shape[1] < width:
+            shape = (max(height, 0 if scratch is None else scratch.shape[0]),
+                     max(width, 0 if scratch is None else scratch.shape[1]), 3)
+            self._scratch.values = np.empty(shape, dtype=np.uint16)
+            self._scratch.shift = np.empty(shape, dtype=np.uint16)
+        return self._scratch.values[:height, :width], self._scratch.shift[:height, :width]
+
+    def _blend_premultiplied(self, region, cursor_rgb, inverse_alpha):
+        """
+        Blend a premultiplied cursor over ``region`` in place, computing
+        ``cursor + region * (255 - alpha) / 255`` in uint16 fixed point
+        """
+        height, width = region.shape[:2]
+        scratch, shift = self._get_scratch(height, width)
+
+        np.multiply(region, inverse_alpha, out=scratch)
+        divide_by_255(scratch, shift)
+        scratch += cursor_rgb
+        # Subpixel filtering can round one past 255
+        np.minimum(scratch, 255, out=scratch)
+        np.copyto(region, scratch, casting="unsafe")
+
+    def _shift_subpixel(self, color, inverse_alpha, dx, dy):
+        """Shift a premultiplied cursor by a fractional offset with bilinear filtering"""
+        if dx == 0 and dy == 0:
+            return color, inverse_alpha
+
+        height, width = color.shape[:2]
+        matrix = np.float32([[1, 0, dx], [0, 1, dy]])
+        # Premultiplied colors filter without dark fringes
+        color = cv2.warpAffine(
+            color, matrix, (width + 1, height + 1),
+            flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(0, 0, 0)
+        )
+        inverse_alpha = cv2.warpAffine(
+            inverse_alpha, matrix, (width + 1, height + 1),
+            flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_CONSTANT, borderValue=(255, 255, 255)
+        )
+        return color, inverse_alpha
+
+    def blend(self, image, x, y, cursor_state, anim_step, sprite_id=None):
+        # Get cursor image and offset, preferring the exact recorded cursor,
+        # then the cursor for the current state
+        if sprite_id is not None and sprite_id in self.sprites:
+            # Recorded sprites are scaled from their size on screen
+            sprite = self.sprites[sprite_id]
+            cursor_image, cursor_offset = CURSOR_ASSETS.get_scaled(sprite["image"], sprite["offset"], self.scale)
+        elif any(self.cursors_map.get(cursor_state, {}).values()):
+            cursor_image, cursor_offset = self._get_scaled_cursor(self.cursors_map[cursor_state], anim_step)
+        elif any(self.cursors_map.get("arrow", {}).values()):
             # Fallback to arrow cursor
-            if self.cursors_map.get("arrow") and self.cursors_map["arrow"].get(scale_str):
-                cursor_info = self.cursors_map["arrow"][scale_str][0]
-            else:
-                # Use default cursor if needed
-                scale_key = scale_str if scale_str in self.default_cursor["arrow"] else "1x"
-                cursor_info = self.default_cursor["arrow"][scale_key][0]
-            cursor_image = cursor_info["image"]
-            cursor_offset = cursor_info["offset"]
+            cursor_image, cursor_offset = self._get_scaled_cursor(self.cursors_map["arrow"], 0)
+        else:
+            # Use default cursor if needed
+            cursor_image, cursor_offset = self._get_scaled_cursor(self.default_cursor["arrow"], 0)
 
-        # Get dimensions
-        cursor_height, cursor_width = cursor_image.shape[:2]
+        color, inverse_alpha = CURSOR_ASSETS.get_premultiplied(cursor_image)
         image_height, image_width = image.shape[:2]
 
         # Calculate cursor position relative to image
-        x1 = int(image_width * x) - cursor_offset[0]
-        y1 = int(image_height * y) - cursor_offset[1]
+        cursor_x = image_width * x - cursor_offset[0]
+        cursor_y = image_height * y - cursor_offset[1]
+        if self.subpixel:
+            color, inverse_alpha = self._shift_subpixel(
+                color, inverse_alpha, cursor_x - np.floor(cursor_x), cursor_y - np.floor(cursor_y))
+            x1 = int(np.floor(cursor_x))
+            y1 = int(np.floor(cursor_y))
+        else:
+            x1 = int(image_width * x) - cursor_offset[0]
+            y1 = int(image_height * y) - cursor_offset[1]
+
+        # Get dimensions
+        cursor_height, cursor_width = color.shape[:2]
         x2 = x1 + cursor_width
         y2 = y1 + cursor_height
 
@@ -335,41 +675,27 @@ class Cursor(BaseTransform):
         if cursor_crop_x2 <= cursor_crop_x1 or cursor_crop_y2 <= cursor_crop_y1:
             return image
 
-        # Crop cursor image and get alpha channel
-        cursor_region = cursor_image[
-            cursor_crop_y1:cursor_crop_y2,
-            cursor_crop_x1:cursor_crop_x2
-        ]
-
-        # Split into RGB and alpha
-        cursor_rgb = cursor_region[:, :, :3]
-        cursor_alpha = cursor_region[:, :, 3].astype(np.float32) / 255.0
-
-        # Get image region and blend
-        image_region = image[image_y1:image_y2, image_x1:image_x2]
+        # Crop the premultiplied cursor and its inverse alpha
+        cursor_rgb = color[cursor_crop_y1:cursor_crop_y2, cursor_crop_x1:cursor_crop_x2]
+        cursor_inverse_alpha = inverse_alpha[cursor_crop_y1:cursor_crop_y2, cursor_crop_x1:cursor_crop_x2]
 
-        # Expand alpha for broadcasting
-        alpha = cursor_alpha[:, :, np.newaxis]
-
-        # Blend images
-        blended = (cursor_rgb * alpha +
-                image_region * (1 - alpha)).astype(np.uint8)
-
-        # Update image with blended result
-        image[image_y1:image_y2, image_x1:image_x2] = blended
+        # Get image region and blend in place
+        image_region = image[image_y1:image_y2, image_x1:image_x2, :3]
+        self._blend_premultiplied(image_region, cursor_rgb, cursor_inverse_alpha)
 
         return image
 
     def __call__(self, **kwargs):
-        if "start_frame" in kwargs and kwargs["start_frame"] in self.move_data:
-            start_frame = kwargs["start_frame"]
-            input = kwargs["input"]
-            x, y, _, cursor_state, anim_step = self.move_data[start_frame]
-            kwargs["input"] = self.blend(input, x, y, cursor_state, anim_step)
+        cursor = self.track.get(kwargs["start_frame"]) if "start_frame" in kwargs else None
+        if cursor is not None:
+            x, y, cursor_state, anim_step, sprite_id = cursor
+            kwargs["input"] = self.blend(kwargs["input"], x, y, cursor_state, anim_step, sprite_id)
 
         return kwargs
 
 class BorderShadow(BaseTransform):
+    per_frame = False
+
     def __init__(self, border_radius, shadow_blur: int = 10, shadow_opacity: float = 0.5) -> None:
         self.border_radius = border_radius
         self.shadow_blur = shadow_blur
@@ -428,10 +754,8 @@ class BorderShadow(BaseTransform):
             rect[y_offset+fg_height-radius:y_offset+fg_height, x_offset+fg_width-radius:x_offset+fg_width] = bottom_right
 
             rect = rect[y_offset:y_offset+fg_height, x_offset:x_offset+fg_width]
-
-            rect = rect / 255.
         else:
-            rect = np.ones((background_size[1], background_size[0]), dtype=np.float32)
+            rect = np.full((background_size[1], background_size[0]), 255, dtype=np.uint8)
 
         return rect
 
@@ -443,100 +767,10 @@ class BorderShadow(BaseTransform):
                                        (x_offset + foreground_size[0], y_offset + foreground_size[1])],
                                       self.border_radius, fill=int(255 * self.shadow_opacity))
         shadow = np.array(shadow.filter(ImageFilter.GaussianBlur(self.shadow_blur)))
-        shadow = shadow.astype(np.float32) / 255.0
         if border is not None:
             shadow = cv2.copyMakeBorder(shadow, border, border, border, border, cv2.BORDER_CONSTANT, None, 0)
         return shadow
 
-    def render_drop_shadow(self, background, foreground, shadow_alpha, foreground_alpha, offset):
-        bg_height, bg_width = background.shape[:2]
-        x_offset, y_offset = offset
-        fg_size = foreground.shape[1], foreground.shape[0]
-
-        shadow_alpha = np.expand_dims(shadow_alpha, axis=-1)
-        fg_alpha = np.expand_dims(foreground_alpha, axis=-1)
-
-        outer_pad = 2 * self.shadow_blur
-        inner_pad = self.border_radius if self.border_radius > 0 else 10
-        corner_pad = outer_pad + inner_pad
-        x1, y1 = max(0, x_offset - outer_pad), max(0, y_offset - outer_pad)
-        x2, y2 = min(x_offset + fg_size[0] + outer_pad, bg_width), min(y_offset + fg_size[1] + outer_pad, bg_height)
-
-        # Top-left corner
-        shadow_alpha_roi = shadow_alpha[y1:y1+corner_pad, x1:x1+corner_pad]
-        bg_roi = background[y1:y1+corner_pad, x1:x1+corner_pad]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        patch_roi = patch[outer_pad:, outer_pad:]
-        alpha_roi = fg_alpha[:inner_pad, :inner_pad]
-        foreground_roi = foreground[:inner_pad, :inner_pad]
-        patch[outer_pad:, outer_pad:] = (1 - alpha_roi) * patch_roi + alpha_roi * foreground_roi
-        background[y1:y1+corner_pad, x1:x1+corner_pad] = patch
-
-        # Bottom left corner
-        shadow_alpha_roi = shadow_alpha[y2-corner_pad:y2, x1:x1+corner_pad]
-        bg_roi = background[y2-corner_pad:y2, x1:x1+corner_pad]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        patch_roi = patch[:inner_pad, outer_pad:]
-        alpha_roi = fg_alpha[-inner_pad:, :inner_pad]
-        foreground_roi = foreground[-inner_pad:, :inner_pad]
-        patch[:inner_pad, outer_pad:] = (1 - alpha_roi) * patch_roi + alpha_roi * foreground_roi
-        background[y2-corner_pad:y2, x1:x1+corner_pad] = patch
-
-        # Bottom right corner
-        shadow_alpha_roi = shadow_alpha[y2-corner_pad:y2, x2-corner_pad:x2]
-        bg_roi = background[y2-corner_pad:y2, x2-corner_pad:x2]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        patch_roi = patch[:inner_pad, :inner_pad]
-        alpha_roi = fg_alpha[-inner_pad:, -inner_pad:]
-        foreground_roi = foreground[-inner_pad:, -inner_pad:]
-        patch[:inner_pad, :inner_pad] = (1 - alpha_roi) * patch_roi + alpha_roi * foreground_roi
-        background[y2-corner_pad:y2, x2-corner_pad:x2] = patch
-
-        # Top right corner
-        shadow_alpha_roi = shadow_alpha[y1:y1+corner_pad, x2-corner_pad:x2]
-        bg_roi = background[y1:y1+corner_pad, x2-corner_pad:x2]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        patch_roi = patch[outer_pad:, :inner_pad]
-        alpha_roi = fg_alpha[:inner_pad, -inner_pad:]
-        foreground_roi = foreground[:inner_pad, -inner_pad:]
-        patch[outer_pad:, :inner_pad] = (1 - alpha_roi) * patch_roi + alpha_roi * foreground_roi
-        background[y1:y1+corner_pad, x2-corner_pad:x2] = patch
-
-        # Left side
-        shadow_alpha_roi = shadow_alpha[y1+corner_pad:y2-corner_pad, x1:x1+outer_pad]
-        bg_roi = background[y1+corner_pad:y2-corner_pad, x1:x1+outer_pad]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        background[y1+corner_pad:y2-corner_pad, x1:x1+outer_pad] = patch
-
-
-        # Bottom
-        shadow_alpha_roi = shadow_alpha[y2-outer_pad:y2, x1+corner_pad:x2-corner_pad]
-        bg_roi = background[y2-outer_pad:y2, x1+corner_pad:x2-corner_pad]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        background[y2-outer_pad:y2, x1+corner_pad:x2-corner_pad] = patch
-
-        # Right side
-        shadow_alpha_roi = shadow_alpha[y1+corner_pad:y2-corner_pad, x2-outer_pad:x2]
-        bg_roi = background[y1+corner_pad:y2-corner_pad, x2-outer_pad:x2]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        background[y1+corner_pad:y2-corner_pad, x2-outer_pad:x2] = patch
-
-        # Top
-        shadow_alpha_roi = shadow_alpha[y1:y1+outer_pad, x1+corner_pad:x2-corner_pad]
-        bg_roi = background[y1:y1+outer_pad, x1+corner_pad:x2-corner_pad]
-        patch = (1 - shadow_alpha_roi) * bg_roi
-        background[y1:y1+outer_pad, x1+corner_pad:x2-corner_pad] = patch
-
-        # Center 1
-        background[y1+corner_pad:y2-corner_pad, x1+outer_pad:x2-outer_pad] = foreground[inner_pad:fg_size[1]-inner_pad, :]
-
-        # Center 2
-        background[y1+outer_pad:y1+corner_pad, x1+corner_pad:x2-corner_pad] = foreground[:inner_pad, inner_pad:fg_size[0]-inner_pad]
-
-        # Center 3
-        background[y2-corner_pad:y2-outer_pad, x1+corner_pad:x2-corner_pad] = foreground[fg_size[1]-inner_pad:, inner_pad:fg_size[0]-inner_pad]
-        return background[outer_pad:-outer_pad, outer_pad:-outer_pad]
-
     def apply_border_radius_with_shadow(
         self,
         background,
@@ -553,16 +787,88 @@ class BorderShadow(BaseTransform):
             0, 0
         )
 
-        outer_pad = 2 * self.shadow_blur
-        shadow_alpha = self.create_shadow(background_size, foreground_size, x_offset, y_offset, border=outer_pad)
+        shadow_alpha = self.create_shadow(background_size, foreground_size, x_offset, y_offset, border=2 * self.shadow_blur)
 
-        background = cv2.copyMakeBorder(background, outer_pad, outer_pad, outer_pad, outer_pad, cv2.BORDER_CONSTANT, None, 0)
+        static_layer = self.create_static_layer(background, foreground_size, x_offset, y_offset, shadow_alpha)
+        return self.composite(static_layer, foreground, x_offset, y_offset, self.create_corner_masks(foreground_alpha))
 
-        offset = (x_offset + outer_pad, y_offset + outer_pad)
-        result = self.render_drop_shadow(background, foreground, shadow_alpha, foreground_alpha, offset)
-        result = np.clip(result, 0, 255).astype(np.uint8)
+    def create_static_layer(self, background, foreground_size, x_offset, y_offset, shadow_alpha):
+        """
+        Return ``background`` with the drop shadow of a foreground at the given
+        offset applied, within ``2 * shadow_blur`` pixels around it
+        """
+        bg_height, bg_width = background.shape[:2]
+        fg_width, fg_height = foreground_size
+        outer_pad = 2 * self.shadow_blur
+        x1, y1 = max(0, x_offset - outer_pad), max(0, y_offset - outer_pad)
+        x2 = min(x_offset + fg_width + outer_pad, bg_width)
+        y2 = min(y_offset + fg_height + outer_pad, bg_height)
+
+        # The foreground covers its rectangle except the rounded corners, so
+        # only the ring around it and the corner rows and columns are shaded
+        radius = max(0, min(self.border_radius, fg_width // 2, fg_height // 2))
+        top, bottom = y_offset + radius, y_offset + fg_height - radius
+        left, right = x_offset + radius, x_offset + fg_width - radius
+        bands = [
+            (slice(y1, top), slice(x1, x2)),
+            (slice(bottom, y2), slice(x1, x2)),
+            (slice(top, bottom), slice(x1, left)),
+            (slice(top, bottom), slice(right, x2)),
+        ]
+
+        static_layer = background.copy()
+        for rows, cols in bands:
+            # The shadow mask carries the outer_pad border
+            shadow_roi = shadow_alpha[rows.start + outer_pad:rows.stop + outer_pad,
+                                      cols.start + outer_pad:cols.stop + outer_pad, np.newaxis]
+            if shadow_roi.size == 0:
+                continue
+            inverse_shadow = np.repeat(255 - shadow_roi, 3, axis=2).astype(np.uint16)
+            static_layer[rows, cols] = divide_by_255(background[rows, cols] * inverse_shadow)
+        return static_layer
+
+    def create_corner_masks(self, foreground_alpha):
+        """Return ``(rows, cols, alpha, inverse_alpha)`` for the rounded corners of the foreground mask"""
+        fg_height, fg_width = foreground_alpha.shape[:2]
+        radius = min(self.border_radius, fg_height // 2, fg_width // 2)
+        if radius <= 0:
+            return ()
+
+        corner_masks = []
+        for rows in (slice(0, radius), slice(fg_height - radius, fg_height)):
+            for cols in (slice(0, radius), slice(fg_width - radius, fg_width)):
+                alpha = np.repeat(foreground_alpha[rows, cols, np.newaxis], 3, axis=2).astype(np.uint16)
+                corner_masks.append((rows, cols, alpha, 255 - alpha))
+        return tuple(corner_masks)
+
+    def composite(self, static_layer, foreground, x_offset, y_offset, corner_masks):
+        """Place ``foreground`` on the static layer, blending only its rounded corners"""
+        fg_height, fg_width = foreground.shape[:2]
+        output = static_layer.copy()
+        output_roi = output[y_offset:y_offset+fg_height, x_offset:x_offset+fg_width]
+        output_roi[:] = foreground
+
+        static_roi = static_layer[y_offset:y_offset+fg_height, x_offset:x_offset+fg_width]
+        self.blend_corners(output_roi, static_roi, corner_masks)
+        return output
+
+    def blend_corners(self, foreground, static_roi, corner_masks):
+        """Blend the rounded corners of ``foreground``, already placed on the canvas, in place"""
+        for rows, cols, alpha, inverse_alpha in corner_masks:
+            foreground[rows, cols] = blend_alpha(foreground[rows, cols], static_roi[rows, cols], alpha, inverse_alpha)
+
+    def compile(self, **kwargs):
+        background_size = kwargs["background_width"], kwargs["background_height"]
+        foreground_size = kwargs["foreground_width"], kwargs["foreground_height"]
+        x_offset, y_offset = kwargs.get("x_offset", 0), kwargs.get("y_offset", 0)
 
-        return result
+        kwargs["border_radius"] = self.border_radius
+        kwargs["border_shadow"] = self
+        kwargs["foreground_alpha"] = self.create_rounded_rectangle(foreground_size, foreground_size, 0, 0)
+        kwargs["shadow_alpha"] = self.create_shadow(
+            background_size, foreground_size, x_offset, y_offset, border=2 * self.shadow_blur)
+        kwargs["corner_masks"] = self.create_corner_masks(kwargs["foreground_alpha"])
+        return kwargs
 
     def __call__(self, **kwargs):
         kwargs["border_radius"] = self.border_radius
@@ -583,25 +889,197 @@ class Background(BaseTransform):
         self.background_dir = os.path.join(base_path, "resources/images/wallpapers/hires")
         self.background = background
         self.background_image = None
+        # Static layer the camera resamples, with an alpha channel
+        self.camera_layer = None
 
-    def _crop_and_resize(self, image, target_size):
+    def _cover_size(self, image_size, target_size):
+        """Size ``image_size`` is resized to so it covers ``target_size`` before the center crop"""
         width, height = target_size
-        img_height, img_width = image.shape[:2]
+        img_width, img_height = image_size
         scale = max(width / img_width, height / img_height)
         if width / img_width > height / img_height:
-            new_width = width
-            new_height = int(img_height * scale)
-        else:
-            new_width = int(img_width * scale)
-            new_height = height
-        image = cv2.resize(image, (new_width, new_height), cv2.INTER_LANCZOS4)
+            return width, int(img_height * scale)
+        return int(img_width * scale), height
+
+    def _crop_and_resize(self, image, target_size, dst=None, buffers=None):
+        width, height = target_size
+        new_width, new_height = self._cover_size((image.shape[1], image.shape[0]), target_size)
+
+        if dst is not None and (new_width, new_height) == (width, height):
+            # Nothing to crop, resize straight into the destination
+            return cv2.resize(image, (width, height), dst=dst)
+
+        resized = None
+        if buffers is not None:
+            resized = buffers.get("crop_and_resize", (new_height, new_width) + image.shape[2:], image.dtype)
+        image = cv2.resize(image, (new_width, new_height), dst=resized)
 
         # Crop center
         start_x = (new_width - width) // 2
         start_y = (new_height - height) // 2
         image = image[start_y:start_y+height, start_x:start_x+width]
+        if dst is not None:
+            np.copyto(dst, image)
+            return dst
         return image
 
+    def _copy_static_layer(self, output, static_layer, rows, foreground_rect):
+        """Copy the canvas ``rows`` of the static layer the foreground does not cover"""
+        x_offset, y_offset, foreground_width, foreground_height = foreground_rect
+        top = max(rows.start, y_offset)
+        bottom = min(rows.stop, y_offset + foreground_height)
+        if top >= bottom:
+            np.copyto(output[rows], static_layer[rows])
+            return
+
+        for band in (slice(rows.start, top), slice(bottom, rows.stop)):
+            if band.start < band.stop:
+                np.copyto(output[band], static_layer[band])
+        for cols in (slice(0, x_offset), slice(x_offset + foreground_width, output.shape[1])):
+            if cols.start < cols.stop:
+                np.copyto(output[top:bottom, cols], static_layer[top:bottom, cols])
+
+    def _render_tile(self, output, static_layer, input, rows, foreground_rect):
+        """
+        Render the canvas ``rows`` of a frame: the static layer around the
+        foreground, then the foreground rows, sampled block by block with the
+        pixel-center mapping of cv2.resize
+        """
+        self._copy_static_layer(output, static_layer, rows, foreground_rect)
+
+        x_offset, y_offset, foreground_width, foreground_height = foreground_rect
+        input_height, input_width = input.shape[:2]
+        cover_width, cover_height = self._cover_size((input_width, input_height), (foreground_width, foreground_height))
+        scale_x, scale_y = input_width / cover_width, input_height / cover_height
+        start_x = (cover_width - foreground_width) // 2
+        start_y = (cover_height - foreground_height) // 2
+
+        for block in range(rows.start, rows.stop, TILE_BLOCK_HEIGHT):
+            top = max(block, y_offset)
+            bottom = min(block + TILE_BLOCK_HEIGHT, rows.stop, y_offset + foreground_height)
+            if top >= bottom:
+                continue
+
+            # Output pixel to input pixel, relative to the first row of the block
+            matrix = np.float64([
+                [scale_x, 0, (start_x + 0.5) * scale_x - 0.5],
+                [0, scale_y, (start_y + top - y_offset + 0.5) * scale_y - 0.5],
+            ])
+            cv2.warpAffine(
+                input, matrix, (foreground_width, bottom - top),
+                dst=output[top:bottom, x_offset:x_offset + foreground_width],
+                flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP, borderMode=cv2.BORDER_REPLICATE
+            )
+
+    def _warp_region(self, source, matrix, rows, cols, dst=None):
+        """Resample the output ``rows`` and ``cols`` from ``source`` through the output-space ``matrix``"""
+        matrix = matrix.copy()
+        matrix[0, 2] += matrix[0, 0] * cols.start
+        matrix[1, 2] += matrix[1, 1] * rows.start
+        return cv2.warpAffine(
+            source, matrix, (cols.stop - cols.start, rows.stop - rows.start), dst=dst,
+            flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP, borderMode=cv2.BORDER_REPLICATE
+        )
+
+    def _render_camera_tile(self, output, static_layer, input, rows, view_rect, static_matrix, foreground_matrix):
+        """
+        Render the output ``rows`` of a zoomed frame block by block: the static
+        layer only around ``view_rect``, where the foreground lands in the
+        output, and the foreground straight from the input frame
+        """
+        left, top, right, bottom = view_rect
+        output_width = output.shape[1]
+        for block in range(rows.start, rows.stop, TILE_BLOCK_HEIGHT):
+            block_rows = slice(block, min(block + TILE_BLOCK_HEIGHT, rows.stop))
+            inner = slice(max(block_rows.start, top), min(block_rows.stop, bottom))
+            if inner.start >= inner.stop:
+                self._warp_region(static_layer, static_matrix, block_rows, slice(0, output_width), output[block_rows])
+                continue
+
+            for band in (slice(block_rows.start, inner.start), slice(inner.stop, block_rows.stop)):
+                if band.start < band.stop:
+                    self._warp_region(static_layer, static_matrix, band, slice(0, output_width), output[band])
+            for cols in (slice(0, left), slice(right, output_width)):
+                if cols.start < cols.stop:
+                    self._warp_region(static_layer, static_matrix, inner, cols, output[inner, cols])
+            self._warp_region(input, foreground_matrix, inner, slice(left, right), output[inner, left:right])
+
+    def _get_camera_layer(self, static_layer):
+        if self.camera_layer is None or self.camera_layer[0] is not static_layer:
+            self.camera_layer = (static_layer, cv2.cvtColor(static_layer, cv2.COLOR_BGR2BGRA))
+        return self.camera_layer[1]
+
+    def _render_camera(self, output, static_layer, input, render_plan, matrix, buffers=None, executor=None):
+        """
+        Render the part of the canvas a zoomed camera sees. Every output pixel
+        is resampled once, from the static layer or straight from the input
+        frame, so nothing outside the view is composited and the foreground
+        keeps the detail of the recording.
+        """
+        output_height, output_width = output.shape[:2]
+
+        # warpAffine only has a vectorized path for four channels, which is
+        # well worth converting the frame and the result
+        camera_shape = (output_height, output_width, 4)
+        source_shape = input.shape[:2] + (4,)
+        if buffers is not None:
+            canvas = buffers.get("camera", camera_shape)
+            source = buffers.get("camera_input", source_shape)
+        else:
+            canvas = np.empty(camera_shape, dtype=np.uint8)
+            source = np.empty(source_shape, dtype=np.uint8)
+        cv2.cvtColor(input, cv2.COLOR_BGR2BGRA, dst=source)
+        camera_layer = self._get_camera_layer(static_layer)
+
+        x_offset, y_offset, foreground_width, foreground_height = render_plan.foreground_rect
+        scale, offset_x, offset_y = matrix[0, 0], matrix[0, 2], matrix[1, 2]
+        left, right = get_output_span(x_offset, x_offset + foreground_width, scale, offset_x, output_width)
+        top, bottom = get_output_span(y_offset, y_offset + foreground_height, scale, offset_y, output_height)
+        if left >= right or top >= bottom:
+            left = top = right = bottom = 0
+
+        # Output pixel to input pixel through the canvas and the foreground crop
+        input_height, input_width = input.shape[:2]
+        cover_width, cover_height = self._cover_size((input_width, input_height), (foreground_width, foreground_height))
+        scale_x, scale_y = input_width / cover_width, input_height / cover_height
+        start_x = (cover_width - foreground_width) // 2
+        start_y = (cover_height - foreground_height) // 2
+        foreground_matrix = np.float64([
+            [scale_x * scale, 0, scale_x * (offset_x - x_offset + start_x + 0.5) - 0.5],
+            [0, scale_y * scale, scale_y * (offset_y - y_offset + start_y + 0.5) - 0.5],
+        ])
+
+        view_rect = (left, top, right, bottom)
+        if executor is not None and len(render_plan.tiles) > 1:
+            futures = [
+                executor.submit(self._render_camera_tile, canvas, camera_layer, source, rows,
+                                view_rect, matrix, foreground_matrix)
+                for rows in split_rows(output_height, len(render_plan.tiles))
+            ]
+            for future in futures:
+                future.result()
+        else:
+            self._render_camera_tile(canvas, camera_layer, source, slice(0, output_height),
+                                     view_rect, matrix, foreground_matrix)
+        cv2.cvtColor(canvas, cv2.COLOR_BGRA2BGR, dst=output)
+
+        # Rounded corners, with their masks and the background under them
+        # resampled through the camera too
+        for rows, cols, alpha, _ in render_plan.corner_masks:
+            corner_left, corner_right = get_output_span(x_offset + cols.start, x_offset + cols.stop, scale, offset_x, output_width)
+            corner_top, corner_bottom = get_output_span(y_offset + rows.start, y_offset + rows.stop, scale, offset_y, output_height)
+            if corner_left >= corner_right or corner_top >= corner_bottom:
+                continue
+
+            region = (slice(corner_top, corner_bottom), slice(corner_left, corner_right))
+            corner_matrix = matrix.copy()
+            corner_matrix[0, 2] -= x_offset + cols.start
+            corner_matrix[1, 2] -= y_offset + rows.start
+            corner_alpha = self._warp_region(alpha, corner_matrix, *region)
+            background = self._warp_region(static_layer, matrix, *region)
+            output[region] = blend_alpha(output[region], background, corner_alpha, 255 - corner_alpha)
+        return output
+
     def _get_background_image(self, background, width, height):
         if background['type'] == 'wallpaper':
             index = background['value']
@@ -632,23 +1110,74 @@ class Background(BaseTransform):
 
         return background_image
 
-    def __call__(self, **kwargs):
-        input = kwargs['input']
+    def compile(self, **kwargs):
         background_width = kwargs['background_width']
         background_height = kwargs['background_height']
+
+        if self.background_image is None or self.background_image.shape[:2] != (background_height, background_width):
+            self.background_image = self._get_background_image(self.background, background_width, background_height)
+
+        kwargs['background_image'] = self.background_image
+        if 'border_shadow' in kwargs and 'shadow_alpha' in kwargs:
+            kwargs['static_layer'] = kwargs['border_shadow'].create_static_layer(
+                self.background_image,
+                (kwargs['foreground_width'], kwargs['foreground_height']),
+                kwargs.get('x_offset', 0),
+                kwargs.get('y_offset', 0),
+                kwargs['shadow_alpha'],
+            )
+        return kwargs
+
+    def __call__(self, **kwargs):
+        input = kwargs['input']
         foreground_width = kwargs['foreground_width']
         foreground_height = kwargs['foreground_height']
         x_offset = kwargs.get('x_offset', 0)
         y_offset = kwargs.get('y_offset', 0)
 
-        if self.background_image is None or self.background_image.shape[:2] != (background_height, background_width):
-            self.background_image = self._get_background_image(self.background, background_width, background_height)
+        # The compiled plan has the background and shadow baked already, the
+        # foreground is resized straight onto a copy of it
+        render_plan = kwargs.get('render_plan')
+        buffers = kwargs.get('buffers')
+        camera = kwargs.get('camera')
+        if camera is not None and camera[2] <= 1.0:
+            camera = None
+        if render_plan is not None and render_plan.static_layer is not None:
+            static_layer = render_plan.static_layer
+            if buffers is not None:
+                output = buffers.get("canvas", static_layer.shape, static_layer.dtype)
+            else:
+                output = np.empty_like(static_layer)
+
+            if camera is not None:
+                matrix = get_camera_matrix(camera, render_plan.canvas_size)
+                return self._render_camera(output, static_layer, input, render_plan, matrix, buffers, kwargs.get('executor'))
+
+            roi = (slice(y_offset, y_offset + foreground_height), slice(x_offset, x_offset + foreground_width))
+            executor = kwargs.get('executor')
+            if executor is not None and len(render_plan.tiles) > 1:
+                futures = [
+                    executor.submit(self._render_tile, output, static_layer, input, rows, render_plan.foreground_rect)
+                    for rows in render_plan.tiles
+                ]
+                for future in futures:
+                    future.result()
+            else:
+                self._copy_static_layer(output, static_layer, slice(0, output.shape[0]), render_plan.foreground_rect)
+                self._crop_and_resize(input, (foreground_width, foreground_height), dst=output[roi], buffers=buffers)
 
-        background_image = self.background_image.copy()
+            # Corners straddle stripes, so they are blended once every stripe is done
+            render_plan.border_shadow.blend_corners(output[roi], static_layer[roi], render_plan.corner_masks)
+            return output
 
-        foreground = self._crop_and_resize(input.copy(), (foreground_width, foreground_height))
+        foreground = self._crop_and_resize(input, (foreground_width, foreground_height))
         # foreground = cv2.cvtColor(foreground, cv2.COLOR_BGR2RGB)
 
+        if render_plan is not None:
+            background_image = render_plan.background.copy()
+        else:
+            background_image = self.compile(**kwargs)['background_image'].copy()
+
         x1 = x_offset
         y1 = y_offset
         x2 = x1 + foreground_width
@@ -667,4 +1196,10 @@ class Background(BaseTransform):
             output = background_image
             output[y1:y2, x1:x2, :] = input
 
+        if camera is not None:
+            matrix = get_camera_matrix(camera, (output.shape[1], output.shape[0]))
+            output = cv2.warpAffine(
+                output, matrix, (output.shape[1], output.shape[0]),
+                flags=cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP, borderMode=cv2.BORDER_REPLICATE
+            )
         return output
\ No newline at end of file
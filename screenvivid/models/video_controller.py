@@ -8,11 +8,13 @@ from PySide6.QtCore import QObject, Property, Slot, Signal, QThread, QTimer
 from PySide6.QtGui import QImage, QGuiApplication, QCursor
 from PySide6.QtCore import QPointF
 
+from screenvivid import config
 from screenvivid.models.utils import transforms
+from screenvivid.models.utils.cursor_track import CursorTrack, CURSOR_SMOOTHING_MODES
 from screenvivid.models.utils.manager.undo_redo import UndoRedoManager
+from screenvivid.models.utils.segments import open_video_capture, delete_recording
 from screenvivid.models.export import ExportThread
 from screenvivid.utils.logging import logger
-from screenvivid.utils.general import safe_delete
 
 class VideoControllerModel(QObject):
     frameReady = Signal()
@@ -28,6 +30,8 @@ class VideoControllerModel(QObject):
     backgroundChanged = Signal()
     devicePixelRatioChanged = Signal()
     cursorScaleChanged = Signal()
+    cursorSmoothingChanged = Signal()
+    cursorSubpixelChanged = Signal()
     frameWidthChanged = Signal()
     frameHeightChanged = Signal()
     canUndoChanged = Signal(bool)
@@ -54,6 +58,7 @@ class VideoControllerModel(QObject):
         self.undo_redo_manager = UndoRedoManager()
         self.video_path = None
         self.is_recording_video = True
+        self._pending_source = None
 
     @Property(int, notify=fpsChanged)
     def fps(self):
@@ -157,6 +162,27 @@ class VideoControllerModel(QObject):
             self.video_processor.cursor_scale = value
             self.cursorScaleChanged.emit()
 
+    @Property(str, notify=cursorSmoothingChanged)
+    def cursor_smoothing(self):
+        return self.video_processor.cursor_smoothing or ""
+
+    @cursor_smoothing.setter
+    def cursor_smoothing(self, value):
+        value = value or None
+        if self.video_processor.cursor_smoothing != value:
+            self.video_processor.cursor_smoothing = value
+            self.cursorSmoothingChanged.emit()
+
+    @Property(bool, notify=cursorSubpixelChanged)
+    def cursor_subpixel(self):
+        return self.video_processor.cursor_subpixel
+
+    @cursor_subpixel.setter
+    def cursor_subpixel(self, value):
+        if self.video_processor.cursor_subpixel != value:
+            self.video_processor.cursor_subpixel = value
+            self.cursorSubpixelChanged.emit()
+
     @Property(bool, notify=playingChanged)
     def is_playing(self):
         return self.video_processor.is_playing
@@ -226,6 +252,36 @@ class VideoControllerModel(QObject):
             logger.error(traceback.format_exc())
             return False
 
+    @Slot(str, str, result="bool")
+    def switch_source(self, source_path, path):
+        """
+        Read the recording loaded from ``source_path`` from another file with the
+        same frames, e.g. its transcode once it is ready, keeping the edits and
+        the position. Nothing is switched if another video was loaded since.
+        """
+        if self.video_processor.source_path != source_path:
+            logger.info(f"Not switching to {path}: {source_path} is no longer loaded")
+            return False
+        if self.is_exporting:
+            # The export reads from the current source
+            self._pending_source = (source_path, path)
+            return True
+        return self.video_processor.replace_source(path)
+
+    def _apply_pending_source(self):
+        if self._pending_source:
+            (source_path, path), self._pending_source = self._pending_source, None
+            if self.video_processor.source_path == source_path:
+                self.video_processor.replace_source(path)
+
+    @Slot(result="bool")
+    def refresh_source(self):
+        """
+        Pick up the frames written to a recording since it was loaded, e.g. the
+        segments completed while it is finalized. Return whether it grew.
+        """
+        return self.video_processor.refresh_source()
+
     @Slot()
     def toggle_play_pause(self):
         self.video_processor.toggle_play_pause()
@@ -277,12 +333,13 @@ class VideoControllerModel(QObject):
             self.export_thread.wait()
             self.is_exporting = False
             self.exportFinished.emit()
+            self._apply_pending_source()
 
     @Slot()
     def clean(self):
         self.video_processor.clean()
         if self.is_recording_video:
-            safe_delete(self.video_path)
+            delete_recording(self.video_path)
 
     def update_export_progress(self, progress):
         self.exportProgress.emit(progress)
@@ -290,6 +347,7 @@ class VideoControllerModel(QObject):
     def on_export_finished(self):
         self.is_exporting = False
         self.exportFinished.emit()
+        self._apply_pending_source()
 
     def on_frame_processed(self, frame):
         height, width = frame.shape[:2]
@@ -526,6 +584,7 @@ class VideoProcessor(QObject):
     def __init__(self):
         super().__init__()
         self.video = None
+        self.source_path = None
         self._is_playing = False
         self._start_frames = []
         self._end_frames = []
@@ -542,6 +601,10 @@ class VideoProcessor(QObject):
         self._background = {"type": "wallpaper", "value": 1}
         self._device_pixel_ratio = 1.0
         self._cursor_scale = 1.0
+        self._cursor_smoothing = None
+        self._cursor_subpixel = config.DEFAULT_CURSOR_SUBPIXEL
+        self._cursor_track = None
+        self._render_tiles = config.DEFAULT_RENDER_TILES
         self._transforms = None
         self._mouse_events = []
         self._region = None
@@ -623,11 +686,64 @@ class VideoProcessor(QObject):
     def cursor_scale(self, value):
         self._cursor_scale = value
 
-        self._transforms["cursor"] = transforms.Cursor(
-            move_data=self._mouse_events,
+        self._transforms["cursor"] = self._create_cursor_transform()
+
+    @property
+    def cursor_smoothing(self):
+        return self._cursor_smoothing
+
+    @cursor_smoothing.setter
+    def cursor_smoothing(self, value):
+        if value not in CURSOR_SMOOTHING_MODES:
+            raise ValueError(f"Unknown cursor smoothing: {value}")
+        self._cursor_smoothing = value
+        # Before a video is loaded the mode is only stored, load_video bakes the track
+        if self._transforms is None:
+            return
+        self._cursor_track = CursorTrack(self._mouse_events.get("move", {}), smoothing=value)
+        self._transforms["cursor"] = self._create_cursor_transform()
+
+    @property
+    def cursor_subpixel(self):
+        return self._cursor_subpixel
+
+    @cursor_subpixel.setter
+    def cursor_subpixel(self, value):
+        self._cursor_subpixel = value
+        if self._transforms is not None:
+            self._transforms["cursor"] = self._create_cursor_transform()
+
+    @property
+    def render_tiles(self):
+        return self._render_tiles
+
+    @render_tiles.setter
+    def render_tiles(self, value):
+        self._render_tiles = value
+        if self._transforms is not None:
+            self._transforms.tiles = self._get_tile_count()
+
+    def _get_tile_count(self):
+        # Untiled by default: tiling competes for the cores with the video
+        # decoder, OpenCV's own threads and a concurrent export, measure it
+        # with tests/benchmarks/render_tiles.py before turning it on
+        if self._render_tiles:
+            return self._render_tiles
+        # 0 picks a stripe per core. Tiled sampling costs about three
+        # single-threaded resizes, it only pays off with cores to spread it over
+        cores = os.cpu_count() or 1
+        return cores if cores >= 4 else 1
+
+    def _create_cursor_transform(self):
+        # The baked track is shared, so a scale change does not rebuild it
+        return transforms.Cursor(
+            move_data=self._mouse_events.get("move", {}),
             cursors_map=self._cursors_map,
             offsets=(self._x_offset, self._y_offset),
-            scale=value
+            scale=self._cursor_scale,
+            sprites=self._mouse_events.get("sprites", {}),
+            subpixel=self._cursor_subpixel,
+            track=self._cursor_track,
         )
 
     @property
@@ -699,16 +815,13 @@ class VideoProcessor(QObject):
 
     @property
     def output_size(self):
-        ar = self._transforms["aspect_ratio"]
-        return ar.calculate_output_resolution(
-            ar.aspect_ratio,
-            self.frame_width,
-            self.frame_height
-        )[:2]
+        return self._transforms.get_plan(self.frame_width, self.frame_height).canvas_size
 
     def load_video(self, path, metadata):
         try:
-            self.video = cv2.VideoCapture(path)
+            # Segmented recordings are opened through their manifest
+            self.video = open_video_capture(path)
+            self.source_path = path
 
             self.fps = int(self.video.get(cv2.CAP_PROP_FPS))
             self.frame_width = int(self.video.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -740,16 +853,17 @@ class VideoProcessor(QObject):
                 x_offset, y_offset = None, None
             self._x_offset = x_offset
             self._y_offset = y_offset
+            self._cursor_track = CursorTrack(self._mouse_events.get("move", {}), smoothing=self._cursor_smoothing)
             screen_width, screen_height = pyautogui.size()
             screen_size = int(screen_width * self._device_pixel_ratio), int(screen_height * self._device_pixel_ratio)
             self._transforms = transforms.Compose({
                 "aspect_ratio": transforms.AspectRatio(self._aspect_ratio, screen_size),
-                "cursor": transforms.Cursor(move_data=self._mouse_events.get("move", {}), cursors_map=self._cursors_map, offsets=(x_offset, y_offset), scale=self._cursor_scale),
+                "cursor": self._create_cursor_transform(),
                 "padding": transforms.Padding(padding=self.padding),
                 # "inset": transforms.Inset(inset=self.inset, color=(0, 0, 0)),
                 "border_shadow": transforms.BorderShadow(border_radius=self.border_radius),
                 "background": transforms.Background(background=self._background),
-            })
+            }, tiles=self._get_tile_count())
 
             # Get first frame
             self.jump_to_frame(0)
@@ -757,6 +871,40 @@ class VideoProcessor(QObject):
         except VideoLoadingError:
             return False
 
+    def replace_source(self, path):
+        video = open_video_capture(path)
+        frame_count = int(video.get(cv2.CAP_PROP_FRAME_COUNT)) if video.isOpened() else 0
+        # Muxers may round the last frame's timestamp differently
+        if abs(frame_count - self.total_frames) > 1:
+            logger.warning(f"Not switching to {path}: {frame_count} frames instead of {self.total_frames}")
+            video.release()
+            return False
+
+        previous_video, self.video = self.video, video
+        if previous_video is not None:
+            previous_video.release()
+        self.source_path = path
+        self.video.set(cv2.CAP_PROP_POS_FRAMES, self.start_frame + self.current_frame)
+        logger.info(f"Switched video source to {path}")
+        return True
+
+    def refresh_source(self):
+        # Only segmented recordings grow after they are opened
+        refresh = getattr(self.video, "refresh", None)
+        if refresh is None:
+            return False
+
+        total_frames = refresh()
+        if total_frames <= self.total_frames:
+            return False
+
+        # Clips that ran to the end of the recording keep doing so
+        self._end_frames = [total_frames if end_frame == self.total_frames else end_frame
+                            for end_frame in self._end_frames]
+        self.total_frames = total_frames
+        self.video_len = total_frames / self.fps if self.fps > 0 else 0
+        return True
+
     def get_frame(self):
         try:
             t0 = time.time()
@@ -856,120 +1004,85 @@ class VideoProcessor(QObject):
     def process_next_frame(self):
         self.get_frame()
 
+    def get_zoom_camera(self, current_absolute_frame):
+        """Return the ``(x, y, scale)`` zoom camera at a frame, or None when not zoomed."""
+        # Get the active zoom effect for the current frame number (not the frame data)
+        zoom_effect = self.get_active_zoom_effect(current_absolute_frame)
+        if zoom_effect is None:
+            return None
+
+        # Extract zoom parameters
+        x = zoom_effect.get("x", 0.5)
+        y = zoom_effect.get("y", 0.5)
+        scale = zoom_effect.get("scale", 1.0)
+
+        # Calculate frame position within the effect duration
+        start_frame = zoom_effect.get("start_frame", 0)
+        end_frame = zoom_effect.get("end_frame", 0)
+        duration = end_frame - start_frame
+        current_position = current_absolute_frame - start_frame  # Frame position from start
+
+        if duration <= 0:
+            return None
+
+        # Get user-defined ease frames (or use defaults if not specified)
+        ease_in_frames = zoom_effect.get("easeInFrames", 5)   # Default: 5 frames ease-in
+        ease_out_frames = zoom_effect.get("easeOutFrames", 4) # Default: 4 frames ease-out
+
+        # Log the zoom effect parameters
+        logger.info(f"🔍 APPLYING ZOOM EFFECT: Start={start_frame}, End={end_frame}, Duration={duration} frames")
+        logger.info(f"Ease-in: {ease_in_frames} frames, Ease-out: {ease_out_frames} frames")
+        logger.info(f"Current position: Frame {current_position} of {duration}")
+
+        # Ensure transitions don't overlap for very short effects
+        if duration < (ease_in_frames + ease_out_frames + 1):
+            # For very short effects, scale down the transitions proportionally
+            total_ease_frames = ease_in_frames + ease_out_frames
+            ratio = duration / (total_ease_frames + 1)
+
+            ease_in_frames = max(1, int(ease_in_frames * ratio))
+            ease_out_frames = max(1, int(ease_out_frames * ratio))
+
+            logger.info(f"Adjusted transitions for short duration: Ease-in={ease_in_frames}, Ease-out={ease_out_frames}")
+
+        # Apply zoom based on frame-based easing
+        current_scale = 1.0
+
+        if current_position < ease_in_frames:
+            # Ease IN - linear interpolation over specified frames
+            progress = current_position / ease_in_frames
+            current_scale = 1.0 + (scale - 1.0) * progress
+            logger.info(f"Ease IN frame {current_position}/{ease_in_frames} - scale: {current_scale:.2f}")
+
+        elif current_position >= (duration - ease_out_frames):
+            # Ease OUT - linear interpolation over specified frames
+            frames_into_easeout = current_position - (duration - ease_out_frames)
+            progress = frames_into_easeout / ease_out_frames
+            current_scale = scale - (scale - 1.0) * progress
+            logger.info(f"Ease OUT frame {frames_into_easeout}/{ease_out_frames} - scale: {current_scale:.2f}")
+
+        else:
+            # Hold steady at full zoom level
+            current_scale = scale
+            logger.info(f"Holding steady zoom at frame {current_position} - scale: {current_scale:.2f}")
+
+        # Only apply zoom if we're actually zooming
+        if current_scale <= 1.0:
+            return None
+        return x, y, current_scale
+
     def process_frame(self, frame):
         """Process a frame with zoom effects and return the processed frame."""
         try:
             # Get absolute frame number 
             current_absolute_frame = self.start_frame + self.current_frame
             logger.info(f"Processing frame {current_absolute_frame}")
-            
-            # First apply standard transforms
-            result = self._transforms(input=frame, start_frame=current_absolute_frame)
-            
-            # Get the active zoom effect for the current frame number (not the frame data)
-            zoom_effect = self.get_active_zoom_effect(current_absolute_frame)
-            
-            if zoom_effect is None:
-                # No zoom effect active, just return the transformed frame
-                return cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-                
-            # Extract zoom parameters
-            x = zoom_effect.get("x", 0.5)
-            y = zoom_effect.get("y", 0.5)
-            scale = zoom_effect.get("scale", 1.0)
-            
-            # Calculate frame position within the effect duration
-            start_frame = zoom_effect.get("start_frame", 0)
-            end_frame = zoom_effect.get("end_frame", 0)
-            duration = end_frame - start_frame
-            current_position = current_absolute_frame - start_frame  # Frame position from start
-            
-            if duration <= 0:
-                return cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-            
-            # Get user-defined ease frames (or use defaults if not specified)
-            ease_in_frames = zoom_effect.get("easeInFrames", 5)   # Default: 5 frames ease-in
-            ease_out_frames = zoom_effect.get("easeOutFrames", 4) # Default: 4 frames ease-out
-            
-            # Log the zoom effect parameters
-            logger.info(f"🔍 APPLYING ZOOM EFFECT: Start={start_frame}, End={end_frame}, Duration={duration} frames")
-            logger.info(f"Ease-in: {ease_in_frames} frames, Ease-out: {ease_out_frames} frames")
-            logger.info(f"Current position: Frame {current_position} of {duration}")
-            
-            # Ensure transitions don't overlap for very short effects
-            if duration < (ease_in_frames + ease_out_frames + 1):
-                # For very short effects, scale down the transitions proportionally
-                total_ease_frames = ease_in_frames + ease_out_frames
-                ratio = duration / (total_ease_frames + 1)
-                
-                ease_in_frames = max(1, int(ease_in_frames * ratio))
-                ease_out_frames = max(1, int(ease_out_frames * ratio))
-                
-                logger.info(f"Adjusted transitions for short duration: Ease-in={ease_in_frames}, Ease-out={ease_out_frames}")
-            
-            # Apply zoom based on frame-based easing
-            current_scale = 1.0
-            
-            if current_position < ease_in_frames:
-                # Ease IN - linear interpolation over specified frames
-                progress = current_position / ease_in_frames
-                current_scale = 1.0 + (scale - 1.0) * progress
-                logger.info(f"Ease IN frame {current_position}/{ease_in_frames} - scale: {current_scale:.2f}")
-                
-            elif current_position >= (duration - ease_out_frames):
-                # Ease OUT - linear interpolation over specified frames
-                frames_into_easeout = current_position - (duration - ease_out_frames)
-                progress = frames_into_easeout / ease_out_frames
-                current_scale = scale - (scale - 1.0) * progress
-                logger.info(f"Ease OUT frame {frames_into_easeout}/{ease_out_frames} - scale: {current_scale:.2f}")
-                
-            else:
-                # Hold steady at full zoom level
-                current_scale = scale
-                logger.info(f"Holding steady zoom at frame {current_position} - scale: {current_scale:.2f}")
-            
-            # Only apply zoom if we're actually zooming
-            if current_scale <= 1.0:
-                return cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-            
-            # Apply the zoom effect
-            h, w = result.shape[:2]
-            
-            # Calculate region to extract
-            region_w = w / current_scale
-            region_h = h / current_scale
-            
-            # Center on the chosen point (x,y are normalized 0-1 coordinates)
-            center_x = int(x * w)
-            center_y = int(y * h)
-            
-            # Calculate extraction region
-            x1 = max(0, int(center_x - (region_w / 2)))
-            y1 = max(0, int(center_y - (region_h / 2)))
-            x2 = min(w, int(center_x + (region_w / 2)))
-            y2 = min(h, int(center_y + (region_h / 2)))
-            
-            # Adjust if needed to maintain aspect ratio
-            if x1 == 0:
-                x2 = min(w, int(region_w))
-            if y1 == 0:
-                y2 = min(h, int(region_h))
-            if x2 == w:
-                x1 = max(0, int(w - region_w))
-            if y2 == h:
-                y1 = max(0, int(h - region_h))
-            
-            logger.info(f"Extracting region ({x1}, {y1}) to ({x2}, {y2})")
-            
-            # Extract region and resize
-            zoomed_region = result[y1:y2, x1:x2]
-            if zoomed_region.size == 0:
-                logger.error("Zoom resulted in empty region, returning original frame")
-                return cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
-                
-            result = cv2.resize(zoomed_region, (w, h), interpolation=cv2.INTER_LINEAR)
-            logger.info(f"✅ Zoom applied successfully!")
-            
+
+            # The zoom is a camera over the canvas, the transforms only render
+            # the part of the background and foreground it sees
+            camera = self.get_zoom_camera(current_absolute_frame)
+            result = self._transforms(input=frame, start_frame=current_absolute_frame, camera=camera)
+
             # Convert to RGB and return
             return cv2.cvtColor(result, cv2.COLOR_BGR2RGB)
             
@@ -18,6 +18,81 @@ Window {
     property bool recording: false
     property int totalRecordingTime: 0 // In seconds
 
+    // Warm up FFmpeg and the capture pipeline while counting down
+    Component.onCompleted: screenRecorder.prepare_recording()
+
+    // Stopping returns right away, the recording is finalized in the background.
+    // The studio opens as soon as the recording can be read and picks up the
+    // frames written after that until it is finished
+    Connections {
+        target: screenRecorder
+
+        function onRecordingOpenable(path) {
+            root.openStudio(path)
+            if (screenRecorder.is_finalizing) {
+                sourceRefreshTimer.start()
+            }
+        }
+
+        function onRecordingFinished(path) {
+            sourceRefreshTimer.stop()
+            root.refreshSource()
+        }
+
+        function onTranscodeFinished(sourcePath, path) {
+            videoController.switch_source(sourcePath, path)
+        }
+    }
+
+    Timer {
+        id: sourceRefreshTimer
+        interval: 500
+        repeat: true
+        onTriggered: root.refreshSource()
+    }
+
+    function refreshSource() {
+        if (!videoController.refresh_source()) {
+            return
+        }
+        clipTrackModel.set_video_len(0, videoController.video_len)
+        if (studioLoader.item) {
+            studioLoader.item.totalFrames = videoController.total_frames
+            studioLoader.item.videoLen = videoController.video_len
+        }
+    }
+
+    function openStudio(path) {
+        var metadata = {
+            'mouse_events': screenRecorder.mouse_events,
+            'region': screenRecorder.region,
+            'capture_changes': screenRecorder.capture_changes,
+            'telemetry': screenRecorder.telemetry,
+            'recording': true
+        }
+        var success = videoController.load_video(path, metadata)
+        if (success) {
+            clipTrackModel.set_fps(videoController.fps)
+            clipTrackModel.set_video_len(0, videoController.video_len)
+
+            // Add error handling around studio loader
+            try {
+                studioLoader.source = ""
+                studioLoader.source = "qrc:/qml/studio/Studio.qml"
+
+                // Only call showMaximized if the component loaded successfully
+                if (studioLoader.status === Loader.Ready && studioLoader.item) {
+                    studioLoader.item.showMaximized()
+                } else {
+                    console.error("Failed to load studio component:", studioLoader.status)
+                }
+                tray.hide()
+            } catch (e) {
+                console.error("Error loading studio:", e)
+            }
+        }
+    }
+
     Timer {
         id: recordingTimer
         interval: 1000
@@ -150,33 +225,7 @@ Window {
                             recordingTimer.stop()
                             root.hide()
                             tray.hide()
-                            // Load and show studio here
-                            var metadata = {
-                                'mouse_events': screenRecorder.mouse_events,
-                                'region': screenRecorder.region,
-                                'recording': true
-                            }
-                            var success = videoController.load_video(screenRecorder.output_path, metadata)
-                            if (success) {
-                                clipTrackModel.set_fps(videoController.fps)
-                                clipTrackModel.set_video_len(0, videoController.video_len)
-                                
-                                // Add error handling around studio loader
-                                try {
-                                    studioLoader.source = ""
-                                    studioLoader.source = "qrc:/qml/studio/Studio.qml"
-                                    
-                                    // Only call showMaximized if the component loaded successfully
-                                    if (studioLoader.status === Loader.Ready && studioLoader.item) {
-                                        studioLoader.item.showMaximized()
-                                    } else {
-                                        console.error("Failed to load studio component:", studioLoader.status)
-                                    }
-                                    tray.hide()
-                                } catch (e) {
-                                    console.error("Error loading studio:", e)
-                                }
-                            } else {}
+                            // The studio opens on recordingOpenable
                         }
                     }
                 }
@@ -219,33 +268,8 @@ Window {
                 text: qsTr("Stop")
                 onTriggered: {
                     screenRecorder.stop_recording()
+                    recordingTimer.stop()
                     root.hide()
-                    var metadata = {
-                        'mouse_events': screenRecorder.mouse_events,
-                        'region': screenRecorder.region,
-                        'recording': true
-                    }
-                    var success = videoController.load_video(screenRecorder.output_path, metadata)
-                    if (success) {
-                        clipTrackModel.set_fps(videoController.fps)
-                        clipTrackModel.set_video_len(0, videoController.video_len)
-                        
-                        // Add error handling around studio loader
-                        try {
-                            studioLoader.source = ""
-                            studioLoader.source = "qrc:/qml/studio/Studio.qml"
-                            
-                            // Only call showMaximized if the component loaded successfully
-                            if (studioLoader.status === Loader.Ready && studioLoader.item) {
-                                studioLoader.item.showMaximized()
-                            } else {
-                                console.error("Failed to load studio component:", studioLoader.status)
-                            }
-                            tray.hide()
-                        } catch (e) {
-                            console.error("Error loading studio:", e)
-                        }
-                    } else {}
                 }
             }
             MenuItem {
@@ -175,29 +175,32 @@ Item {
 
                             onClicked: {
                                 var region = "screen";
-                                var devicePixelRatio = Screen.devicePixelRatio;
                                 if (startupWindow.selectedMode === "custom") {
                                     region = [
-                                        customSelector.customRegionX * devicePixelRatio,
-                                        customSelector.customRegionY * devicePixelRatio,
-                                        customSelector.customRegionWidth * devicePixelRatio,
-                                        customSelector.customRegionHeight * devicePixelRatio
+                                        startupWindow.x + customSelector.customRegionX,
+                                        startupWindow.y + customSelector.customRegionY,
+                                        customSelector.customRegionWidth,
+                                        customSelector.customRegionHeight
                                     ];
                                 } else if (startupWindow.selectedMode === "screen") {
                                     region = [
-                                        startupWindow.x * devicePixelRatio,
-                                        startupWindow.y * devicePixelRatio,
-                                        startupWindow.width * devicePixelRatio,
-                                        startupWindow.height * devicePixelRatio
+                                        startupWindow.x,
+                                        startupWindow.y,
+                                        startupWindow.width,
+                                        startupWindow.height
                                     ];
                                 } else if (startupWindow.selectedMode === "safeArea") {
                                     region = [
-                                        windowController.left * devicePixelRatio,
-                                        windowController.top * devicePixelRatio,
-                                        Screen.desktopAvailableWidth * devicePixelRatio,
-                                        Screen.desktopAvailableHeight * devicePixelRatio
+                                        windowController.left,
+                                        windowController.top,
+                                        Screen.desktopAvailableWidth,
+                                        Screen.desktopAvailableHeight
                                     ];
                                 }
+                                // Screens may have different device pixel ratios
+                                if (Array.isArray(region)) {
+                                    region = screenRecorder.map_region_to_physical(region);
+                                }
                                 logger.debug("Selected region:" + region)
                                 screenRecorder.region = region;
                                 countdownLoader.source = "";
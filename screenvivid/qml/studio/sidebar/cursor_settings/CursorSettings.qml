@@ -5,7 +5,7 @@ import QtQuick.Layouts 6.7
 Item {
     id: root
     Layout.fillWidth: true
-    Layout.preferredHeight: 120
+    Layout.preferredHeight: 170
 
     property int selectedSize: 0
 
@@ -72,5 +72,26 @@ Item {
                 }
             }
         }
+
+        RowLayout {
+            Layout.fillWidth: true
+
+            Label {
+                text: qsTr("Subpixel position")
+                font.pixelSize: 14
+                color: "#AAAAAA"
+                Layout.fillWidth: true
+            }
+
+            Switch {
+                checked: videoController.cursor_subpixel
+                onToggled: {
+                    videoController.cursor_subpixel = checked
+                    if (!isPlaying) {
+                        videoController.get_current_frame()
+                    }
+                }
+            }
+        }
     }
 }
\ No newline at end of file
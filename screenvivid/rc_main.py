@@ -1,130 +1,137 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.8.3
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x07P\
+\x00\x00\x07\xb1\
 \x00\
-\x00$\x88x\xda\xe5Y[o\xdb6\x14~\xf7\xaf\xe0\
-T\xa0\xb5\xd7Dq.H6\x01\xd9\x90f-\x12\xa0\
-A\xd7\xc6h\x1f\x03Z\xa2m\x22\x94\xa8\x90\x94\x1do\
-\xf5\x7f\xdf!u\xb1%\xeb\xc2&\xce\xf609H\x22\
-\x9e\xc3\xcb\xb9\x7f\x87\xa6a\xcc\x85B\x9f\xd5\xe7\x84\xfa\
-\xf7\xe8\xd4=\xeb\xd1\xd2\x90{\xc9#%8\x93u\xb4\
-\x8fx\xc9\x13U!\xb9\x0c\x8f\xa5\x1b3\xac&\x5c\x84\
-\xbd\xde7\x1a\x05|\x81\xfe\xee!xh\xe0!\xc1\xb9\
-2/s*\xe9\x98\x11\x0f)\x91\x103\xb2\xa0\x81\x9a\
-y\xe8\x06\xab\x99\x1b\xe2\xc7\xfe\xad/\x08\x89\xdc\x19\xa1\
-\xd3\x99B\x07\xe8x\x0f\x9d\x0c\x87\x03\xc3\x9b\x0eZ2\
-?z(\xa7\x07D\xde+\x1e_\xcc1\x85\x932\xf2\
-M\xef\x89\xf6\xd3\xbd\x070\xef\xc8\xccX6\xcf\xb8J\
-w\xd8\xcf\x8e\xb0\x9e3ax*=\xad\x83\x0f\x02\x87\
-\x84\x11)S\xe9\xafh\xa4\xd0wMH\xdfo\x15^\
-\xcaO\xd1\x88\xc7\x9ab\xe6\xfa\x9cq\xe1!G\x09\x1c\
-\xc9\x18\x0b\x12)\xc7\x10\x14UZG\x0fr$\xfaN\
-z\xa2\xaftN\x03g\xd03tAp\xc0#\xb6D\
-\xb1\xe01\x11j\x89\xf4f>O\x22\x05;E#\x1a\
-\xc2\xecc\xc3Zp\x8c9g0\xd1\xe7\x22\xa0\xd1\xd4\
-C\x13\xcc$)\xb3\xe8E\x14W\x98}\xc9\xd9\xd2\x95\
-\x86\xe8\xe0\x00]GH\xc2p\x14\xc8\xf4\x0c\x9a$2\
-\x13\x17f\xde\x9c'\xd6\xa4H\x111\xc7\xccC\x87\xc3\
-\xe1\xb0\x18\x16$&Xm\xb8\x82~x4\x12t:\
-%\x82\xc0z\xeb\xd5\x8dV\xb6\x8e\xf6\xf6m\xc1\xb0\xea\
-\xa5\xbf\xcd\x9fkE\xc2\x8d\xc98\xf2g\x5cHwB\
-\x19\x9c!UtA,<\xf2\xa7\xe2\xf4\xbd\x82\x08\xbb\
-)\x1cM\x19\xa9\x1cE\x0b[\xa8\xbbDi\xddk\xd3\
-\xe8\xaf\x8e\x87\xfa\xe3\x94\x88\x02\x074\x91i\xbc\xb8\xc6\
-;\x0bG+\x14\x14c\x9f*p\xd5\xa1\xfbk\x89P\
-5\xc8\xe6YU\xc9\x1e\x1dvi\xb5OAL\xa2\xc8\
-\xf8Q-u\xdb/\xbd\xb2{n\xcdh\xb1\xfbZs\
-\xb0\xc0\xfe~-\x8dNP\xdf\xd0\xd1\xf99\x1a\x0e\x1a\
-VHc\x0bT\xe1J\x08\xee\xfe\xa0\x91\xa9p\x05t\
-^/`\xfeH\x13\x9c\xa9S\x9ae\xb1Pw\xc5l\
-\x9b\x1dF\xd9y`b\x0b\xbb\x96\x0fRI\x9eb]\
-.A\xd0s\xe40\x1a%\x8f\x0e\xfan\x12\xcd\x16\x95\
-\xcbG\xa7M\x17\xe6 \xda\xd5\xe4\x8c/nhDC\
-\xfa\x17\x09Z\x8e\xb1B\x04\xb2F\xe3i\x16&\xd3I\
-\xbb=g4 m[\xf5\xecF\xcb#\xab\x8d\x84P\
-\xfc\x0b\xd9\xeb\x9d\xb1Og\x5cwF\xafE\x806f\
-\xf5\xfc\x19\xa7\xbe\x92\x15\xbe\xe3:Z\x91$\xfc\x13\xfd\
-q\x1a\xa4\xba\xccC\x0a)\xf2\xb8>\xe8\x08^\xaa\xb9\
-\x13\x86\xb24\xe0\x9a8\xa9\x15\xdb':#\x5cG\xb5\
-\xa2O\x00\x15\xb81}$\xec\x16\xbc\x04r\xc6\xd1p\
-\x9b\xbe\xc8*\xf4Y%\x9f\xe4\x02-fT\x91\xb2:\
-\xd6\x90`}:\xf4\x1b\x1a\xd6\xa7v\x90\xbapT4\
-\xc6\xa9I\xeb\xcc\xa9\xd3^\x98s\xbe\xc3b;\xe1\xaf\
-\xf3}N\xca\xf1\xc5\xe9z\xf3*<\x81L\xb9\x97i\
-'\xb3\xff\xcf\x90\x89O\xcf\x06=ke\xe6>t\xb8\
-\xde\xa5\xb0\xf7\x11\xd1\x9f\xb5\x82J\xd9~w\xee\x9b\x09\
-\x90\xbe\xb68\xe7Q\x9bs\x06X\xdcO\x05^:M\
-\xf5\xe9\xcc>.6\xfc\xfa\x0b_\xa4 \xf3G\x85\xb3\
-\xf2\xe2\x9c\x89\x91\x89\xba\xc1bJ\x81\xad\xe2\xc89\x8b\
-\xd0\xce\xd0\xc1\x03e$\xe78\xa9e\x18s\xa5x\xb8\
-\xe6)1UpJ\xfe\xa4\xe2\x1bA\xaf2\x8f\xac-\
-B\x1b|\xdfR{\x19\xb6-\xbew\x09\x9c!j\xc8\
-\xc9VZk\x8c\x86\xa3j4\xec\x83\xa6\xea\x93z\x1e\
-\x5c\x19{\xfa\xda\xabe\x1dc\x1f<\x0b\x12\x01\xc4p\
-\x93\xaf\xd7\xb8V\xbe2\x9fk\x18\x81~7\x9d\x89\xde\
-\x85\x00\x8c\x86\x11g\x0f\x1d\xbaG\x03\x04N\xa8\xdf\x9a\
-k\xf3v\x80\x96kL\x03<\x01\x05FJ\xdb\xd4k\
-t\xe2'k\xde\x80\x0d\x1dZ\x1as\x9d\xf4\x1ay\xae\
-C<%\x1d\xe5W\xf2D\xf8\x90\x00\x9d\x07\xe1{\x07\
-\x82\xa4\xef\xf2\x80\x82\x08\xf2@C#W\xce\xa7N\xeb\
-\x1ay\x828i\xe5\xcam\xde\xc2\xb6j\x96\xa5\xa6\x8e\
-m\xa19S\xd7\xc0\xce\x1a\x87`\xa5\xc1T?\x22\x0b\
-\xf4\x07V\xa4\x0f\xbe\xb9\xf9\xb3\xdd?\x0c\xf6\x903\x9b\
-ya\xe8I\x00-\xad\x1b\xb5\x14\xb0\xea\xb3U(O\
-\xbb\xd9\xc7\x9c\x05^;\xd44\xb5\x0b@5\xf51\xbb\
-\x00\xb7\x8eB\xa2a\xb5V\x92k\xde\xbf^\x1aG\xfa\
-aDU;|\xc3\x13I.\xa0\xd1\xb4p\xe0\xc6\x8c\
-\x5cr\x05\x1d\x95\xef#\xddLwI\xea'Brq\
-;\xc311\xb6\xfd\x93C\x1b\x01&\xbb\xc2Qpi\
-h\x8dSyt\xc9\xa8\x7f\xdf\xdcD4\x02w\x1e[\
-\xe1\xf6Z\xec\xde\xdaK\xd8\x02^\xe3\xcePNm\xf8\
-\x00\x05}\xe48\x00\x0b\x04Hcw$U\x12P\x0e\
-\xf1&:\x1c\x08\x0b\x14\x12\x85\x03\xac0\xf46\xed:\
-\xd2\xcf\x9bP;\xc2\x1d\x99\x83m\xe5\x1b\xaf\xaa\xb7M\
-\xea^\xf7b\x82L)\x8f\xb6\x97I\xc7\xad\x16\xc8T\
-\xff\xc6\x22ZV\x9d\xaa\x90\x89\x0f\x89\x0f\xba\x17@\x85\
-\x01\xe1\xd9\xc5\x17\x83\x131P\xef\x9d\x19\xecW\xce\x0a\
-I=N\xd4]\x0c5p\xaf\xd0e\xbb\xb9t\xbf\x94\
-m5\xb0\xd0\xb9\xcfh<\x12P\x03ox@\x98+\
-\x89\xba\x9b\xc4\xb2_=\x22\x8c\x0d\x9e\xb2\x96Y\xe7\x8e\
-\x91H'\xc8\xea\xa2\x05\xb1{\xe9N\x06\xf0\xd2\x8b \
-@D\x08.\xd0\x0c|\x95\xe9\x8e\x1a\x9b\xc2\x9e{\xac\
-\xd6sK\xceZ\x07\xc6\xd2Bq&\xb0\xcd\xba\x1f\xcd\
-\xb2nZ\xd9\xc0\xbc\x8e\xf3\x9c\xc9\xa6N>\x84\xec \
-\xa5\x1f\xdc\x9a?.\x8c\xd8-k\xc5\x04\xda\xfa\xa4\xef\
-\xf4 \xbd3\x13\xd47\xf81\xebs\xc0\x7f\xd4\x8c@\
-\x0d\x0ac\x1eA\xa8\xa5Z\x0br\xf7\x9d$\x8c-\xad\
-\xf60\x8eX\x92Qa\x95\xa4\xdd{6\xf2\x85\xe0`\
-\x89^\xbf.\xeb\x02\x8a^8\xb0\xb4\xc0\x96\x22\xf5d\
-\xb7$Q\x7f`\xb5Rv\xdd`\xbf\xad\x060\x9c\x11\
-\xd7\xb8\x5c\xdf\xf9\x80)T\x1b(\xfcFa\xb9\xcb\x15\
-j\xf4\x00\x10\xd6h\xc3\xf2lV\x5c\xb6\x09=\x95\xd6\
-\xc7\xca\x9f\xa1>\xb1\xd5tE\xdc\xf7&\xd0\xb4\xa8:\
-\xceR\xc9\xb4\x8c\xc4b\xef\x9e\x8d\x1dV;\xbf\xady\
-\x81v(\x16d\x02\x0a!A\xd6\x13\x9d\x0c\xb7\x11\xce\
-\x88s\xb6\xbb\xaeH\xe3f\xb7\x1dT\x83\x1f\xc8Y3\
-\xaa6+\xb4Cj\xc3\xd2\x81\xa7\x0dOq\x97@~\
-!\xb8\xa9\xcd\xf9\x9f\xc1;\x1fd!\xcc\x1a\xe0\xc1\xa1\
-\x1e\x12\xaavp;\xf9\x94n6o?\xeb\xaf\x17m\
-\xfa^\xe7\xd5\xd1\x89\xfe8\xc8\xdc)\x1d\xea\x8f\xf3\xec\
-\xfb\xd4\x8d\x88\xbd]J\x88U\xc0\x15\xcbk\xbf\x14C\
-\xe6\xcb\x06\x18\xde\xbem+\xb9\x84E\xc4\xa4\x16\x9c\xeb\
-\xaf\xbd\xcaq\x03mO\xe2\xa1\x1b\xf8]\xd1\xa1\x1ej\
-H!i\x9b\x98}\x9f\x06p\xbd\xa6\xd9\xb3\xf8\x02\xe2\
-)=C\x17\xf2\xb7\x06\xe4;\x01\xe2O\x06\xe0v\xc0\
-{\xd5\xfb\x8f\x80\xb6%\xc0\xde\x05\xb0~\x01@\xdd{\
-A\x00\xdd\x0d\x9c\x9f\x04\x98w\x0c\x94\xbb\x9a\xdd\x17\x03\
-\xc6/\x0e\x88\x9f\x07\x84\xad\x01\xf0\xbf\x00|W\xcf\xbe\
-\xb9\xb0\x07\xb8\xcf\x07\xb6\x0d\x05\xba\x11\xc86\x95\xbd\x1f\
-(,\x97\x06d\xec\xa4\xb4X\xe2\x95f\x9cbU\xc5\
-S\xe3W\xaa\xf7\xa6_l2k\xe8\xc5\xa5\xb9~^\
-O\xb0?v\xf9\xa8\xab\xde\xaa\xf7\x0f\xa3\x04\xe9\x87\
+\x00\x1fVx\xda\xe5Y[o\xdb6\x14~\xf7\xaf\xe0\
+4`\xb5\xb7Dq\xd3\xa0\xdd\x04tC\x9b5H\x80\
+\x06\xdb\x1ac}\x0c\x18\x89\xb6\x88P\xa4JRv\xbc\
+5\xff}\x87\xa4\xee7\xab]\xf64\xbb(j\xf2\x90\
+\xe7\xfe\x9dsX\x9a\xa4Bj\xf4\x87\xfe#\xa3\xe1=\
+z\xe9\xbf\x9a\xd1\xc6\x92\x7f.\xb8\x96\x82\xa9\xbe\xbd\xf7\
+x/2\xdd\xda\xf2\x19\xbeS~\xca\xb0^\x0b\x99\xcc\
+f\x1f)\x8f\xc4\x0e\xfd=C\xf0\xa1Q\x80\xa4\x10\xda\
+\xfe\xd8RE\xef\x18\x09\x90\x96\x19\xb1+;\x1a\xe98\
+@\xd7X\xc7~\x82\x1f\xe67\xa1$\x84\xfb1\xa1\x9b\
+X\xa3\x13\xf4\xe2\x08\x9d-\x97\x0bK\xeb\x16'\x12?\
+\x04\xa8\xd8\x8f\x88\xba\xd7\x22}\xb3\xc5\x14$e\xe4\xa3\
+\xe1\x89\x8e\x1d\xef\x05\x9c;\xb5'\xf6\xc3'.\x1d\x87\
+\xe3\x5c\x84\xea\xcc\x9a\xe1\x8d\x0a\x8c\x0d.$N\x08#\
+J9\xed/)\xd7\xe8\xb3\xd9p\xbfo4\xde\xab\xdf\
+\xf8J\xa4f\xc7\x9e\x0d\x05\x132@\x9e\x96\x98\xab\x14\
+K\xc2\xb5g74\xd5\xc6F\x9f\xd4J\xce='\xd1\
+\x9ftK#o1\xb3\xfb\x92\xe0Hp\xb6G\xa9\x14\
+)\x91z\x8f\x0c\xb3Pd\x5c\x03'\xbe\xa2\x09\x9c~\
+aIK\x8a;!\x18\x1c\x0c\x85\x8c(\xdf\x04h\x8d\
+\x99\x22M\x12s\x89\x16\x1a\xb3\x0f\x05\x99\xbbi\x89N\
+N\xd0\x15G\x0a\x96y\xa4\x9c\x0c\xb0\xf4\x11\xcb\x04e\
+)\xba\xb8HR\xb2A\x98GH\xc7\x04\x858\xd5\x99\
+$(\xa5)a\x94\x13\xb4\x8b)#N<\xb8\x13\x19\
+\x11\xed\x15\xe7\x02\x02\x88\x83\xd6\xbe\xe0\xe6\xdf\x8ch\x02\
+\xc1\xa2\xac\xc2N\x06\x22\xfdT\x12c\x9b\xdbR\xf6\xf9\
+\xa2\x94\xe0\x06|\x94\x9a;%\x01\x96\x5c!i\xdd\x84\
+wx\x7fde)\x0f!\xaa\xd0\x9ar\xcc\xe8_$\
+\x02M\xed\xee\x1d\x0e\xef7\x12\xe4\x8ary8'\xa1\
+\xa6\x02.r\xb1k\x9d\x81\xe5\x86\xe8\xb6X\xb3r\x7f\
+\x9dq{\x06\x09^\xda\xed\x82r\xaab\x12\xcdSl\
+\x02\xac\xba\xccz\x0f\x92\xc1\x07\x93\xf3\x1b\x9dET8\
+\x9a\x92\xe2\xb1\xf7\xe6\x95\x09\x91PDd\xf4f\x08\x11\
+\x22\xf2\xece`:\xb5\xa3:\x8co\x95\xc8dH:\
+|j\xdc*N-\xb1j\x0c\xb6X\xa2\x84h\x1ca\
+\x8d\xd1\xeb\x16\xe7g\x89\xc8\x14\xb9%[\xf0\xa6z\xd6\
+\xf1a}\xf7\xa8yP\x92\x0d0\xee\x1eq\xeb-\xe2\
+<\xb4n\xc3\x18\xf3\x0d\xe9a\xd4\x22h\x1d\xd7\x90\x9f\
+\xa0\x82\xdcw\x0f\x96[\x1d\xf1r\x97>\xabaVe\
+\xbf\xc20*\x0bCH}\xb0K\xdb\x07L\xe0\xe8\xd6\
+.Z\x8b\x1e\x956\xac\x5cA\xd7h\x9e_\xd0\xf6h\
+\xc8h\x0a\xbe\x0f\xef\xaf\xc1\xf7\xccWD\xdf\xaeS5\
+o3\x81\xb5\xc5\xa1s\xf6\xcc-#|\xbe<\xeaH\
+Yn.f\x8d{ \xc7\xdeD\x11\x22R\x0a\x89\xc0\
+\xa6\x113\xb9\x84m\xce e\x03\x05\x19\x0d!!\xea\
+\xc7\xc0\x8e-E\xcc\xc7\xd1\xbf\xb7\xe4\xbe\x0bJ0\x98\
+\xe7M%\xfc$\xc3\xe0\xe4S\xc2N\xdc\xfe\x89\x0bT\
+\x1fV\xbcY\xe7\x0e\x90\xfc7\x03\x91!f\x0c\xa9X\
+\xec\xae\xf1\x03M\x5c\xf6\xaf\x1dN\x15\xf0\xe34\x88\x0a\
+'\xae3\xc6\xf6\x9d\xfb\xac\x93\x1ari\xac3\xf0\xf8\
+\xeb\xd7(_\xf9\x00\xb0\xbcG\xdf}\xd7\x94\x9fj\x92\
+,z\xac\xd1Q\xd4\x10\xfa\x0dI\xe7\x8b\xce\xa9GD\
+\x00\xb7\x07\xae\x03xV\x82\x11\xdf\xbak\xee]@\xf1\
+\x02\xb5\xb4sQ\xe1\xaeR\xed\xc0;B=\x1a\xf5\xf0\
+\xec\xac@\xc5\xda\xfb1\xc4LK\xc2G07 \x0e\
+\x9a\x93>\x8d[\xe2\xbd\xb3AeD31\xe5$1\
+2\x91\xd6\x9d\xfd\x90eJ\x93\xac1\xb1mF\xbdn\
+U\x11\x09u\x8d\xc8-f\x01z\xbe\x5c.\xcbe\xa8\
++\x04\xebVZ\x1b\xa8\xa5\x9b\x0d\x91\xa6\x125U\xe8\
+\x96\xc6\x1f~\xe8\x97\xed\x0a<Y;\x8cy\x18\x0b\xa9\
+\xfc5e \x83+\xf4\x15z\x14\x1d\xd17\xa5\xf4U\
+0\x037\x0d@\xc6\xda\x0e7\xca\x96\xe5\xbe\xb13\xca\
+\xab\xdet|\xfbbi\xbe\xcd\xe4\x93\xe0\x8bL\xb9~\
+\xcd\xb7\xddQ\xd9\xe8\x94\x06JqH5\xb4JK\xff\
+\xa7\xc6F\xdb!uYu\xc3\x1f\x07\xfc2\xea\x9fr\
+3\xe3\xdc\xf61\xbd\xbb\xdd\xbe(h\xb6G\x9d\x13#\
+~\xaf,\x07\x17\x1c\x1f\xf7\xee\x19t\xb0\xfb\x80\x07h\
+9\x94\xee\xae\xb7Kl\xaa\x89\xb4'\xbb+\xd5\x8b\xb6\
+\xe5u\xbf\x82%\x804\xab\x18d\xb0\xd4\x8dN\xe9 \
+\x87U.\x0f\x1c\x1c!7\xfaA+[\xb4\xf8\xbep\
+\xc0\xe7A9\xc8\x1e<\xf4\xd96\xba\x9d]\xa1\x1e\xbc\
+1[\x94\xdd\x90E=\xe8l\x86P\xaf\x85~C\xd2\
+\xecl\xa7\xad\xa6\xf1\xec\x81\xafq\xd0\xeb_}\x1c\x04\
+\xabY\xad\x14\xbduM\xe3\xa1\xbc>\x98\xbd\x13\x12t\
+p\xaa(>w.V\xf2\xc1\xebE\xdf^\x09\x12\xe1\
+\x99\xf9z\x03Z\x9d\x17)\x854y\xa8\x04]\xc1\x8f\
+6v\xc2R\x0e\x03\xbe\xcd\x93^\xb5Cb\x10\xe1\x8a\
+\xf7\xaa\xbe\x86n\xc5O\xe9\x03a7\x10%\x80\x19\xa7\
+\xcb\xee\xfe.\x9f\x10_\xb5\xf0\xa4P\x08F\x11M\xbc\
+V\xd3\x5c\x8c\xa4\x95t\xe8g\xb4\xec\x87v\xd0\xba\x0c\
+T\x98\x1f\x9cK\xfb\xdci`/)(\xdfb\xd9\x05\
+\xfc\x0a\xef\x8b\xadb\xbe}Y1o\x8f\xc7\x80\x94G\
+\xb9ur\xff\x7f\x0fH\xfc\xf2\xd5b6\xd9\x98E\x0c\
+=\xaf\xb8\x94\xfe>%\xe6[\x19\xa8\x81\xf6O\x17\xbe\
+\xb9\x02\xee\xe7Hp\x9e\x8e\x05g\x84%Lox\xef\
+\x0d\xd5\xa7W\xd3\xf3\xa2\x16\xd7\x1f\xc4\xce=r|\xa9\
+r\x93\xa2\xb8 bd\xad\xafa\xb2\xa4@\xd6\x0a\xe4\
+\x82\xc4\xce\xb2\x07h\xa0\x8c\x14\x14g\xbd\x04wBk\
+\x91T4\x0d\xa2V\x9fR|\x9c\xfaV\xd1\xcb<\x22\
+{\x8bP\x8d\xee\xa3\xf3\x97%\xeb\xd0\xbd\xcd@\x06>\
+\x80\xc9\x93\xac6\x98\x0d\xa7\xedl8\x06K\xf5\x83z\
+\x91\x5c9\xb9\xfb9\xeb%\xad\xde\x05\x82\xc1X\xef\x09\
+\xad\xe2f\xb15m\x04\xfa\xc5\xbe\x8c\x19.\x04\xba]\
+X\x81\xde\xf6\xb9\x7f\xba@\x10\x84\xe6\xd7pm\xee&\
+h\xb3\xc6\x0c5\xff\x1a\xd8\x1b\x9f\x06\x83A\xfc\xd5\x96\
+\xb7\xcd\x86I-\xd3s\x9d\xcd\x06i\xae\x12\xbc!\x07\
+\xca\xaf\x9b\xe8\x82|\xa0\x93\xc4\xfdV'\xd4\x0c\x08'\
+\xa65\xf2\xd5v\xe3\x8d\xdeQ\x00\xc4\xd9(U\xe1\xf3\
+\x11\xb2\xc7a]z\xeaX\xa7\x9b\xb3u\x0d\xfcl\xfa\
+\x10\xacM35\xe7d\x87~\xc5\x9a\x989\xbb\xfe\xa7\
+;?,\x8e\x90\x17\xc7A\x92\x04\x0a\x9a\x96QF#\
+\x05\xac\xfd\xe9\x14\xca\x97\x87\xc9\xef\x04\x8b\x82\xf1V\xd3\
+\xd6.h\xaa)L\xd4o \xacybfHk$\
+\xdf\xfe\xfe\xf3\xdc\x06\xd2\x17wT\xbd\xcb\xd7\xe6\xc5\xe8\
+\x8d$xB\x00\x0f\x22r#\x14LV\xbe\xe3\xe61\
+\xf7\x90\xa6a&\x95\x9071N\x89\xf5\xed\xef\x82\xda\
+\x97\xcbK\xcc\xa3s\xbb7xT\xf0sF\xc3\xfb\xe1\
+!b\xb0q\x17\xe9\xa4\xbe\xbd\xb7w\x1f\x9d%\xa66\
+\xbccs}\xcf\xe3\xca*&\xc5\x8b\x82y4T\xa0\
+z%X\xf1J\xf9\xe4\xdd\xf5\x7fP\xbeRI\xd6D\
+\x02 \xe75\xecl\xd9\x8d\xc8\x95\x10\xec\xe9\xaa\x98\xc1\
+9\x7f\x1c\x04\xc1\x11*\x1eFA{\xc38\x04Z\x92\
+\x03\xf8gi\xca\xde\x8f\xfcH\xf0PY\xfa\x9f\xa5c\
+\x08\xba\x1069!A\xa8O\x19\xd5O0M~M\
+\xf7Q\xb4\x0b\xfd\xe3\xe0\x94>\x05\xfa\xfe3\xf3\xf5\x90\
+\x9d\x01\x9e\x9b\xaf\xf7\xaf\xe7\xdfZ\xc6\xde\xec\x15\xe4\xea\
+\x0a\xd0\xe5*l\xe4\x90}\x1c\x82\xe5\xeet\xd4\x08\x89\
+\x09\x19\xe3<\xb85\xffM\xd6\xcc\x1b(S\x19\xb4\x8c\
+\xf0w\xcb\x86fi\x00B\x5cY\xcf\xff\xff\x0d\xe0\xb5\
+\xa78Ox0\xfa\x1a\x8c\x9f\x8e\xedc\x98>\xe4\x94\
+/P\xfb\xdc\xa6\xc0\x93(>1\x9b\x86\xb3hR\x8c\
+\xb9G\xecVl\xd5\xdf\xb7\xeb\xc4\x06\x18\x84\xb2\xcdl\
+u`\xba\xd8MQ\x1fg\x8f\xb3\x7f\x00\xbf\x8f\x09\xc4\
+\
 \x00\x00\x05=\
 \x00\
 \x00\x13\x0ex\xda\xa5\x18ko\xdb6\xf0\xbb\x7f\xc5A\
@@ -273,119 +280,122 @@ b\xaa\xdaI\xe8S\x90\xd0\x06\x15\xec\xfe@v*\xd8\
 vW\xb7\xad\x14\xb0\xbb\xbd}\x12\xb7\xb7\x0f\xbav\xed\
 \xf4\xf3\xef\xe9g\xa7`\x9d\x82\x99\x14L|\xde9\x7f\
 \x00T\x0b\xe0\xd3\
-\x00\x00\x06\xec\
+\x00\x00\x07\x1c\
 \x00\
-\x00*Dx\xda\xddZmo\xdb6\x10\xfe\xae_A\
-\xa8_\x92\xae\x95\x13\xd7\xe82\x17\xc5\x90\xb8\x1d\x1a\xa0\
-\xc1\xda\xa4X[\x0cCAK\xb4MT\x16]\x8a\x8a\
-\x93\x0e\xfe\xef;R\xa4,\xc9\x12E\xbfd\xe8&}\
-\x91\xc4\xe7\x8e\xe4\xf1\xb9\xe3\x91\x22\x9d/\x18\x17\xe8\xbd\
-x\x9f\xd1\xf0+z\x1e\xfc\xec\xd1\xca\xa7\xe0\xf5dB\
-B\x916\x15\x8dX\x228\x8b\x1b\xcb\xde\xe2{\x965\
-\x8b\xbd\xa28fS\xab\xc6\xe0\x0a\x0b\xc2\x01W\x06\xf9\
-A\xd0\x0b\x19<'$\x11\xa9\xefy\x97\x82\xcc\xd1\xdf\
-\x1e\x82\x8bFC\xc4\x19\x13\xeaeI#1\x1b\xa20\
-W\xf6\x0e'$\xfe(?\xa9\xc2\x19\xa1\xd3\x99\xa8\x96\
-\xbeQ\xdf<U\xce\x09\x8eX\x12\xdf\xa3\x05g\x0b\xc2\
-\xc5=\xa2\x89\xd8\xd45D\x83\xb3\x13G\x817\xbaJ\
-\xbb@\xccRr\x91\x09\xc1\x92\x1b\xfa\x9d\x0c\xd13\x1b\
-z\xce\xa2\x0a\xf8\xb9\x0d,\x18\x8b\xcb\xe0A\x1b8\x15\
-\x9c&S4\xc6\xe1\xd7)gY\x12\x8dX\xcc\xf8\x10\
-\xf9\x8f\xfa\xa7\xf2\xf6;\xe4\x18\x8f\x08/d\x06\xcf\xe5\
-\xed[\x1a\x96\x0bh{\x9eZ\x80)Y`\x8e\x05s\
-\xc1\xde\xc2\x13\x0dq|\x85\xf9\x94&\x80\xb5\x99f\xc6\
-8\xfd\x0eC\xb5\x86\x0fl\xf0X\xb1\xfaf\x81C\xe8\
-/\xa8\x1e(l\xadO`\xe8yQy\xff$\xa7U\
-\xaf\x874\xb9\xd1BrB}\xbc\x06\xcf\xc2\xc94&\
-\x9a\xc5\x86\xc9e\xf2\x14\x05VVw0\xdb@p\x12\
-B\x8f\xd3 o\xe4\x10\x9a\xc2\xc1\x97\xf4\xeb\x06jm\
-\x9c\x11\xa0\x08/\xf0\xf5\x82B2\xcc\xc7\xbeF\xa0\xa2\
-\x98\xe3\x88fia7y\xe5\x14\x08t\xe7J\x84\xa8\
-#\x8c\xea5\xc7\xbc\x02R\x0a\x04\xf5>Lh\x1c\x9b\
-v7\x02b2\x11f\xb4N\x1a\x11\x5c\x9a\xd0@\xea\
-\x84i\x94\x10la\xf0U66\xa2\xab\x8c\xa9\x09T\
-$\xae\xd92\x8f\xab\xb5\xce\xb6vx\x03\x054|\xc5\
-\xf1\x14\x98\x1aA%\xa246\x16[\x9a+\xaf[\xd5\
-`B\x9a\xe0\x19\xb1a\x17\x9cL\x08\xe7$\xd2\x8e\xbb\
-a\xbeF\xe1&\xbf\xa8_\xd2O\x22\xe8\xcaekO\
-\x9c\xa9P\xbe4\xcd|\xc1q\x92\xe6X\xdfkE\x03\
-\x0f\xb3ybie\xb9\xfeP\xf9\xcae\xd2\xd9\x06y\
-\xa5&\xc6\x0c<+\xeer\x8e\xa7\xa4\xa3\x01J\x1f\xcb\
-x\x08\xb1\xdf\xff\xc6\xc3a\x8f\x93\xfc=\xedQ\x88\x16\
-iO\x1a\xf2K\xc1\x89 \xbd\x9d\xfa\x9d\x1a\xb5\xcb\xf6\
-O:\x91&0u@W\xdev%\xabf\xcb\x5c\xb1\
-,%\xe7\x10\xbf-V\xd9\x8a\x12\xd28\x81\x00\xba\x12\
-QJ2Z\x91\xf8\x8eB\x88\x93^\x16|:O\xa2\
-\xcf\xe7\xf0n\x97\x98\xd3\x84\xce\xb3\xf9\xa7z\x00j\x03\
-~n\x03n\xda\xa9\xc1F\x87up\xdd$\xed\xde\xd5\
-\xb4\x04=F\xcf\xd0O\xd5I\x13\xbe\xf5[\x9c\x9e-\
-\x0f5b\x85\xf3T\xaanw\xa4\xab\xa2\xd9\x1d\x9e\xa4\
-&\xe7,\x85p\x9d\xc3\xad`A\xee\xc0\x80\xfeH\xe1\
-\xed\xfe$\xbd\xf0\x1d\x96\x16l\xf6\xcf\xbc\xcen\xbf\x94\
-\x99\xde\x07\xba\xf8\x90\xd7\xac\x9c\xe0\x86\xc4\x10M)K\
-\xec\x92,\x19\xc5\x90\x81\x13\xe8`w0)\x9b \xc0\
-\xa0\xfd\x16\xd2\xf5\x08\xbdlgKetBNH\xd2\
- =\xc1q\xea \x8e'\xca\xbdwW\x00\xbe,\xb2\
-\xc5G\x88wl\x19\xa4\xca>$\x92\x1c\x00\x15~\xe8\
-0\x5c+\xcf!0V}\xc1s\x09\x90\x8e\x22\xab\x03\
-1\xb9<\x10.L\xbeQ\xf8\xfd\x98\x9c\xd7\xb9-\x93\
-\xf3\x9a]\xb9\x5cPb\xd8M\xc8\xc3\xf0\xde\x91xm\
-\xc4ws\x9b\x87\xe5}\xea0\xb8\xff\x17\xdeW,\xe9\
-\xc4|\x90@RdO\xf2\x83\x9a/0u\xe1\xad\xf9\
-o\xea\xffw\xc3\xf9\x9e\xb4\xde;\x9e\xbb\xf9\x85\x9d\xd6\
-Z\xfb\x7f\x95\xd8\xb0`\xbbb\x09\x85\xac|\xc4\xe6c\
-v\xc1\xee,\x03\x0a`\xc3\xf1yU\xa8KD\xf3\x5c\
-W\x85N\xfd\xce::\xa8\xae\xeb\xb7\x13\xddT^\xe1\
-\xfah\xc6XJL\xaf;\x85\xb7\x1b\x1c-\xb4\xe5\xf8\
-\x80\xd4j\xf7\x84\x1b\xa4\xcf\xa3\x08\xe1bi\xbf\xde\xce\
-\xda19\xd7\xd9vWn\xbe\x91\xc7\xef\xbc\xd8\xdez\
-\x09\xbb,\xef\xd3\xd9<\xc4\xec(\xa9W\xf4\xd4\xec\xd6\
-Y\x96\xe6\xe5\x1d\xa0\x1fr\x11\xc4I\x08M\xd4\xe1L\
-\x19\x02\x16Ac\xce\x96f\x7f\xb7\xf8\xe8\xb0<q[\
-\x15\xf1\x8a1ye\xcf\xafM\xc6\xb0\xb1\xb6\xb7W\xfd\
-|\xb0%\x168\xc1\xb5\xb2\x0b\x1a\xdbg\xdd\xeb\x92\xf5\
-\x1c\xe6\xf2\xb2\xb1]\x82\xb8\x5c\xbf\x07\xd5\x0dq\xa7H\
-\xbe\xad\x9c\x8c\x82fW\xb3\x7f\xd6\x0d-\xf6H\xce\xbc\
-\xc3M\xec\xb7\x98\x83\x81\xa6\x90-\x942\xbc\x17Nb\
-\x11\xb9\xa5!yG\xefH|\x8d!\xdf\x00\x05y\x12\
-\x1e\xd4K\xba\xf5\xd1\x09:\xb2\xcd\xd2/\xd7\xcb\xaec\
-\x87^\xe5\xdb\xf3\xbaW\x7f:\xc1\xd7YN\x9e?\xc1\
-\xc4\x94\xbf^+=\x9f\xd0\xe3\x8d\x0e?9\x84\xe2\xcf\
-\x0f\xa5X\x85\x9a\x87R\x9e\x87\xbd\x06\xedN\xca\xff\xea\
-&\xc4\x0a\x11\xc8\x0c\x9dx\xa1I\xfb\x80\xbc\xa8\xb6\xe0\
-n/\xa3Vu\xdd\x1fP\xd7r\xef\x01\xaf\xea\x9b\xfd\
-Hclr\xf4\x07\x1c\xe5\xa5\xaa\x5c\xff\x82\x8b\x09W\
-\xff}\xf6\xb2\xe7\x86F\xc1\x16{),\xe2k\xfa\x15\
-T\x9d\xdfb\x1a\xe3qL\xf6w\xf5\x16\xc5\x0f\xef\xe6\
-\x9d\x88\x98M\xa7`\xb9\x88\x8c\xb3\xe9\x91\x7f\xa3\x99\xa1\
-\xc7w\xe8C\x8a\x94?\x1e;.B\xf3\xe4\x014\x16\
-\x0c\xc9\x1f\xba\xdb\x1a\xb2,\x110\x9e\xc9[\x86\xa5\x82\
-|5#\xa7M\x7f\x1fa\xb56\xfa6\x8f{\x05\xa4\
-72O\x01|wP^\xf3[\x1a\x91\xa3\xe3\x17;\
-\xffH\xb1%h\x17*G\xedJ\xd0>\x14I\x90C\
-zVN{\x7f\xa4\xf4\xac-\x09\xae\xe4\xee\x8e\xa9p\
-\x91\xc3\xd9\xff\xb1MX\xac\xb8\xd1\xb5\xf3\xa3T\x99\xdf\
-\x90\x8f\xc8\x19\xc1$\xf2\xdds\xcd\xc1\x16\xb9\xe6\xe0\x80\
-\xb9\xe6\xf64U\xa9&\xe0\xd8o4&\xf9\xa1\xa0\x80\
--H\xb2;\xbd5\x8f\xd7\xc7\x0f\x86N\xab\xdb\xd2\xc6\
-\x809\xa1p\xe6\x026\x0b\xd2\xf2\xd2n\xc6\x805\x10\
-\xc2~\x95\x87f\x06\xf2\xf6Q\xfd\x00\xcd\xd6\xdb\x0c\xb6\
-\x7f\xa0\xf6/\xeb\xb7\xfcI\x07\x80\x0d\xffU?\xb6\xd6\
-'\x906\x8e\x82\xc0\xbcQ\xac\x10\xe1y\xa3\x5c\xce\xa6\
-\x05@\xbe4\x22\xcc\x19\x87\xa7y6\xd3C\xfd\xa6\x8a\
-\x0a\x94\xceQ\xca\xb0r\x98\xa8\x9d\x98\xf2\x1acB\x1b\
-\xe8\xbb\xdc\x9cX\x9f1)1f\x97\xc3$6\x969\
-\xfd\xb94\xbckjs\xc5\x00\xb5\xcd\x90\x12\xb4D\xbd\
-\xf70\x06\xd2\x06\x84\x1f\xf9\x8f\x9e\xfd\x22o\xff\x09:\
-\x0d\xfa\xc7\x8a\x8b\xfa\xcb\x86\xce\xeaY\x9c\xd3\xb6\xf2\x22\
-6\x0dN\xe4\xed{\xed\xf4k;\x9d\xe0\xbc\x9fd\x0f\
-\xa9\xaa\xf7\xcd\x11UwB3r\x93o\xf6}\xa8:\
-\xb2\xecF^Cx\x04\x83\x7f\xcb\xa88:.;\xd9\
-U\x16\x0b\x9a\x1f\x9f,\x99\xc0\xf4\xa8\xf1\x8cW\x95+\
-\x8d\x90t\x86!\xc0^\xc4\x19\x0c\xc1ipR\xfb\xfe\
-:\x91\x99]\xfd\xc7W^f\x0e\xe6\x8dc`\xbb_\
-+\xfcC\xcfu\xbfO&\xa9<\xe7PW\xfc\xa68\
-\xb8SE\xac\xbc\xd5?#\x5cf\x89\
+\x00*Ax\xda\xddZmo\xdb6\x10\xfe\xae_A\
+\xa8_\x92\xad\x95\x93\xd4\xe82\x0f\xc5\x90\xb8\x1d\x1a\xa0\
+\xc1\xda\xa4X[\x0cC\xc0H\xb4MT\x16U\x8a\xb2\
+\x93\x0e\xfe\xef;\xbeH\x96d\x89\xa2\x1d\xb7\xeb&\x7f\
+\xb0$>w$\x8f\xcf\x1d\x8f\x14\xe9<e\x5c\xa0\xb7\
+\xe2mN\xc3O\xe8Y\xf0\x93Gk\xaf\x82\x97\x93\x09\
+\x09E\xd6V4f\x89\xe0,n-{\x8d\xefY\xde\
+.\xf6\x82\xe2\x98M\xad\x1a\x83K,\x08\x07\x5c\x15\xe4\
+\x07\xc1 dp\x9f\x90Dd\xbe\xe7]\x082G\x7f\
+{\x08.\x1a\x8d\x10gL\xa8\x87%\x8d\xc4l\x84B\
+\xad\xec\x0dNH\xfc^\xbeR\x853B\xa73Q/\
+}\xa5\xdey\xaa\x9c\x13\x1c\xb1$\xbeG)g)\xe1\
+\xe2\x1e\xd1Dl\xea\x1a\xa1\xe1\xe9\x91\xa3\xc0+S\xa5\
+] f\x199\xcf\x85`\xc95\xfdBF\xe8\xa9\x0d\
+=gQ\x0d\xfc\xcc\x06\x16\x8c\xc5U\xf0\xb0\x0b\x9c\x09\
+N\x93)\xba\xc5\xe1\xa7)gy\x12\x8dY\xcc\xf8\x08\
+\xf9\x8fN\x8e\xe5\xcf\xef\x91c<\x22\xbc\x94\x19>\x93\
+?\xdf\xd20-`\xecyl\x01f$\xc5\x1c\x0b\xe6\
+\x82]\xc0\x1d\x0dq|\x89\xf9\x94&\x80\xb5\x99f\xc6\
+8\xfd\x02C\xb5\x86\x0fm\xf0X\xb1\xfa:\xc5!\xf4\
+\x17T\x0f\x15\xb6\xd1'0\xf4\xbc\xac\xfc\xe4H\xd3j\
+0@\x86\xdc(\x95\x9cP/\xaf\xc0\xb3p2\x8d\x89\
+aq\xc1\xe4*y\xca\x02+\xab{\x98]@p\x12\
+B\x8f\xb3@7r\x04M\xe1\xe0K\xe6q\x03\xb56\
+\xce\x18P\x84\x97\xf8fA)\x19\xea\xb1o\x10\xa8,\
+\xe68\xa2yV\xdaM^\x9a\x02\x81\xe9\x5c\x85\x10M\
+D\xa1z\xcd1\xaf\x84T\x02A\xb3\x0f\x13\x1a\xc7E\
+\xbb[\x011\x99\x88b\xb4\x8eZ\x11\x5c\x9a\xb0\x804\
+\x09\xd3*!XZ\xe0\xebllE\xd7\x19\xd3\x10\xa8\
+I\x5c\xb1\xa5\x8e\xab\x8d\xcevvx\x03\x054|\xc1\
+\xf1\x14\x98\x1aA%\xa226\x16[\x16\x97\xae[\xd5\
+P\x844\xc1sb\xc3\xa6\x9cL\x08\xe7$2\x8e\xbb\
+a\xbeV\xe16\xbfh^\xd2O\x22\xe8\xcaEgO\
+\x9c\xa9P\xbd\x0c\xcd|\xc1q\x92i\xac\xefu\xa2\x81\
+\x87\xf9<\xb1\xb4\xb2Z\x7f\xa8|\xe5\x22\xe9m\x83\xbc\
+\xb2\x22\xc6\x0c=+\xeeb\x8e\xa7\xa4\xa7\x01J\x1f\xcb\
+y\x08\xb1\xdf\xff\xcc\xc3\xd1\x80\x13\xfd\x9c\x0d(D\x8b\
+l \x0dySr\x22\xc8\x16S\xbfW\xa3q\xd9\x93\
+\xa3^d\x11\x98z\xa0+o\xbb\x92U\xbbe.Y\
+\x9e\x913\x88\xdf\x16\xablE\x09i\x9c@\x00]\x89\
+\xa8$\x19\x9dH|G!\xc4I/\x0b>\x9c%\xd1\
+\xc73x\xb6K\xcciB\xe7\xf9\xfcC3\x00u\x01\
+?v\x017\xed\xd4b\xa3\xfd:\xb8i\x92q\xefz\
+Z\x82~@O\xd1\x8f\xf5I\x13\xde\x9dt8=[\
+\xeek\xc4J\xe7\xa9U\xdd\xedH\x97e\xb3{<I\
+M\xcey\x06\xe1Z\xc3\xad`A\xee\xc0\x80\xfeX\xe1\
+\xed\xfe$\xbd\xf0\x0d\x96\x16l\xf7O]g\xbf_\xca\
+L\xef\x1dM\xdf\xe9\x9a\x95\x13\x5c\x93\x18\xa2)e\x89\
+]\x92%\xe3\x182p\x02\x1d\xec\x0f&U\x13\x04\x18\
+\xb4/ ]\x8f\xd0\xf3n\xb6\xd4F'\xe4\x84$-\
+\xd2\x13\x1cg\x0e\xe2x\xa2\xdc{w\x05\xe0\xcb\x22O\
+\xdfC\xbcc\xcb S\xf6!\x91\xe4\x00\xa8\xf0C\x87\
+\xe1Zy\x0e\x81\xb1\xee\x0b\x9eK\x80t\x14Y\xed\x89\
+\xc9\xd5\x81pa\xf2\xb5\xc2?\x8c\xc9\xba\xcem\x99\xac\
+kv\xe5rI\x89Q?!\xf7\xc3{G\xe2u\x11\
+\xdf\xcdm\xbe.\xef3\x87\xc1\xfd\xbf\xf0\xbefI'\
+\xe6\x83\x04\x92\x22\x0f$?\xa8\xb9\x81\xa9\x0bo\xcd\xff\
+\xa2\xfeo\x1b\xce\x1fH\xeb\x07\xc7s7\xbf\xb0\xd3\xda\
+h\xff\xaf\x12\x1b\x16l\x97,\xa1\x90\x95\x8f\xd9\xfc\x96\
+\x9d\xb3;\xcb\x80\x02\xb8\xe0\xf8\xbc.\xd4'bxn\
+\xaaB\xc7~o\x1d=T7\xf5\xdb\x89^T^\xe3\
+\xfax\xc6XF\x8a^\xf7\x0ao78Fh\xcb\xf1\
+\x01\xa9\xd5\xee\x097H\x9fE\x11\xc2\xe5\xd2~\xbd\x9d\
+\xb5crn\xb2\xed\xbe\xdc|#\x8f\xdfy\xb1\xbd\xf5\
+\x12vY\xdd\xa7\xb3yH\xb1\xa3\xa4\x1e\xd1\x93b\xb7\
+\xce\xb24\xaf\xee\x00}\x97\x8b NBh\xa2\x09g\
+\xca\x10\xb0\x08\xba\xe5lY\xec\xef\x96/\x1d\x96'n\
+\xab\x22^3&\xaf\xed\xf9u\xc9\x14ll\xec\xed\xd5\
+_\xefm\x89\x05Np\xa5\xec\x82n\xed\xb3\xeeU\xc5\
+z\x0esy\xd5\xd8.A\x5c\xae\xdf\x83\xfa\x86\xb8S\
+$\xdfVNF\xc1bW\xf3\xe4\xb4\x1fZ\xee\x91\x9c\
+z\xfb\x9b\xd8\x17\x98\x83\x81\xa6\x90-T2\xbc_z\
+\xc5\xe8\x04\x1d\xd8f\xd5\xe7\xebe\xd2\xa1C+\xf4v\
+\xbai\xc5\x9fN\xf0\xcdy\xfd\x0e\xdcE\xd7\xa93 \
+\x98Z\xf4\xe3\x95\xd2\xfc\xe1\xf1\x8ez\xef\xedz?\xba\
+\xeb\xb5hQ\x81a/\x9a\x1a\xfb\xf9\xb6\xeb\xaf\xfe\x81\
+^!\x02\x19\x9a\xd3x\x1b\xf2|\xbb\xf1\xdey@w\
+\x15\x5cn7Hu\xe1\xd9\xbf6.E~\xfb\x15G\
+f\xa9*7\x9f\xafb\xc2\xd57\x93\xc7\xbb\x8b\x0b\x96\
+\xbaK\xeb\xa5\x7f\x10\x91\xec\x13\xc8\x9d-0\x8d\xf1m\
+L\xb6t\xa9\x0e-{v\xa7^\x04\xcc\x82\xba%\x19\
+\x9a\xe3{4\xc3\x0b\x82\x22:\x99\x109\xf5\xa2\x88,\
+hHPJ\xefH\x8c ?\xa4,s\x8a\xd5g\x9c\
+\xe3\xfb\x80f\xea\xff@\x0f\xf0\xe1\xd6|\xd0\x1e\xae\xa7\
+_\x18\xa49Not\xd9\x8d`7\xe9\xec>\x93Y\
+A\xa1}\x1f\xc6\x88\xd9t\x0a\x15E\xe46\x9f\x1e\xf8\
+\xd7\x86\xda\xa6A#\x1f\x02\xb3\xa9\xccq\x05Z6\xbd\
+\xec\x92\xbe\xe9ok\xc8\xf2D\x00G\x93\xd7\x0cK\x05\
+z)#\xe7L\xff!\xc2ja\xf4y\x1e\x0fJ\xc8\
+`\x5c\xdc\x05\xf0\xdeAy#\xca\xd0\x88\x1c\xf4\xd8~\
+\xb5\xe3*\xf3\x5c%\xa8}\xd9\xd9\xbb2\x03r\xc8\xcd\
+\xaa9\xef\xf7\x94\x9bue\xc0\xb5\xc4\xdd1\x0f.\x13\
+8\xfb\x07\xb6\x09\x8b\x157\xfa\xb6}\x94\xaa\xe2\x1b\xe4\
+#rJ0\x89|\xf7Ds\xb8E\xa29\xdcc\xa2\
+\xb9=MUz\x0a8\xf6\x1b\x8d\x89>\x11\x14\xb0\x94\
+$\xbb\xd3\xdb\xf0x}\xf6`\xe4\xb4\xb4\xad\xec\x0a\x14\
+\xc7\x13N]\xc0\xc5j\xb4\xba\xae\x9b1`\x0d\x84\xb0\
+_\xe5\x89\x99\xa1\xfc\xf9\xa8yzf\xeb=\x06\xdb\x07\
+P\xfb\x9b\xf5\x93\xbe3\x01`\xc3\x7f\xd5W\xad\xf5\xf1\
+\xa3\x8ds 0c\x96\xcbC\xb8\xdf(\x97\xe9@\x09\
+\x90\x0f\xad\x88\xe2\x80\xc3\x13\xbd\xfa\x1d\xa0\x93\xb6\x8aJ\
+\x94\xd9\x11\xa8\xc2\xaaa\xa2q\x5c\xcak\x8d\x09]\xa0\
+/rgb}\xc0\xa4\xc2\x98]N\x92\xd8X\xe6\xf4\
+\xd9\xb2\xe0][\x9bk\x06h\xec\x84T\xa0\x15\xea\xbd\
+\x851\x906 \xfc\xc0\x7f\xf4\xf4g\xf9\xf3\x1f\xa3\xe3\
+\xe0\xe4Pq\xd1\xbc\xd9\xd0Y?\x88s\xdcU^\xc6\
+\xa6\xe1\x91\xfc\xf9^7\xfd\xba\x8e&8o&\xd9C\
+\xaa\xea}{D5\x9d0\x8c\xdc\xe4\x9b}\x13\xaa\x89\
+\xac\xba\x91\xd7\x12\x1e\xc1\xe0\x9fs*\x0e\x0e\xabNv\
+\x99\xc7\x82\xea\xb3\x93\x15\x13\x14=j=\xe0U\xe7J\
++$\x9ba\x08\xb0\xe7q\x0eCp\x1c\x1c5\xde\xbf\
+LdN\xdb\xfc\xea\xa5\xcb\x8aSy\xb71\xb0\xddo\
+\x14\xfea\xe6\xba\xdf'\x93L\x1erh*~U\x9e\
+\xda\xa9#V\xde\xea\x1f\xbe!M\xab\
 \x00\x00\x02_\
 i\
 mport QtQuick\x0aim\
@@ -2867,67 +2877,67 @@ qt_resource_struct = b"\
 \x00\x00\x00H\x00\x02\x00\x00\x00\x01\x00\x00\x00\x06\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00`\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x95\xf1C\x95i\
-\x00\x00\x02L\x00\x01\x00\x00\x00\x01\x00\x00W\xdc\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd2\
-\x00\x00\x01,\x00\x01\x00\x00\x00\x01\x00\x00\x1f\x05\
-\x00\x00\x01\x95\xf0\xee\x16\xa8\
-\x00\x00\x01\x8c\x00\x01\x00\x00\x00\x01\x00\x00=\xde\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
-\x00\x00\x01f\x00\x01\x00\x00\x00\x01\x00\x00,\xf3\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd2\
-\x00\x00\x01L\x00\x00\x00\x00\x00\x01\x00\x00$\x91\
-\x00\x00\x01\x95\xf0\xee\x16\xa9\
+\x00\x00\x01\xa1Q\xae\x91@\
+\x00\x00\x02L\x00\x01\x00\x00\x00\x01\x00\x00Xm\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01,\x00\x01\x00\x00\x00\x01\x00\x00\x1f\x96\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01\x8c\x00\x01\x00\x00\x00\x01\x00\x00>o\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01f\x00\x01\x00\x00\x00\x01\x00\x00-\x84\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01L\x00\x00\x00\x00\x00\x01\x00\x00%\x22\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
 \x00\x00\x01\xc4\x00\x02\x00\x00\x00\x04\x00\x00\x00\x12\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x19\xa2\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
-\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x00?\xea\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
-\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00Q\x8e\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
-\x00\x00\x02\x22\x00\x01\x00\x00\x00\x01\x00\x00S\x17\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
-\x00\x00\x01\xd8\x00\x01\x00\x00\x00\x01\x00\x00D\x80\
-\x00\x00\x01\x95\xf0\xb5\x14\xfd\
+\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x00\x1a3\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01\xaa\x00\x01\x00\x00\x00\x01\x00\x00@{\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01\xfe\x00\x00\x00\x00\x00\x01\x00\x00R\x1f\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x02\x22\x00\x01\x00\x00\x00\x01\x00\x00S\xa8\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x01\xd8\x00\x01\x00\x00\x00\x01\x00\x00E\x11\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
 \x00\x00\x02\xac\x00\x02\x00\x00\x00\x05\x00\x00\x00\x18\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x02\xd8\x00\x02\x00\x00\x00\x01\x00\x00\x00\x17\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00i?\
-\x00\x00\x01\x95\xf0\xb5\x14\xfe\
+\x00\x00\x02\x90\x00\x00\x00\x00\x00\x01\x00\x00i\xd0\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
 \x00\x00\x02l\x00\x02\x00\x00\x00\x01\x00\x00\x00\x16\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x03\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x8b\xf7\
-\x00\x00\x01\x95\xf0\xb5\x14\xff\
-\x00\x00\x02\xfa\x00\x01\x00\x00\x00\x01\x00\x00p\xad\
-\x00\x00\x01\x95\xf0\xb5\x14\xff\
-\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x00tR\
-\x00\x00\x01\x95\xf0\xb5\x14\xfe\
-\x00\x00\x03|\x00\x01\x00\x00\x00\x01\x00\x00\x7f\xda\
-\x00\x00\x01\x95\xf0\xb5\x14\xfe\
-\x00\x00\x03\xa2\x00\x01\x00\x00\x00\x01\x00\x00\x84\x95\
-\x00\x00\x01\x95\xf0\xb5\x14\xfe\
-\x00\x00\x03\xc2\x00\x01\x00\x00\x00\x01\x00\x00\x87\x8e\
-\x00\x00\x01\x95\xf0\xb5\x14\xff\
-\x00\x00\x03T\x00\x01\x00\x00\x00\x01\x00\x00}\x02\
-\x00\x00\x01\x95\xf0\xb5\x14\xff\
-\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x94\x0e\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x04.\x00\x00\x00\x00\x00\x01\x00\x00\x99\x19\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x04z\x00\x00\x00\x00\x00\x01\x00\x00\xa2\xe0\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x04T\x00\x00\x00\x00\x00\x01\x00\x00\x9c\xde\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x00\xce\x00\x01\x00\x00\x00\x01\x00\x00\x10O\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x17?\
-\x00\x00\x01\x95\xf1\x15\xafG\
-\x00\x00\x00\xa4\x00\x01\x00\x00\x00\x01\x00\x00\x0c\x95\
-\x00\x00\x01\x95\xf0\xb5\x14\xfc\
-\x00\x00\x00\x80\x00\x01\x00\x00\x00\x01\x00\x00\x07T\
-\x00\x00\x01\x95\xf4\xd5\x1a\xd1\
+\x00\x00\x03\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x8c\x88\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x02\xfa\x00\x01\x00\x00\x00\x01\x00\x00q>\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x03\x22\x00\x00\x00\x00\x00\x01\x00\x00t\xe3\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x03|\x00\x01\x00\x00\x00\x01\x00\x00\x80k\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x03\xa2\x00\x01\x00\x00\x00\x01\x00\x00\x85&\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x03\xc2\x00\x01\x00\x00\x00\x01\x00\x00\x88\x1f\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x03T\x00\x01\x00\x00\x00\x01\x00\x00}\x93\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x04\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x94\x9f\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x04.\x00\x00\x00\x00\x00\x01\x00\x00\x99\xaa\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x04z\x00\x00\x00\x00\x00\x01\x00\x00\xa3q\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x04T\x00\x00\x00\x00\x00\x01\x00\x00\x9do\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x00\xce\x00\x01\x00\x00\x00\x01\x00\x00\x10\xb0\
+\x00\x00\x01\xa1Q\xb2G8\
+\x00\x00\x00\xf4\x00\x00\x00\x00\x00\x01\x00\x00\x17\xd0\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x00\xa4\x00\x01\x00\x00\x00\x01\x00\x00\x0c\xf6\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
+\x00\x00\x00\x80\x00\x01\x00\x00\x00\x01\x00\x00\x07\xb5\
+\x00\x00\x01\x95\xf4\xd6\x22\x08\
 "
 
 def qInitResources():
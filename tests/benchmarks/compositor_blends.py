@@ -0,0 +1,95 @@
+"""
+Time the integer compositor blends (the drop shadow baked into the static
+layer, the per-frame composite and the whole border and shadow pass)
+against the same math in float, and report the largest difference.
+
+    PYTHONPATH=. python tests/benchmarks/compositor_blends.py [--number 20]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from screenvivid.models.utils.transforms import BorderShadow
+
+def float_static_layer(border_shadow, background, foreground_size, x_offset, y_offset, shadow_alpha):
+    """Shade the band around the foreground with a float shadow mask"""
+    bg_height, bg_width = background.shape[:2]
+    outer_pad = 2 * border_shadow.shadow_blur
+    x1, y1 = max(0, x_offset - outer_pad), max(0, y_offset - outer_pad)
+    x2 = min(x_offset + foreground_size[0] + outer_pad, bg_width)
+    y2 = min(y_offset + foreground_size[1] + outer_pad, bg_height)
+
+    shadow = shadow_alpha[y1 + outer_pad:y2 + outer_pad, x1 + outer_pad:x2 + outer_pad, np.newaxis] / 255.
+    static_layer = background.copy()
+    static_layer[y1:y2, x1:x2] = np.round((1 - shadow) * background[y1:y2, x1:x2])
+    return static_layer
+
+def float_composite(static_layer, foreground, x_offset, y_offset, foreground_alpha, corner_masks):
+    """Place the foreground and blend its rounded corners through the float mask"""
+    fg_height, fg_width = foreground.shape[:2]
+    output = static_layer.copy()
+    roi = output[y_offset:y_offset + fg_height, x_offset:x_offset + fg_width]
+    roi[:] = foreground
+    static_roi = static_layer[y_offset:y_offset + fg_height, x_offset:x_offset + fg_width]
+    for rows, cols, _, _ in corner_masks:
+        alpha = foreground_alpha[rows, cols, np.newaxis] / 255.
+        roi[rows, cols] = np.round(foreground[rows, cols] * alpha + static_roi[rows, cols] * (1 - alpha))
+    return output
+
+def measure(function, number):
+    return min(timeit.repeat(function, number=number, repeat=3)) / number * 1e3
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20, help="calls per measurement")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"numpy {np.__version__}, 90% foreground, ms per call (integer / float)")
+    for name, (width, height) in (("1080p", (1920, 1080)), ("4K", (3840, 2160))):
+        background = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        fg_width, fg_height = int(width * 0.9), int(height * 0.9)
+        foreground = rng.integers(0, 256, (fg_height, fg_width, 3), dtype=np.uint8)
+        x_offset, y_offset = (width - fg_width) // 2, (height - fg_height) // 2
+        border_shadow = BorderShadow(border_radius=20)
+
+        outer_pad = 2 * border_shadow.shadow_blur
+        shadow_alpha = border_shadow.create_shadow(
+            (width, height), (fg_width, fg_height), x_offset, y_offset, border=outer_pad)
+        foreground_alpha = border_shadow.create_rounded_rectangle(
+            (fg_width, fg_height), (fg_width, fg_height), 0, 0)
+        corner_masks = border_shadow.create_corner_masks(foreground_alpha)
+        static_args = (background, (fg_width, fg_height), x_offset, y_offset, shadow_alpha)
+
+        static_layer = border_shadow.create_static_layer(*static_args)
+        float_layer = float_static_layer(border_shadow, *static_args)
+        output = border_shadow.composite(static_layer, foreground, x_offset, y_offset, corner_masks)
+        float_output = float_composite(float_layer, foreground, x_offset, y_offset, foreground_alpha, corner_masks)
+        error = np.abs(output.astype(np.int16) - float_output).max()
+
+        timings = {
+            "shadow bake": (
+                measure(lambda: border_shadow.create_static_layer(*static_args), args.number),
+                measure(lambda: float_static_layer(border_shadow, *static_args), args.number),
+            ),
+            "composite": (
+                measure(lambda: border_shadow.composite(
+                    static_layer, foreground, x_offset, y_offset, corner_masks), args.number),
+                measure(lambda: float_composite(
+                    float_layer, foreground, x_offset, y_offset, foreground_alpha, corner_masks), args.number),
+            ),
+            "border+shadow": (
+                measure(lambda: border_shadow.apply_border_radius_with_shadow(
+                    background, foreground, x_offset, y_offset), args.number),
+                measure(lambda: float_composite(
+                    float_static_layer(border_shadow, *static_args),
+                    foreground, x_offset, y_offset, foreground_alpha, corner_masks), args.number),
+            ),
+        }
+        print(f"{name} (max difference {error})")
+        for label, (integer_ms, float_ms) in timings.items():
+            print(f"  {label:14} {integer_ms:7.2f} / {float_ms:7.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Time Cursor.blend, the premultiplied uint16 fixed-point blend, against the
+float32 blend it replaced, and report the largest difference between them.
+
+    PYTHONPATH=. python tests/benchmarks/cursor_blend.py [--size 48] [--number 2000]
+"""
+import argparse
+import timeit
+
+import numpy as np
+
+from screenvivid.models.utils.transforms import Cursor
+
+def float_blend(image, cursor_image, x1, y1):
+    """The float32 blend Cursor.blend used before, rounded instead of truncated"""
+    height, width = cursor_image.shape[:2]
+    region = image[y1:y1 + height, x1:x1 + width]
+    alpha = cursor_image[:, :, 3:4].astype(np.float32) / 255.0
+    blended = cursor_image[:, :, :3] * alpha + region * (1 - alpha)
+    region[:] = np.round(blended).astype(np.uint8)
+    return image
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=48, help="cursor sprite size in pixels")
+    parser.add_argument("--number", type=int, default=2000, help="blends per measurement")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (1080, 1920, 3), dtype=np.uint8)
+    sprite = rng.integers(0, 256, (args.size, args.size, 4), dtype=np.uint8)
+    cursor = Cursor({}, {}, {}, sprites={0: {"image": sprite, "offset": (0, 0)}})
+    x, y = 0.5, 0.5
+    x1, y1 = int(frame.shape[1] * x), int(frame.shape[0] * y)
+
+    fixed_point = cursor.blend(frame.copy(), x, y, "arrow", 0, sprite_id=0)
+    reference = float_blend(frame.copy(), sprite, x1, y1)
+    error = np.abs(fixed_point.astype(np.int16) - reference).max()
+
+    image = frame.copy()
+    fixed_seconds = min(timeit.repeat(
+        lambda: cursor.blend(image, x, y, "arrow", 0, sprite_id=0), number=args.number, repeat=5))
+    float_seconds = min(timeit.repeat(
+        lambda: float_blend(image, sprite, x1, y1), number=args.number, repeat=5))
+
+    print(f"{args.size}x{args.size} cursor over 1920x1080, numpy {np.__version__}")
+    print(f"  fixed point: {fixed_seconds / args.number * 1e6:7.1f} us")
+    print(f"  float32:     {float_seconds / args.number * 1e6:7.1f} us")
+    print(f"  max difference: {error}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Time the render pipeline of the editor per frame for several stripe
+counts (VideoProcessor.render_tiles), with and without a zoom.
+
+    PYTHONPATH=. python tests/benchmarks/render_tiles.py [--tiles 1 2 4 8] [--number 50]
+"""
+import argparse
+import os
+import timeit
+
+import cv2
+import numpy as np
+
+from screenvivid.models.utils import transforms
+
+def make_pipeline(screen_size, tiles):
+    return transforms.Compose({
+        "aspect_ratio": transforms.AspectRatio("Auto", screen_size),
+        "padding": transforms.Padding(padding=0.1),
+        "border_shadow": transforms.BorderShadow(border_radius=20),
+        "background": transforms.Background(background={"type": "wallpaper", "value": 1}),
+    }, tiles=tiles)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--width", type=int, default=2560)
+    parser.add_argument("--height", type=int, default=1440)
+    parser.add_argument("--tiles", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    parser.add_argument("--number", type=int, default=50, help="frames per measurement")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    frame = rng.integers(0, 256, (args.height, args.width, 3), dtype=np.uint8)
+    print(f"{args.width}x{args.height} input, {os.cpu_count()} cores, OpenCV {cv2.__version__} "
+          f"with {cv2.getNumThreads()} threads")
+
+    for camera in (None, (0.4, 0.6, 2.0)):
+        for tiles in sorted(set(args.tiles)):
+            pipeline = make_pipeline((args.width, args.height), tiles)
+            # Compile the plan and fill the buffer pool first
+            pipeline(input=frame, camera=camera)
+            seconds = min(timeit.repeat(lambda: pipeline(input=frame, camera=camera), number=args.number, repeat=3))
+            zoom = "zoomed" if camera else "unzoomed"
+            print(f"  {zoom:8} tiles={tiles:<3} {seconds / args.number * 1e3:7.2f} ms/frame")
+
+if __name__ == "__main__":
+    main()
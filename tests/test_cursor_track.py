@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from screenvivid.models.utils.cursor_track import CursorTrack
+
+def make_moves(samples, state="arrow"):
+    """Move events as the recorder stores them, from ``{frame: (x, y)}``"""
+    return {frame: (x, y, frame, state, 0, None) for frame, (x, y) in samples.items()}
+
+def test_interpolates_between_samples():
+    moves = make_moves({0: (0.0, 0.2), 10: (1.0, 0.4)})
+    moves[10] = (1.0, 0.4, 10, "hand", 3, 7)
+    track = CursorTrack(moves)
+
+    x, y, cursor_state, anim_step, sprite_id = track.get(5)
+    assert x == pytest.approx(0.5)
+    assert y == pytest.approx(0.3)
+    # Discrete fields hold the last sample
+    assert (cursor_state, anim_step, sprite_id) == ("arrow", 0, None)
+    assert track.get(10)[2:] == ("hand", 3, 7)
+
+def test_reads_json_metadata_keys():
+    moves = {str(frame): event for frame, event in make_moves({0: (0.0, 0.0), 4: (0.4, 0.8)}).items()}
+    track = CursorTrack(moves)
+
+    assert track.get(2)[:2] == pytest.approx((0.2, 0.4))
+
+def test_gaps_longer_than_max_gap_stay_empty():
+    track = CursorTrack(make_moves({0: (0.0, 0.0), 31: (1.0, 1.0), 72: (0.5, 0.5)}), max_gap=30)
+
+    # 30 missing frames are interpolated, 40 are not
+    assert all(track.get(frame) is not None for frame in range(0, 32))
+    assert all(track.get(frame) is None for frame in range(32, 72))
+    assert track.get(72)[:2] == pytest.approx((0.5, 0.5))
+    assert track.get(-1) is None
+    assert track.get(73) is None
+
+def test_total_frames_bounds_the_track():
+    track = CursorTrack(make_moves({0: (0.0, 0.0), 8: (0.8, 0.8), 20: (1.0, 1.0)}), total_frames=10)
+
+    assert len(track) == 10
+    assert track.get(4)[0] == pytest.approx(0.4)
+    assert track.get(10) is None
+
+def test_spline_passes_through_samples():
+    rng = np.random.default_rng(0)
+    frames = [0, 3, 8, 12, 20, 21, 30]
+    samples = {frame: tuple(rng.random(2)) for frame in frames}
+    track = CursorTrack(make_moves(samples), smoothing="spline")
+
+    for frame, (x, y) in samples.items():
+        assert track.get(frame)[:2] == pytest.approx((x, y), abs=1e-6)
+
+def test_exponential_matches_recursive_average():
+    rng = np.random.default_rng(1)
+    samples = {frame: tuple(rng.random(2)) for frame in range(0, 60, 3)}
+    factor = 0.5
+    track = CursorTrack(make_moves(samples), smoothing="exponential", smoothing_factor=factor)
+
+    # The same average computed frame by frame over the interpolated path
+    linear = CursorTrack(make_moves(samples))
+    average = linear.x[0]
+    for frame in range(len(linear)):
+        average = factor * linear.x[frame] + (1 - factor) * average
+        if frame in samples:
+            assert track.get(frame)[0] == pytest.approx(average, abs=2e-3)
+
+def test_rejects_unknown_smoothing():
+    with pytest.raises(ValueError):
+        CursorTrack({}, smoothing="bezier")
@@ -0,0 +1,174 @@
+import os
+import shutil
+import subprocess
+import time
+
+import numpy as np
+import pytest
+
+from screenvivid.models import screen_capture
+from screenvivid.models.screen_capture import (
+    BaseScreenCapture, DamageAwareScreenCapture, MSSScreenCapture, X11GrabScreenCapture, XDamageTracker,
+    get_screen_capture_class
+)
+from screenvivid.utils.general import get_ffmpeg_path
+
+FFMPEG = get_ffmpeg_path()
+
+SCREEN_WIDTH, SCREEN_HEIGHT = 320, 240
+REGION = [16, 16, 64, 48]
+
+class FrameListCapture(BaseScreenCapture):
+    """Return the given frames one after another"""
+    def __init__(self, frames):
+        super().__init__(REGION)
+        self._frames = iter(frames)
+
+    def capture(self):
+        return next(self._frames), "yuv420p"
+
+@pytest.fixture
+def xvfb(monkeypatch):
+    """Start a private Xvfb server with a black root window and point DISPLAY at it"""
+    if shutil.which("Xvfb") is None:
+        pytest.skip("Xvfb is not installed")
+
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen(
+        ["Xvfb", "-displayfd", str(write_fd), "-screen", "0", f"{SCREEN_WIDTH}x{SCREEN_HEIGHT}x24", "-br", "-nolisten", "tcp"],
+        pass_fds=(write_fd,),
+        stderr=subprocess.DEVNULL,
+    )
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        display = f.readline().strip()
+    if not display:
+        process.kill()
+        pytest.skip("Xvfb failed to start")
+
+    monkeypatch.setenv("DISPLAY", f":{display}")
+    yield f":{display}"
+    process.terminate()
+    process.wait()
+
+def map_white_window(connection, x, y, width, height):
+    screen = connection.screen()
+    window = screen.root.create_window(
+        x, y, width, height, 0, screen.root_depth,
+        background_pixel=screen.white_pixel, override_redirect=True
+    )
+    window.map()
+    connection.sync()
+    return window
+
+def wait_for_damage(tracker, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if tracker.has_damage():
+            return True
+        time.sleep(0.02)
+    return False
+
+def test_x11grab_is_ffmpeg_native(monkeypatch):
+    monkeypatch.setattr(screen_capture, "get_os_name", lambda: "linux")
+    capture_class = get_screen_capture_class(backend="x11grab")
+
+    assert capture_class is X11GrabScreenCapture
+    assert capture_class.is_ffmpeg_native
+    assert not hasattr(capture_class, "capture")
+    # Frame grabbing callers never get the FFmpeg native backend
+    assert not get_screen_capture_class().is_ffmpeg_native
+
+def test_x11grab_input_args(monkeypatch):
+    monkeypatch.setenv("DISPLAY", ":7")
+    args = X11GrabScreenCapture([10, 20, 101, 75]).ffmpeg_input_args(30)
+
+    assert args == [
+        "-f", "x11grab", "-framerate", "30", "-video_size", "100x74", "-draw_mouse", "0", "-i", ":7+10,20"
+    ]
+
+def test_repeats_identical_frames():
+    frames = [b"a" * 8, b"a" * 8, b"b" * 8, b"b" * 8, b"a" * 8]
+    capture = DamageAwareScreenCapture(FrameListCapture(frames))
+
+    grabbed = [capture.capture()[0] for _ in frames]
+    assert grabbed == [b"a" * 8, None, b"b" * 8, None, b"a" * 8]
+    assert capture.repeated_frames == 2
+
+def test_x11grab_grabs_the_region(xvfb):
+    if shutil.which(FFMPEG) is None:
+        pytest.skip("FFmpeg is not installed")
+    devices = subprocess.run([FFMPEG, "-hide_banner", "-devices"], capture_output=True, text=True).stdout
+    if "x11grab" not in devices:
+        pytest.skip("FFmpeg is built without x11grab")
+    xlib_display = pytest.importorskip("Xlib.display")
+
+    # A white window covering the right half of the region, the rest is the black root
+    connection = xlib_display.Display()
+    left, top, width, height = REGION
+    map_white_window(connection, left + width // 2, top, width // 2, height)
+
+    fps, n_frames = 10, 5
+    cmd = [
+        FFMPEG, "-loglevel", "error",
+        *X11GrabScreenCapture(REGION).ffmpeg_input_args(fps),
+        "-frames:v", str(n_frames), "-f", "rawvideo", "-pix_fmt", "gray", "-",
+    ]
+    started = time.time()
+    frames = subprocess.run(cmd, capture_output=True, check=True, timeout=10).stdout
+    elapsed = time.time() - started
+    connection.close()
+
+    frames = np.frombuffer(frames, dtype=np.uint8).reshape(n_frames, height, width)
+    assert frames[:, :, : width // 2].max() <= 16
+    assert frames[:, :, width // 2:].min() >= 239
+    # x11grab paces the grab itself, the frames take about their duration
+    assert elapsed >= (n_frames - 1) / fps * 0.8
+
+def test_xdamage_reports_changes_in_the_region(xvfb):
+    xlib_display = pytest.importorskip("Xlib.display")
+    left, top, width, height = REGION
+    tracker = XDamageTracker({"left": left, "top": top, "width": width, "height": height})
+    connection = xlib_display.Display()
+    try:
+        tracker.has_damage()
+
+        # Damage outside the region is drained without being reported
+        map_white_window(connection, 200, 150, 40, 40)
+        time.sleep(0.2)
+        assert not tracker.has_damage()
+
+        map_white_window(connection, left + 8, top + 8, 16, 16)
+        assert wait_for_damage(tracker)
+        assert not tracker.has_damage()
+    finally:
+        connection.close()
+        tracker.close()
+
+def test_damage_aware_capture_skips_untouched_grabs(xvfb):
+    pytest.importorskip("mss")
+    xlib_display = pytest.importorskip("Xlib.display")
+
+    left, top, width, height = REGION
+    capture = DamageAwareScreenCapture(MSSScreenCapture(REGION))
+    connection = xlib_display.Display()
+    try:
+        assert capture._damage_tracker is not None
+        first, pixel_format = capture.capture()
+        assert len(first) == width * height * 3 // 2
+        assert pixel_format == "yuv420p"
+
+        # No damage: the grab is skipped and the frame is a repeat
+        assert capture.capture() == (None, "yuv420p")
+
+        map_white_window(connection, left, top, width, height)
+        deadline = time.time() + 2.0
+        frame = None
+        while frame is None and time.time() < deadline:
+            frame, _ = capture.capture()
+            time.sleep(0.02)
+        assert frame is not None and frame != first
+        assert capture.repeated_frames >= 1
+    finally:
+        connection.close()
+        capture.cleanup()
@@ -0,0 +1,134 @@
+import os
+import shutil
+import subprocess
+
+import cv2
+import numpy as np
+import pytest
+
+from screenvivid.models.utils.matroska import MatroskaFrameStream
+from screenvivid.models.utils.segments import SegmentedVideoCapture
+from screenvivid.utils.general import get_ffmpeg_path
+
+FFMPEG = get_ffmpeg_path()
+
+WIDTH, HEIGHT, FPS, SEGMENT_DURATION = 64, 48, 30, 2
+N_FRAMES = 150
+CHANGED_FRAMES = [*range(10), 30, 75, 76, 140]
+
+def make_frame(frame_index):
+    """A flat yuv420p frame whose brightness tells the frame index apart"""
+    frame = np.full((HEIGHT * 3 // 2, WIDTH), 128, dtype=np.uint8)
+    frame[:HEIGHT] = 20 + frame_index
+    return frame
+
+def expected_frame(frame_index):
+    """The frame shown at an index: the last one that changed"""
+    changed = max(index for index in CHANGED_FRAMES if index <= frame_index)
+    return cv2.cvtColor(make_frame(changed), cv2.COLOR_YUV2BGR_I420)
+
+def get_segment_args(segments_dir, segment_format):
+    return [
+        "-force_key_frames", f"expr:gte(t,n_forced*{SEGMENT_DURATION})",
+        "-f", "segment",
+        "-segment_time", str(SEGMENT_DURATION),
+        "-segment_format", segment_format,
+        "-reset_timestamps", "1",
+        "-segment_list", os.path.join(segments_dir, "manifest.ffconcat"),
+        "-segment_list_type", "ffconcat",
+        "-y", os.path.join(segments_dir, f"segment_%05d.{'mkv' if segment_format == 'matroska' else 'mp4'}"),
+    ]
+
+def record_variable_frame_rate(segments_dir, codec_args):
+    """Pipe the changed frames with their timestamps, the way ScreenRecordingThread does"""
+    cmd = [
+        FFMPEG, "-loglevel", "error",
+        "-f", "matroska", "-i", "-",
+        *codec_args,
+        "-vsync", "passthrough", "-bf", "0",
+        *get_segment_args(segments_dir, "matroska"),
+    ]
+    stream = MatroskaFrameStream(WIDTH, HEIGHT, FPS, "yuv420p")
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+    process.stdin.write(stream.header())
+    held = None
+    for frame_index in range(N_FRAMES):
+        if frame_index in CHANGED_FRAMES:
+            held = make_frame(frame_index)
+        elif not stream.is_segment_edge(frame_index, SEGMENT_DURATION) and frame_index < N_FRAMES - 1:
+            continue
+        process.stdin.write(stream.frame_header(frame_index, held.nbytes))
+        process.stdin.write(held.tobytes())
+    process.stdin.close()
+    assert process.wait() == 0
+    return os.path.join(segments_dir, "manifest.ffconcat")
+
+@pytest.fixture(params=[
+    ["-c:v", "libx264", "-preset", "ultrafast", "-crf", "23"],
+    ["-c:v", "libx264", "-preset", "fast", "-qp", "23"],
+    ["-c:v", "ffv1", "-level", "3", "-g", "1", "-slices", "4"],
+], ids=["ultrafast", "fast", "ffv1"])
+def manifest_path(request, tmp_path):
+    if shutil.which(FFMPEG) is None:
+        pytest.skip("FFmpeg is not installed")
+    return record_variable_frame_rate(str(tmp_path), request.param)
+
+def test_segment_edges_follow_the_segment_duration():
+    stream = MatroskaFrameStream(WIDTH, HEIGHT, FPS, "yuv420p")
+    edges = [index for index in range(N_FRAMES) if stream.is_segment_edge(index, SEGMENT_DURATION)]
+
+    assert edges == [0, 59, 60, 119, 120]
+
+def test_reads_one_frame_per_frame_index(manifest_path):
+    capture = SegmentedVideoCapture(manifest_path)
+
+    assert capture.get(cv2.CAP_PROP_FRAME_COUNT) == N_FRAMES
+    for frame_index in range(N_FRAMES):
+        ret, frame = capture.read()
+        assert ret
+        assert np.abs(frame.astype(np.int16) - expected_frame(frame_index)).max() <= 3, frame_index
+    assert capture.read() == (False, None)
+    capture.release()
+
+def test_seeks_to_held_frames(manifest_path):
+    capture = SegmentedVideoCapture(manifest_path)
+
+    for frame_index in (100, 45, 5, 149, 60, 31):
+        capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        ret, frame = capture.read()
+        assert ret
+        assert np.abs(frame.astype(np.int16) - expected_frame(frame_index)).max() <= 3, frame_index
+        assert capture.get(cv2.CAP_PROP_POS_FRAMES) == frame_index + 1
+    capture.release()
+
+def test_reads_constant_frame_rate_segments(tmp_path):
+    if shutil.which(FFMPEG) is None:
+        pytest.skip("FFmpeg is not installed")
+    cmd = [
+        FFMPEG, "-loglevel", "error",
+        "-f", "rawvideo", "-framerate", str(FPS), "-video_size", f"{WIDTH}x{HEIGHT}", "-pixel_format", "yuv420p",
+        "-i", "-",
+        "-c:v", "libx264", "-preset", "ultrafast", "-crf", "23", "-vsync", "1",
+        *get_segment_args(str(tmp_path), "mp4"),
+    ]
+    frames = b"".join(make_frame(frame_index).tobytes() for frame_index in range(N_FRAMES))
+    subprocess.run(cmd, input=frames, check=True)
+    capture = SegmentedVideoCapture(os.path.join(tmp_path, "manifest.ffconcat"))
+
+    assert capture.get(cv2.CAP_PROP_FRAME_COUNT) == N_FRAMES
+    for frame_index in (0, 1, 59, 60, 61, 149, 100, 30):
+        capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+        _, frame = capture.read()
+        expected = cv2.cvtColor(make_frame(frame_index), cv2.COLOR_YUV2BGR_I420)
+        assert np.abs(frame.astype(np.int16) - expected).max() <= 3, frame_index
+    capture.release()
+
+def test_held_frames_are_copies(manifest_path):
+    capture = SegmentedVideoCapture(manifest_path)
+    capture.set(cv2.CAP_PROP_POS_FRAMES, 30)
+
+    _, frame = capture.read()
+    frame[:] = 0
+    _, next_frame = capture.read()
+    assert np.abs(next_frame.astype(np.int16) - expected_frame(31)).max() <= 3
+    capture.release()
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from screenvivid.models.utils.transforms import Cursor, BorderShadow, blend_alpha, divide_by_255
+
+@pytest.fixture
+def sprite():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, (24, 24, 4), dtype=np.uint8)
+
+def make_cursor(sprite):
+    return Cursor({}, {}, {}, sprites={0: {"image": sprite, "offset": (0, 0)}})
+
+def test_cursor_blend_matches_float(sprite):
+    rng = np.random.default_rng(1)
+    frame = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+
+    blended = make_cursor(sprite).blend(frame.copy(), 0.25, 0.25, "arrow", 0, sprite_id=0)
+
+    alpha = sprite[:, :, 3:4] / 255.0
+    expected = frame.astype(np.float64)
+    expected[16:40, 16:40] = sprite[:, :, :3] * alpha + frame[16:40, 16:40] * (1 - alpha)
+    assert np.abs(blended - np.round(expected)).max() <= 1
+
+def test_cursor_scratch_is_per_thread(sprite):
+    cursor = make_cursor(sprite)
+    scratch, shift = cursor._get_scratch(24, 24)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        other_scratch, other_shift = executor.submit(cursor._get_scratch, 24, 24).result()
+
+    assert not np.shares_memory(scratch, other_scratch)
+    assert not np.shares_memory(shift, other_shift)
+    # The same thread reuses its buffers
+    assert np.shares_memory(cursor._get_scratch(16, 16)[0], scratch)
+
+def test_subpixel_cursor_covers_fractional_pixels():
+    sprite = np.full((8, 8, 4), 255, dtype=np.uint8)
+    frame = np.zeros((64, 64, 3), dtype=np.uint8)
+    cursor = Cursor({}, {}, {}, sprites={0: {"image": sprite, "offset": (0, 0)}}, subpixel=True)
+
+    # Half a pixel right of column 16, on row 16
+    blended = cursor.blend(frame.copy(), 16.5 / 64, 16 / 64, "arrow", 0, sprite_id=0)
+
+    expected = np.zeros((64, 64), dtype=np.float64)
+    expected[16:24, 16] = expected[16:24, 24] = 127.5
+    expected[16:24, 17:24] = 255
+    assert np.abs(blended[:, :, 0] - expected).max() <= 1
+    # On whole pixels it lands where the rounded placement does
+    whole = cursor.blend(frame.copy(), 16 / 64, 16 / 64, "arrow", 0, sprite_id=0)
+    assert np.array_equal(whole, make_cursor(sprite).blend(frame.copy(), 16 / 64, 16 / 64, "arrow", 0, sprite_id=0))
+
+def test_divide_by_255_rounds_exactly():
+    values = np.arange(255 * 255 + 1, dtype=np.uint16)
+    expected = np.round(values / 255)
+
+    assert np.array_equal(divide_by_255(values.copy()), expected)
+    assert np.array_equal(divide_by_255(values.copy(), np.empty_like(values)), expected)
+
+def test_blend_alpha_matches_float():
+    rng = np.random.default_rng(2)
+    foreground = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    background = rng.integers(0, 256, (64, 64, 3), dtype=np.uint8)
+    alpha = rng.integers(0, 256, (64, 64, 3)).astype(np.uint16)
+
+    blended = blend_alpha(foreground, background, alpha, 255 - alpha)
+
+    expected = (foreground * alpha + background * (255 - alpha)) / 255
+    assert np.abs(blended - np.round(expected)).max() <= 1
+
+@pytest.mark.parametrize("border_radius", [0, 20, 60])
+def test_border_shadow_matches_float(border_radius):
+    rng = np.random.default_rng(3)
+    background = rng.integers(0, 256, (360, 640, 3), dtype=np.uint8)
+    foreground = rng.integers(0, 256, (288, 512, 3), dtype=np.uint8)
+    x_offset, y_offset = 64, 36
+    border_shadow = BorderShadow(border_radius=border_radius)
+
+    output = border_shadow.apply_border_radius_with_shadow(background, foreground, x_offset, y_offset)
+
+    # Shade the background within 2 * shadow_blur of the foreground, then
+    # blend the foreground through its rounded mask
+    outer_pad = 2 * border_shadow.shadow_blur
+    shadow = border_shadow.create_shadow((640, 360), (512, 288), x_offset, y_offset, border=outer_pad)
+    shadow = shadow[outer_pad:-outer_pad, outer_pad:-outer_pad, np.newaxis] / 255
+    band = (slice(y_offset - outer_pad, y_offset + 288 + outer_pad),
+            slice(x_offset - outer_pad, x_offset + 512 + outer_pad))
+    expected = background.astype(np.float64)
+    expected[band] = np.round(background[band] * (1 - shadow[band]))
+    alpha = border_shadow.create_rounded_rectangle((512, 288), (512, 288), 0, 0)[:, :, np.newaxis] / 255
+    roi = (slice(y_offset, y_offset + 288), slice(x_offset, x_offset + 512))
+    expected[roi] = foreground * alpha + expected[roi] * (1 - alpha)
+    assert np.abs(output - np.round(expected)).max() <= 1